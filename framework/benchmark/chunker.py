@@ -0,0 +1,71 @@
+# Copyright 2024 Superlinked, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Chunking time of single documents of growing size and of a column of documents.
+A linear chunker keeps the throughput (MB/s) roughly constant as the documents grow.
+
+    python chunker.py --sizes-kb 1 10 100 1000 5000 --chunk-size 250 --chunk-overlap 20
+"""
+
+import argparse
+import random
+import time
+
+from superlinked.framework.common.util.chunking_util import Chunker
+
+WORDS = ["vector", "search", "index", "space", "embedding", "query", "schema", "source", "weight", "model"]
+SENTENCE_ENDS = [".", ".", ".", "!", "?"]
+
+
+def generate_document(size: int, rng: random.Random) -> str:
+    parts: list[str] = []
+    length = 0
+    while length < size:
+        sentence = " ".join(rng.choice(WORDS) for _ in range(rng.randint(4, 25))).capitalize()
+        sentence += rng.choice(SENTENCE_ENDS) + ("\n" if rng.random() < 0.1 else " ")
+        parts.append(sentence)
+        length += len(sentence)
+    return "".join(parts)[:size]
+
+
+def measure(chunker: Chunker, texts: list[str], chunk_size: int, chunk_overlap: int) -> tuple[float, int]:
+    start = time.perf_counter()
+    chunks_list = chunker.chunk_texts(texts, chunk_size, chunk_overlap)
+    return time.perf_counter() - start, sum(len(chunks) for chunks in chunks_list)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes-kb", type=int, nargs="+", default=[1, 10, 100, 1000, 5000])
+    parser.add_argument("--chunk-size", type=int, default=250)
+    parser.add_argument("--chunk-overlap", type=int, default=20)
+    parser.add_argument("--column-size", type=int, default=1000, help="The number of 1 KB documents in the column.")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    chunker = Chunker()
+    print(f"{'document KB':>12} {'chunks':>8} {'ms':>10} {'MB/s':>8}")
+    for size_kb in args.sizes_kb:
+        document = generate_document(size_kb * 1024, rng)
+        elapsed, chunk_count = measure(chunker, [document], args.chunk_size, args.chunk_overlap)
+        print(f"{size_kb:>12} {chunk_count:>8} {1000 * elapsed:>10.1f} {len(document) / elapsed / 2**20:>8.2f}")
+
+    column = [generate_document(1024, rng) for _ in range(args.column_size)]
+    elapsed, chunk_count = measure(chunker, column, args.chunk_size, args.chunk_overlap)
+    print(f"column of {args.column_size} x 1 KB documents: {chunk_count} chunks in {1000 * elapsed:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
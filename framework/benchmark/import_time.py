@@ -0,0 +1,74 @@
+# Copyright 2024 Superlinked, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Cold import time of superlinked.framework, measured in fresh interpreters.
+Fails when the median exceeds the budget or when a heavy backend gets imported eagerly.
+
+    python import_time.py --runs 5 --budget-seconds 3
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+MODULE = "superlinked.framework"
+HEAVY_MODULES = ["torch", "sentence_transformers", "open_clip", "transformers", "openai", "instructor"]
+
+MEASURE_SCRIPT = """
+import sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(elapsed)
+print(",".join(name for name in {heavy_modules!r} if name in sys.modules))
+"""
+
+
+def measure(module: str) -> tuple[float, list[str]]:
+    output = subprocess.run(
+        [sys.executable, "-c", MEASURE_SCRIPT.format(module=module, heavy_modules=HEAVY_MODULES)],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.splitlines()
+    return float(output[-2]), [name for name in output[-1].split(",") if name]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--module", default=MODULE)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget-seconds", type=float, default=None)
+    args = parser.parse_args()
+
+    measurements = [measure(args.module) for _ in range(args.runs)]
+    seconds = [elapsed for elapsed, _ in measurements]
+    loaded_heavy_modules = sorted({name for _, names in measurements for name in names})
+    median = statistics.median(seconds)
+    print(f"import {args.module}: median {median:.3f}s, min {min(seconds):.3f}s, max {max(seconds):.3f}s")
+    print(f"heavy modules imported eagerly: {', '.join(loaded_heavy_modules) or 'none'}")
+
+    failures = []
+    if args.budget_seconds is not None and median > args.budget_seconds:
+        failures.append(f"median import time {median:.3f}s exceeds the budget of {args.budget_seconds:.3f}s")
+    if loaded_heavy_modules:
+        failures.append(f"heavy modules must be imported lazily: {', '.join(loaded_heavy_modules)}")
+    if failures:
+        sys.exit("\n".join(failures))
+
+
+if __name__ == "__main__":
+    main()
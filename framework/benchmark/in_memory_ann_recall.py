@@ -0,0 +1,139 @@
+# Copyright 2024 Superlinked, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Recall and latency of the in-memory IVF_FLAT search compared to the exact FLAT search.
+
+    python in_memory_ann_recall.py --rows 200000 --dimension 256 --probe-counts 1 4 16
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from superlinked.framework.common.calculation.distance_metric import DistanceMetric
+from superlinked.framework.common.data_types import Vector
+from superlinked.framework.common.storage.entity.entity_data import EntityData
+from superlinked.framework.common.storage.entity.entity_id import EntityId
+from superlinked.framework.common.storage.field.field_data import (
+    StringFieldData,
+    VectorFieldData,
+)
+from superlinked.framework.common.storage.field.field_data_type import FieldDataType
+from superlinked.framework.common.storage.index_config import IndexConfig
+from superlinked.framework.common.storage.query.vdb_knn_search_params import (
+    VDBKNNSearchParams,
+)
+from superlinked.framework.common.storage.search_index.index_field_descriptor import (
+    IndexFieldDescriptor,
+    VectorIndexFieldDescriptor,
+)
+from superlinked.framework.common.storage.search_index.search_algorithm import (
+    SearchAlgorithm,
+)
+from superlinked.framework.common.storage.vdb_connector import VDBConnector
+from superlinked.framework.storage.common.vdb_settings import VDBSettings
+from superlinked.framework.storage.in_memory.in_memory_vdb import InMemoryVDB
+from superlinked.framework.storage.in_memory.ivf_params import IVFParams
+
+VECTOR_FIELD = "vector"
+CATEGORY_FIELD = "category"
+CATEGORY_COUNT = 10
+
+
+def generate_vectors(rows: int, dimension: int, rng: np.random.Generator) -> np.ndarray:
+    centers = rng.normal(size=(max(rows // 1000, 1), dimension))
+    vectors = centers[rng.integers(0, centers.shape[0], rows)] + 0.5 * rng.normal(size=(rows, dimension))
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def create_vdb(search_algorithm: SearchAlgorithm, dimension: int, ivf_params: IVFParams) -> InMemoryVDB:
+    vdb = InMemoryVDB(VDBSettings(-1), search_algorithm, ivf_params)
+    vector_descriptor = VectorIndexFieldDescriptor(
+        VECTOR_FIELD, dimension, DistanceMetric.INNER_PRODUCT, search_algorithm, vdb.vector_coordinate_type
+    )
+    index_config = IndexConfig("index", vector_descriptor, [IndexFieldDescriptor(FieldDataType.STRING, CATEGORY_FIELD)])
+    vdb.init_search_index_configs([index_config], create_search_indices=True)
+    return vdb
+
+
+def write(vdb: VDBConnector, vectors: np.ndarray) -> float:
+    start = time.perf_counter()
+    vdb.write_entities(
+        [
+            EntityData(
+                EntityId("schema", str(i)),
+                {
+                    VECTOR_FIELD: VectorFieldData(VECTOR_FIELD, Vector(vector)),
+                    CATEGORY_FIELD: StringFieldData(CATEGORY_FIELD, str(i % CATEGORY_COUNT)),
+                },
+            )
+            for i, vector in enumerate(vectors)
+        ]
+    )
+    return time.perf_counter() - start
+
+
+def search(vdb: VDBConnector, queries: np.ndarray, limit: int, filtered: bool) -> tuple[list[set[str]], float]:
+    results = []
+    start = time.perf_counter()
+    for i, query in enumerate(queries):
+        filters = [StringFieldData(CATEGORY_FIELD, "") == str(i % CATEGORY_COUNT)] if filtered else None
+        params = VDBKNNSearchParams(VectorFieldData(VECTOR_FIELD, Vector(query)), limit, filters, None)
+        results.append({result.id_.object_id for result in vdb.knn_search("index", "schema", [], params)})
+    return results, 1000 * (time.perf_counter() - start) / len(queries)
+
+
+def calculate_recall(results: list[set[str]], expected_results: list[set[str]]) -> float:
+    recalls = [len(result & expected) / len(expected) for result, expected in zip(results, expected_results)]
+    return float(np.mean(recalls))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--dimension", type=int, default=128)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--list-count", type=int, default=None)
+    parser.add_argument("--probe-counts", type=int, nargs="+", default=[1, 2, 4, 8, 16, 32])
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    vectors = generate_vectors(args.rows, args.dimension, rng)
+    queries = generate_vectors(args.queries, args.dimension, rng)
+
+    exact_vdb = create_vdb(SearchAlgorithm.FLAT, args.dimension, IVFParams())
+    print(f"FLAT write: {write(exact_vdb, vectors):.2f}s")
+    ivf_vdb = create_vdb(SearchAlgorithm.IVF_FLAT, args.dimension, IVFParams())
+    print(f"IVF_FLAT write: {write(ivf_vdb, vectors):.2f}s")
+    _, training_latency = search(ivf_vdb, queries[:1], args.limit, False)
+    print(f"IVF_FLAT first search (incl. training): {training_latency / 1000:.2f}s")
+    exact = {filtered: search(exact_vdb, queries, args.limit, filtered) for filtered in [False, True]}
+
+    print(f"{'probes':>8} {'filtered':>9} {'recall@' + str(args.limit):>10} {'ms/query':>9} {'exact ms/query':>15}")
+    for probe_count in args.probe_counts:
+        ivf_params = IVFParams(list_count=args.list_count, probe_count=probe_count, exact_search_threshold=0)
+        ivf_vdb = create_vdb(SearchAlgorithm.IVF_FLAT, args.dimension, ivf_params)
+        write(ivf_vdb, vectors)
+        search(ivf_vdb, queries[:1], args.limit, False)  # trains the clusters
+        for filtered, (exact_results, exact_latency) in exact.items():
+            results, latency = search(ivf_vdb, queries, args.limit, filtered)
+            recall = calculate_recall(results, exact_results)
+            print(f"{probe_count:>8} {str(filtered):>9} {recall:>10.3f} {latency:>9.2f} {exact_latency:>15.2f}")
+
+
+if __name__ == "__main__":
+    main()
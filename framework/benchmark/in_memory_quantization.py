@@ -0,0 +1,128 @@
+# Copyright 2024 Superlinked, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Memory, recall and latency of the quantized in-memory search compared to the unquantized one.
+
+    python in_memory_quantization.py --rows 200000 --dimension 256 --rescoring-factors 0 1 4
+"""
+
+import argparse
+import time
+import tracemalloc
+
+import numpy as np
+
+from superlinked.framework.common.calculation.distance_metric import DistanceMetric
+from superlinked.framework.common.data_types import Vector
+from superlinked.framework.common.storage.entity.entity_data import EntityData
+from superlinked.framework.common.storage.entity.entity_id import EntityId
+from superlinked.framework.common.storage.field.field_data import VectorFieldData
+from superlinked.framework.common.storage.index_config import IndexConfig
+from superlinked.framework.common.storage.query.vdb_knn_search_params import (
+    VDBKNNSearchParams,
+)
+from superlinked.framework.common.storage.search_index.index_field_descriptor import (
+    VectorIndexFieldDescriptor,
+)
+from superlinked.framework.common.storage.search_index.search_algorithm import (
+    SearchAlgorithm,
+)
+from superlinked.framework.storage.common.vdb_settings import VDBSettings
+from superlinked.framework.storage.in_memory.in_memory_vdb import InMemoryVDB
+from superlinked.framework.storage.in_memory.quantization_params import (
+    QuantizationParams,
+)
+from superlinked.framework.storage.in_memory.vector_quantization import (
+    VectorQuantization,
+)
+
+VECTOR_FIELD = "vector"
+
+
+def generate_vectors(rows: int, dimension: int, rng: np.random.Generator) -> np.ndarray:
+    centers = rng.normal(size=(max(rows // 1000, 1), dimension))
+    vectors = centers[rng.integers(0, centers.shape[0], rows)] + 0.5 * rng.normal(size=(rows, dimension))
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def create_vdb(
+    dimension: int, quantization_params: QuantizationParams, vectors: np.ndarray
+) -> tuple[InMemoryVDB, float]:
+    """
+    Returns the vdb and the MB it keeps allocated after writing the vectors, row store and search matrix together.
+    """
+    tracemalloc.start()
+    vdb = InMemoryVDB(VDBSettings(-1), quantization_params=quantization_params)
+    vector_descriptor = VectorIndexFieldDescriptor(
+        VECTOR_FIELD, dimension, DistanceMetric.INNER_PRODUCT, SearchAlgorithm.FLAT, vdb.vector_coordinate_type
+    )
+    vdb.init_search_index_configs([IndexConfig("index", vector_descriptor, [])], create_search_indices=True)
+    vdb.write_entities(
+        [
+            EntityData(EntityId("schema", str(i)), {VECTOR_FIELD: VectorFieldData(VECTOR_FIELD, Vector(vector.copy()))})
+            for i, vector in enumerate(vectors)
+        ]
+    )
+    memory_mb = tracemalloc.get_traced_memory()[0] / 2**20
+    tracemalloc.stop()
+    return vdb, memory_mb
+
+
+def search(vdb: InMemoryVDB, queries: np.ndarray, limit: int) -> tuple[list[set[str]], float]:
+    results = []
+    start = time.perf_counter()
+    for query in queries:
+        params = VDBKNNSearchParams(VectorFieldData(VECTOR_FIELD, Vector(query)), limit, None, None)
+        results.append({result.id_.object_id for result in vdb.knn_search("index", "schema", [], params)})
+    return results, 1000 * (time.perf_counter() - start) / len(queries)
+
+
+def calculate_recall(results: list[set[str]], expected_results: list[set[str]]) -> float:
+    recalls = [len(result & expected) / len(expected) for result, expected in zip(results, expected_results)]
+    return float(np.mean(recalls))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--dimension", type=int, default=128)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--rescoring-factors", type=float, nargs="+", default=[0, 1, 2, 4])
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    vectors = generate_vectors(args.rows, args.dimension, rng)
+    queries = generate_vectors(args.queries, args.dimension, rng)
+
+    exact_vdb, exact_mb = create_vdb(args.dimension, QuantizationParams(), vectors)
+    exact_matrix_mb = exact_vdb._vector_matrices[VECTOR_FIELD].nbytes / 2**20
+    exact_results, exact_latency = search(exact_vdb, queries, args.limit)
+
+    header = f"{'quantization':>13} {'rescoring':>10} {'total MB':>9} {'matrix MB':>10}"
+    print(f"{header} {'recall@' + str(args.limit):>10} {'ms/query':>9}")
+    print(f"{'NONE':>13} {'-':>10} {exact_mb:>9.1f} {exact_matrix_mb:>10.1f} {1.0:>10.3f} {exact_latency:>9.2f}")
+    for quantization in [VectorQuantization.FLOAT16, VectorQuantization.INT8]:
+        for rescoring_factor in args.rescoring_factors:
+            vdb, total_mb = create_vdb(args.dimension, QuantizationParams(quantization, rescoring_factor), vectors)
+            matrix_mb = vdb._vector_matrices[VECTOR_FIELD].nbytes / 2**20
+            results, latency = search(vdb, queries, args.limit)
+            recall = calculate_recall(results, exact_results)
+            row = f"{quantization.value:>13} {rescoring_factor:>10g} {total_mb:>9.1f} {matrix_mb:>10.1f}"
+            print(f"{row} {recall:>10.3f} {latency:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
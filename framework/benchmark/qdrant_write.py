@@ -0,0 +1,127 @@
+# Copyright 2024 Superlinked, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Qdrant ingestion cost with and without the existing point id cache (QDRANT_EXISTING_POINT_ID_CACHE_MAX_ENTRIES).
+An in-process ':memory:' Qdrant stands in for the server, every client call is delayed by --latency-ms
+to model the network round trip. The objects are ingested twice, the second round updates existing points.
+The setting is read when the connector is created, so each mode is measured in its own interpreter.
+
+    python qdrant_write.py --objects 1000 --batch-size 100 --latency-ms 1
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+from collections import Counter
+from typing import Any, Callable
+
+SETTING_NAME = "QDRANT_EXISTING_POINT_ID_CACHE_MAX_ENTRIES"
+COUNTED_CLIENT_METHODS = ["retrieve", "batch_update_points"]
+
+
+def delay_and_count(method: Callable, method_name: str, call_counts: Counter, latency_seconds: float) -> Callable:
+    def delayed(*args: Any, **kwargs: Any) -> Any:
+        call_counts[method_name] += 1
+        time.sleep(latency_seconds)
+        return method(*args, **kwargs)
+
+    return delayed
+
+
+def measure(object_count: int, batch_size: int, latency_ms: float) -> None:
+    # pylint: disable=import-outside-toplevel
+    import superlinked.framework as sl
+
+    @sl.schema
+    class Product:
+        id: sl.IdField
+        price: sl.Float
+        rating: sl.Integer
+        category: sl.String
+
+    product = Product()
+    price_space = sl.NumberSpace(product.price, min_value=0, max_value=100, mode=sl.Mode.MAXIMUM)
+    rating_space = sl.NumberSpace(product.rating, min_value=0, max_value=5, mode=sl.Mode.MAXIMUM)
+    category_space = sl.CategoricalSimilaritySpace(product.category, categories=["a", "b", "c"])
+    index = sl.Index([price_space, rating_space, category_space])
+    source: sl.InteractiveSource = sl.InteractiveSource(product)
+    vector_database = sl.QdrantVectorDatabase(":memory:", "")
+    app = sl.InteractiveExecutor(sources=[source], indices=[index], vector_database=vector_database).run()
+    client = app.storage_manager._vdb_connector._client
+    call_counts: Counter = Counter()
+    for method_name in COUNTED_CLIENT_METHODS:
+        method = getattr(client, method_name)
+        setattr(client, method_name, delay_and_count(method, method_name, call_counts, latency_ms / 1000))
+
+    start = time.perf_counter()
+    for round_ in range(2):
+        for batch_start in range(0, object_count, batch_size):
+            source.put(
+                [
+                    {"id": str(i), "price": float((i + round_) % 100), "rating": i % 6, "category": "abc"[i % 3]}
+                    for i in range(batch_start, min(batch_start + batch_size, object_count))
+                ]
+            )
+    elapsed_ms = 1000 * (time.perf_counter() - start)
+    print(f"{elapsed_ms:.1f} {call_counts['retrieve']} {call_counts['batch_update_points']}")
+
+
+def run_mode(cache_max_entries: int, object_count: int, batch_size: int, latency_ms: float) -> list[float]:
+    env = {**os.environ, SETTING_NAME: str(cache_max_entries)}
+    output = subprocess.run(
+        [
+            sys.executable,
+            __file__,
+            "--measure",
+            "--objects",
+            str(object_count),
+            "--batch-size",
+            str(batch_size),
+            "--latency-ms",
+            str(latency_ms),
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+        env=env,
+    ).stdout.split()
+    return [float(value) for value in output[-3:]]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--objects", type=int, default=1000)
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument("--latency-ms", type=float, default=1.0)
+    parser.add_argument("--cache-max-entries", type=int, default=1_000_000)
+    parser.add_argument("--measure", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        measure(args.objects, args.batch_size, args.latency_ms)
+        return
+    print(f"{'mode':>22} {'ingest ms':>10} {'retrieve calls':>15} {'update calls':>13}")
+    for cache_max_entries in [0, args.cache_max_entries]:
+        elapsed_ms, retrieve_count, update_count = run_mode(
+            cache_max_entries, args.objects, args.batch_size, args.latency_ms
+        )
+        mode = "point id cache" if cache_max_entries else "existence check"
+        print(f"{mode:>22} {elapsed_ms:>10.1f} {retrieve_count:>15.0f} {update_count:>13.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+# Copyright 2024 Superlinked, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Per-query cost of runtime type checking, with and without DISABLE_RUNTIME_TYPE_CHECKING.
+The setting is read when superlinked is imported, so each mode is measured in its own interpreter.
+
+    python query_type_checking.py --queries 2000 --rows 1000
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+SETTING_NAME = "DISABLE_RUNTIME_TYPE_CHECKING"
+
+
+def measure(query_count: int, row_count: int) -> None:
+    # pylint: disable=import-outside-toplevel
+    import superlinked.framework as sl
+    from superlinked.framework.dsl.query.query_param_value_setter import (
+        QueryParamValueSetter,
+    )
+
+    @sl.schema
+    class Product:
+        id: sl.IdField
+        price: sl.Float
+        rating: sl.Integer
+        category: sl.String
+
+    product = Product()
+    price_space = sl.NumberSpace(product.price, min_value=0, max_value=100, mode=sl.Mode.MAXIMUM)
+    rating_space = sl.NumberSpace(product.rating, min_value=0, max_value=5, mode=sl.Mode.MAXIMUM)
+    category_space = sl.CategoricalSimilaritySpace(product.category, categories=["a", "b", "c"])
+    index = sl.Index([price_space, rating_space, category_space])
+    source: sl.InMemorySource = sl.InMemorySource(product)
+    app = sl.InMemoryExecutor(sources=[source], indices=[index]).run()
+    source.put(
+        [
+            {"id": str(i), "price": float(i % 100), "rating": i % 6, "category": "abc"[i % 3]}
+            for i in range(row_count)
+        ]
+    )
+    query = (
+        sl.Query(
+            index,
+            weights={price_space: sl.Param("price_weight"), rating_space: 1.0, category_space: 1.0},
+        )
+        .find(product)
+        .similar(category_space, sl.Param("category"))
+        .limit(sl.Param("limit"))
+    )
+    params = {"price_weight": 1.0, "category": "a", "limit": 10}
+
+    start = time.perf_counter()
+    for _ in range(query_count):
+        QueryParamValueSetter.set_values(query, params)
+    set_values_us = 1e6 * (time.perf_counter() - start) / query_count
+
+    start = time.perf_counter()
+    for _ in range(query_count):
+        app.query(query, **params)
+    query_us = 1e6 * (time.perf_counter() - start) / query_count
+    print(f"{set_values_us:.1f} {query_us:.1f}")
+
+
+def run_mode(disabled: bool, query_count: int, row_count: int) -> tuple[float, float]:
+    env = {**os.environ, SETTING_NAME: str(disabled)}
+    output = subprocess.run(
+        [sys.executable, __file__, "--measure", "--queries", str(query_count), "--rows", str(row_count)],
+        check=True,
+        capture_output=True,
+        text=True,
+        env=env,
+    ).stdout.split()
+    return float(output[-2]), float(output[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--queries", type=int, default=2000)
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--measure", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        measure(args.queries, args.rows)
+        return
+    print(f"{'mode':>28} {'set_values us':>14} {'query us':>10}")
+    for disabled in [False, True]:
+        set_values_us, query_us = run_mode(disabled, args.queries, args.rows)
+        mode = "type checking disabled" if disabled else "type checking enabled"
+        print(f"{mode:>28} {set_values_us:>14.1f} {query_us:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -13,35 +13,10 @@
 # limitations under the License.
 
 
-try:
-    # altair dependency is optional
-    from superlinked.evaluation.charts.recency_plotter import RecencyPlotter
-except ImportError:
-    pass
-
-try:
-    # pymongo dependency is optional
-    from superlinked.framework.dsl.storage.mongo_db_vector_database import (
-        MongoDBVectorDatabase,
-    )
-except ImportError:
-    pass
+import importlib
 
-try:
-    # qdrant dependency is optional
-    from superlinked.framework.dsl.storage.qdrant_vector_database import (
-        QdrantVectorDatabase,
-    )
-except ImportError:
-    pass
+from beartype.typing import Any
 
-try:
-    # redis dependency is optional
-    from superlinked.framework.dsl.storage.redis_vector_database import (
-        RedisVectorDatabase,
-    )
-except ImportError:
-    pass
 from superlinked.evaluation.vector_sampler import VectorSampler
 from superlinked.framework.common.dag.context import CONTEXT_COMMON, CONTEXT_COMMON_NOW
 from superlinked.framework.common.dag.period_time import PeriodTime
@@ -113,6 +88,26 @@ from superlinked.framework.dsl.storage.in_memory_vector_database import (
     InMemoryVectorDatabase,
 )
 
+# Optional dependencies are imported on first access, so a missing or slow-to-import client
+# does not affect importing the framework.
+_LAZY_EXPORTS = {
+    # altair dependency is optional
+    "RecencyPlotter": "superlinked.evaluation.charts.recency_plotter",
+    # pymongo dependency is optional
+    "MongoDBVectorDatabase": "superlinked.framework.dsl.storage.mongo_db_vector_database",
+    # qdrant dependency is optional
+    "QdrantVectorDatabase": "superlinked.framework.dsl.storage.qdrant_vector_database",
+    # redis dependency is optional
+    "RedisVectorDatabase": "superlinked.framework.dsl.storage.redis_vector_database",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_EXPORTS:
+        return getattr(importlib.import_module(_LAZY_EXPORTS[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     # Evaluation
     "RecencyPlotter",
@@ -32,5 +32,16 @@ class VectorSimilarityCalculator:
             case _:
                 raise ValueError(f"Unsupported calculation method: {self.__method}")
 
+    def calculate_similarities_np(self, matrix: np.ndarray, vector: np.ndarray) -> np.ndarray:
+        """
+        Scores every row of `matrix` against `vector` in a single matrix-vector product.
+        `vector` can also hold one query vector per column, yielding one column of scores per query.
+        """
+        match self.__method:
+            case DistanceMetric.INNER_PRODUCT:
+                return matrix @ vector
+            case _:
+                raise ValueError(f"Unsupported calculation method: {self.__method}")
+
     def __calculate_inner_product(self, vector_a: NPArray, vector_b: NPArray) -> float:
         return np.inner(vector_a, vector_b)
@@ -30,9 +30,23 @@ NPArray = np.ndarray[
     np.dtype[np.float64],  # type: ignore # numpy stub is missing for mypy-pylance
 ]
 NP_PRINT_PRECISION = 6
+EMPTY_NEGATIVE_FILTER_INDICES: frozenset[int] = frozenset()
 
 
 class Vector:
+    """
+    Immutable vector: the value array is never modified in place, so derived vectors share arrays
+    and the vector before normalization instead of copying them.
+    """
+
+    __slots__ = (
+        "value",
+        "__dimension",
+        "__negative_filter_indices",
+        "__negative_filter_mask",
+        "__vector_before_normalization",
+    )
+
     def __init__(
         self,
         value: Sequence[float] | Sequence[np.float64] | NPArray,
@@ -46,8 +60,15 @@ class Vector:
         self.value: NPArray = value_to_set
         self.__dimension: int = len(self.value)
         self.__negative_filter_indices = (
-            frozenset(negative_filter_indices) if negative_filter_indices else frozenset({})
+            (
+                negative_filter_indices
+                if isinstance(negative_filter_indices, frozenset)
+                else frozenset(negative_filter_indices)
+            )
+            if negative_filter_indices
+            else EMPTY_NEGATIVE_FILTER_INDICES
         )
+        self.__negative_filter_mask: np.ndarray | None = None
         self.__validate_negative_filter_indices()
         self.__vector_before_normalization = vector_before_normalization
 
@@ -73,13 +94,22 @@ class Vector:
 
     @property
     def without_negative_filter(self) -> Vector:
+        if not self.negative_filter_indices:
+            return Vector(self.value)
         return Vector(self.value[self.non_negative_filter_mask])
 
+    @property
+    def negative_filter_mask(self) -> np.ndarray:
+        if self.__negative_filter_mask is None:
+            mask = np.zeros(self.dimension, dtype=np.bool_)
+            mask[list(self.negative_filter_indices)] = True
+            mask.flags.writeable = False
+            self.__negative_filter_mask = mask
+        return self.__negative_filter_mask
+
     @property
     def non_negative_filter_mask(self) -> np.ndarray:
-        mask = np.ones(self.dimension, dtype=np.bool_)
-        mask[list(self.negative_filter_indices)] = False
-        return mask
+        return ~self.negative_filter_mask
 
     def normalize(self, length: float) -> Vector:
         if length in [0, 1]:
@@ -122,26 +152,18 @@ class Vector:
             raise NegativeFilterException(f"Invalid negative filter index: {index_max}.")
 
     def apply_negative_filter(self, other: Vector) -> Vector:
+        values = other.value.copy()
+        kept_mask = other.non_negative_filter_mask
         if self.negative_filter_indices == other.negative_filter_indices:
-            values = [
-                (self.value[i] if i not in other.negative_filter_indices else value)
-                for i, value in enumerate(other.value)
-            ]
+            values[kept_mask] = self.value[kept_mask]
         else:
-            value_iterator = iter(self.value)
-            values = [
-                (next(value_iterator) if i not in other.negative_filter_indices else value)
-                for i, value in enumerate(other.value)
-            ]
+            values[kept_mask] = self.value[: np.count_nonzero(kept_mask)]
         return self.copy_with_new(values, other.negative_filter_indices)
 
     def replace_negative_filters(self, new_negative_filter_value: float) -> Vector:
-        return self.copy_with_new(
-            [
-                (new_negative_filter_value if i in self.negative_filter_indices else original_value)
-                for i, original_value in enumerate(self.value)
-            ]
-        )
+        if not self.negative_filter_indices:
+            return self.copy_with_new()
+        return self.copy_with_new(np.where(self.negative_filter_mask, new_negative_filter_value, self.value))
 
     def concatenate(self, other: Any) -> Vector:
         if not isinstance(other, Vector):
@@ -219,19 +241,10 @@ class Vector:
         negative_filter_indices: set[int] | frozenset[int] | None = None,
         vector_before_normalization: Vector | None = None,
     ) -> Vector:
-        value_to_use = self.value if value is None else value
-        vector_before_normalization_to_use = (
-            (self.vector_before_normalization.copy_with_new() if self.vector_before_normalization is not None else None)
-            if vector_before_normalization is None
-            else vector_before_normalization.copy_with_new()
-        )
-        negative_filter_indices_to_use = (
-            self.negative_filter_indices if negative_filter_indices is None else negative_filter_indices
-        )
         return Vector(
-            value_to_use.copy(),
-            negative_filter_indices_to_use.copy(),
-            vector_before_normalization_to_use,
+            self.value if value is None else value,
+            self.negative_filter_indices if negative_filter_indices is None else negative_filter_indices,
+            self.vector_before_normalization if vector_before_normalization is None else vector_before_normalization,
         )
 
     def __copy(self) -> Vector:
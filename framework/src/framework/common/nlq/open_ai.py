@@ -18,9 +18,7 @@ import threading
 from contextlib import contextmanager
 from dataclasses import dataclass
 
-import instructor
 from beartype.typing import Any, Generator
-from openai import OpenAI
 from pydantic import BaseModel
 
 TEMPERATURE_VALUE: float = 0.0
@@ -71,6 +69,10 @@ def suppress_tokenizer_warnings() -> Generator[None, Any, None]:
 class OpenAIClient:
     def __init__(self, config: OpenAIClientConfig) -> None:
         super().__init__()
+        # openai and instructor are slow to import and only needed for natural language queries
+        import instructor  # pylint: disable=import-outside-toplevel
+        from openai import OpenAI  # pylint: disable=import-outside-toplevel
+
         open_ai = OpenAI(api_key=config.api_key)
         self._client = instructor.from_openai(open_ai)
         self._openai_model = config.model
@@ -53,11 +53,11 @@ class DataFrameParser(Generic[IdSchemaObjectT], DataParser[IdSchemaObjectT, pd.D
         Returns:
             list[ParsedSchema]: A list of ParsedSchema objects that will be processed by the spaces.
         """
-        data_copy = data.copy()
         schema_cols: dict[str, SchemaField] = self._get_column_name_to_schema_field_mapping()
-        self._ensure_id(data_copy)
+        self._ensure_id(data)
         if self._is_event_data_parser:
-            self.__ensure_created_at(data_copy)
+            self.__ensure_created_at(data)
+        data_copy = cast(pd.DataFrame, data[list(schema_cols.keys())].copy())
 
         data_copy[self._id_name] = data_copy[self._id_name].astype(str)
         self._convert_columns_to_type(data_copy, schema_cols, Timestamp)
@@ -67,28 +67,35 @@ class DataFrameParser(Generic[IdSchemaObjectT], DataParser[IdSchemaObjectT, pd.D
         if blob_cols := [key for key, value in schema_cols.items() if isinstance(value, Blob)]:
             data_copy[blob_cols] = data_copy[blob_cols].apply(lambda col: col.map(self.blob_loader.load))
 
-        if self._is_event_data_parser:
-            data_copy[self._created_at_name] = data_copy[self._created_at_name].astype(int)
-        schema_data = cast(pd.DataFrame, data_copy[list(schema_cols.keys())])
-        records = cast(list[dict[str, Any]], schema_data.to_dict(orient="records"))
-        return [self.__create_parsed_schema(record, schema_cols) for record in records]
-
-    def __create_parsed_schema(self, record: dict[str, Any], schema_cols: dict[str, SchemaField]) -> ParsedSchema:
+        ids: list[str] = data_copy[self._id_name].tolist()
         admin_field_names = [self._id_name] + ([self._created_at_name] if self._is_event_data_parser else [])
-        other_fields = [
-            ParsedSchemaField.from_schema_field(schema_field=schema_cols[key], value=value)
-            for key, value in record.items()
-            if key not in admin_field_names and self._field_has_non_null_value(value)
-        ]
-        id_: str = cast(str, record[self._id_name])
+        fields_by_row: list[list[ParsedSchemaField]] = [[] for _ in ids]
+        for column_name, schema_field in schema_cols.items():
+            if column_name not in admin_field_names:
+                self.__add_parsed_fields(data_copy[column_name], schema_field, fields_by_row)
         if self._is_event_data_parser:
-            return EventParsedSchema(
-                self._schema,
-                id_,
-                other_fields,
-                cast(int, record[self._created_at_name]),
-            )
-        return ParsedSchema(self._schema, id_, other_fields)
+            created_ats: list[int] = data_copy[self._created_at_name].astype(int).tolist()
+            return [
+                EventParsedSchema(self._schema, id_, fields, created_at)
+                for id_, fields, created_at in zip(ids, fields_by_row, created_ats)
+            ]
+        return [ParsedSchema(self._schema, id_, fields) for id_, fields in zip(ids, fields_by_row)]
+
+    def __add_parsed_fields(
+        self, series: pd.Series, schema_field: SchemaField, fields_by_row: list[list[ParsedSchemaField]]
+    ) -> None:
+        """
+        Parses the column and appends its non-null values to the fields of their rows.
+        """
+        values = series.tolist()
+        has_values = (
+            [self._field_has_non_null_value(value) for value in values]
+            if series.dtype == object
+            else series.notna().tolist()
+        )
+        for fields, value, has_value in zip(fields_by_row, values, has_values):
+            if has_value:
+                fields.append(ParsedSchemaField.from_schema_field(schema_field, value))
 
     def _field_has_non_null_value(self, value: Any) -> bool:
         values_to_check = value if isinstance(value, list) else [value]
@@ -32,6 +32,16 @@ class Settings(BaseSettings):
     SENTENCE_TRANSFORMERS_MODEL_LOCK_MAX_RETRIES: int = 10
     SENTENCE_TRANSFORMERS_MODEL_LOCK_RETRY_DELAY: int = 1
     GPU_EMBEDDING_THRESHOLD: int = 0
+    EMBEDDING_MICRO_BATCH_SIZE: int = 256
+    EMBEDDING_MICRO_BATCH_MAX_CHARACTERS: int = 256 * 1024
+    EMBEDDING_WORKER_COUNT: int = 0
+    # threads evaluating the independent branches of the online dag concurrently, 0 evaluates them in order
+    ONLINE_DAG_WORKER_COUNT: int = 0
+    EMBEDDING_CACHE_DIR: str | None = None
+    EMBEDDING_CACHE_MAX_ENTRIES: int = 1_000_000
+    QUERY_VECTOR_CACHE_MAX_ENTRIES: int = 10_000
+    # queries with a recency space share the cached vector within this many seconds of 'now'
+    QUERY_VECTOR_CACHE_NOW_BUCKET_SECONDS: int = 0
     DISABLE_RICH_TRACEBACK: bool = False
     SUPERLINKED_LOG_LEVEL: int | str | None = None
     SUPERLINKED_LOG_AS_JSON: bool = False
@@ -51,6 +61,10 @@ class Settings(BaseSettings):
     BLOB_HANDLER_CLASS_ARGS_STR: str | None = None
     BLOB_HANDLER_CLASS_ARGS: dict[str, Any] | None = None
     INIT_SEARCH_INDICES: bool = True
+    # ids of the qdrant points known to exist, writing to them skips the existence check
+    QDRANT_EXISTING_POINT_ID_CACHE_MAX_ENTRIES: int = 1_000_000
+    # skips the per-call type checks of the DSL, must be set before superlinked is imported
+    DISABLE_RUNTIME_TYPE_CHECKING: bool = False
 
     model_config = SettingsConfigDict(env_file=".env", extra="ignore")
 
@@ -13,6 +13,8 @@
 # limitations under the License.
 
 
+from itertools import chain
+
 import numpy as np
 from beartype.typing import Sequence
 from typing_extensions import override
@@ -36,18 +38,21 @@ class CategoricalSimilarityEmbedding(Embedding[list[str], CategoricalSimilarityE
 
     @override
     def embed(self, input_: list[str], context: ExecutionContext) -> Vector:
-        n_hot_encoding: NPArray = self._n_hot_encode(input_, context.is_query_context)
-        negative_filter_indices = set(i for i in range(self.length) if i not in self._get_category_indices(input_))
-        return Vector(n_hot_encoding, negative_filter_indices)
+        return self.embed_multiple([input_], context)[0]
 
-    def _n_hot_encode(self, category_list: Sequence[str], is_query: bool) -> NPArray:
-        n_hot_encoding = self._default_n_hot_encoding.copy()
-        if is_query:
-            n_hot_encoding.fill(0)
-        category_indices = self._get_category_indices(category_list)
-        if category_indices:
-            n_hot_encoding[category_indices] = CATEGORICAL_ENCODING_VALUE
-        return n_hot_encoding
+    @override
+    def embed_multiple(self, inputs: Sequence[list[str]], context: ExecutionContext) -> list[Vector]:
+        category_indices_by_row = [self._get_category_indices(input_) for input_ in inputs]
+        n_hot_encodings: NPArray = np.tile(self._default_n_hot_encoding, (len(inputs), 1))
+        if context.is_query_context:
+            n_hot_encodings.fill(0)
+        rows = [row for row, category_indices in enumerate(category_indices_by_row) for _ in category_indices]
+        n_hot_encodings[rows, list(chain.from_iterable(category_indices_by_row))] = CATEGORICAL_ENCODING_VALUE
+        all_indices = frozenset(range(self.length))
+        return [
+            Vector(n_hot_encoding, all_indices.difference(category_indices))
+            for n_hot_encoding, category_indices in zip(n_hot_encodings, category_indices_by_row)
+        ]
 
     def _get_category_indices(self, text_input: Sequence[str]) -> list[int]:
         return list(
@@ -14,10 +14,13 @@
 
 from dataclasses import dataclass
 
-from beartype.typing import Sequence
+from beartype.typing import Sequence, cast
 from cachetools import LRUCache
 
 from superlinked.framework.common.data_types import Vector
+from superlinked.framework.common.space.embedding.persistent_embedding_cache import (
+    PersistentEmbeddingCache,
+)
 
 
 @dataclass(frozen=True)
@@ -42,20 +45,30 @@ class CacheInformation:
 
 
 class EmbeddingCache:
-    def __init__(self, cache_size: int) -> None:
+    def __init__(
+        self,
+        cache_size: int,
+        model_key: str | None = None,
+        persistent_cache: PersistentEmbeddingCache | None = None,
+    ) -> None:
         self._cache_size = cache_size
         self._cache: LRUCache = LRUCache(self._cache_size)
+        self._model_key = model_key
+        self._persistent_cache = persistent_cache if model_key is not None else None
 
     def calculate_cache_info(self, inputs: Sequence[str]) -> CacheInformation:
-        if self._cache_size == 0:
+        if self._cache_size == 0 and self._persistent_cache is None:
             return CacheInformation(inputs, [], [])
 
+        vectors: list[Vector | None] = [self._cache.get(input_) for input_ in inputs]
+        if self._persistent_cache is not None:
+            self.__fill_from_persistent_cache(inputs, vectors)
+
         inputs_to_embed = []
         found_indices = []
         existing_vectors = []
 
-        for i, input_ in enumerate(inputs):
-            vector = self._cache.get(input_)
+        for i, (input_, vector) in enumerate(zip(inputs, vectors)):
             if vector is None:
                 inputs_to_embed.append(input_)
             else:
@@ -64,9 +77,31 @@ class EmbeddingCache:
         return CacheInformation(inputs_to_embed, found_indices, existing_vectors)
 
     def update(self, inputs_to_embed: Sequence[str], uncached_vectors: Sequence[Vector]) -> None:
-        if self._cache_size == 0:
-            return
         if not inputs_to_embed:
             return
-        for input_, vector in zip(inputs_to_embed, uncached_vectors):
+        if self._persistent_cache is not None:
+            self._persistent_cache.put_vectors(
+                cast(str, self._model_key),
+                [PersistentEmbeddingCache.hash_input(input_) for input_ in inputs_to_embed],
+                uncached_vectors,
+            )
+        self.__update_lru(inputs_to_embed, uncached_vectors)
+
+    def __fill_from_persistent_cache(self, inputs: Sequence[str], vectors: list[Vector | None]) -> None:
+        missing_indices = [i for i, vector in enumerate(vectors) if vector is None]
+        if not missing_indices:
+            return
+        persisted_vectors = cast(PersistentEmbeddingCache, self._persistent_cache).get_vectors(
+            cast(str, self._model_key),
+            [PersistentEmbeddingCache.hash_input(inputs[i]) for i in missing_indices],
+        )
+        found = [(i, vector) for i, vector in zip(missing_indices, persisted_vectors) if vector is not None]
+        for i, vector in found:
+            vectors[i] = vector
+        self.__update_lru([inputs[i] for i, _ in found], [vector for _, vector in found])
+
+    def __update_lru(self, inputs: Sequence[str], vectors: Sequence[Vector]) -> None:
+        if self._cache_size == 0:
+            return
+        for input_, vector in zip(inputs, vectors):
             self._cache[input_] = vector
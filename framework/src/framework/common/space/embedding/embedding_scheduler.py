@@ -0,0 +1,124 @@
+# Copyright 2024 Superlinked, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+
+import structlog
+from beartype.typing import Callable, Generic, Sequence, TypeVar
+from PIL.Image import Image
+
+logger = structlog.getLogger()
+
+EmbeddingT = TypeVar("EmbeddingT")
+
+
+@dataclass
+class EmbeddingThroughputMetrics:
+    input_count: int = 0
+    embedded_count: int = 0
+    batch_count: int = 0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def inputs_per_second(self) -> float:
+        return self.input_count / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+    @property
+    def deduplication_ratio(self) -> float:
+        return 1 - self.embedded_count / self.input_count if self.input_count else 0.0
+
+
+class EmbeddingScheduler(Generic[EmbeddingT]):
+    """
+    Splits embedding inputs into micro-batches capped by item count and total text length.
+    Identical texts are embedded once, and inputs are sorted by length so that texts of similar
+    length share a batch, which keeps padding low. All batches are handed to `embed_batches`
+    at once so they can be embedded concurrently. Results are returned in the original order.
+    """
+
+    def __init__(self, max_batch_size: int, max_batch_characters: int) -> None:
+        if max_batch_size <= 0 or max_batch_characters <= 0:
+            raise ValueError("max_batch_size and max_batch_characters must be positive")
+        self._max_batch_size = max_batch_size
+        self._max_batch_characters = max_batch_characters
+        self._metrics = EmbeddingThroughputMetrics()
+
+    @property
+    def metrics(self) -> EmbeddingThroughputMetrics:
+        return self._metrics
+
+    def schedule(
+        self,
+        inputs: Sequence[str | Image],
+        embed_batches: Callable[[list[list[str | Image]]], Sequence[Sequence[EmbeddingT]]],
+    ) -> list[EmbeddingT]:
+        start_time = time.perf_counter()
+        unique_inputs, unique_index_by_position = self._deduplicate(inputs)
+        unique_embeddings: list[EmbeddingT | None] = [None] * len(unique_inputs)
+        batches = self._create_batches(unique_inputs)
+        batch_embeddings = embed_batches([[unique_inputs[i] for i in batch] for batch in batches])
+        for batch, embeddings in zip(batches, batch_embeddings):
+            for unique_index, embedding in zip(batch, embeddings):
+                unique_embeddings[unique_index] = embedding
+        elapsed_seconds = time.perf_counter() - start_time
+        self._record(len(inputs), len(unique_inputs), len(batches), elapsed_seconds)
+        return [unique_embeddings[unique_index] for unique_index in unique_index_by_position]  # type: ignore[misc]
+
+    def _deduplicate(self, inputs: Sequence[str | Image]) -> tuple[list[str | Image], list[int]]:
+        unique_inputs: list[str | Image] = []
+        unique_index_by_text: dict[str, int] = {}
+        unique_index_by_position: list[int] = []
+        for input_ in inputs:
+            if isinstance(input_, str) and input_ in unique_index_by_text:
+                unique_index_by_position.append(unique_index_by_text[input_])
+                continue
+            if isinstance(input_, str):
+                unique_index_by_text[input_] = len(unique_inputs)
+            unique_index_by_position.append(len(unique_inputs))
+            unique_inputs.append(input_)
+        return unique_inputs, unique_index_by_position
+
+    def _create_batches(self, inputs: list[str | Image]) -> list[list[int]]:
+        lengths = [len(input_) if isinstance(input_, str) else 0 for input_ in inputs]
+        batches: list[list[int]] = []
+        current_batch: list[int] = []
+        current_characters = 0
+        for index in sorted(range(len(inputs)), key=lengths.__getitem__):
+            if current_batch and (
+                len(current_batch) >= self._max_batch_size
+                or current_characters + lengths[index] > self._max_batch_characters
+            ):
+                batches.append(current_batch)
+                current_batch, current_characters = [], 0
+            current_batch.append(index)
+            current_characters += lengths[index]
+        if current_batch:
+            batches.append(current_batch)
+        return batches
+
+    def _record(self, input_count: int, embedded_count: int, batch_count: int, elapsed_seconds: float) -> None:
+        self._metrics.input_count += input_count
+        self._metrics.embedded_count += embedded_count
+        self._metrics.batch_count += batch_count
+        self._metrics.elapsed_seconds += elapsed_seconds
+        logger.debug(
+            "scheduled embedding batches",
+            input_count=input_count,
+            embedded_count=embedded_count,
+            batch_count=batch_count,
+            inputs_per_second=input_count / elapsed_seconds if elapsed_seconds else 0.0,
+        )
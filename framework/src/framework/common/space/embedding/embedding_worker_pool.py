@@ -0,0 +1,114 @@
+# Copyright 2024 Superlinked, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import atexit
+import multiprocessing
+import os
+from concurrent.futures import Future, ProcessPoolExecutor, wait
+from functools import lru_cache, partial
+from multiprocessing.shared_memory import SharedMemory
+from pathlib import Path
+
+import numpy as np
+import structlog
+from beartype.typing import Callable, Sequence
+from PIL.Image import Image
+
+from superlinked.framework.common.settings import Settings
+from superlinked.framework.common.util.gpu_embedding_util import CPU_DEVICE_TYPE
+
+logger = structlog.getLogger()
+
+BatchEmbedder = Callable[[list[str | Image]], list[list[float]] | list[np.ndarray]]
+
+_worker_embed_batch: BatchEmbedder | None = None
+
+
+class EmbeddingWorkerPool:
+    """
+    Embeds micro-batches in a pool of worker processes, each holding its own copy of the model.
+    Embeddings are handed back in the dtype of the model through shared memory blocks instead of being pickled,
+    so they are the same as the ones embedded in process.
+    """
+
+    def __init__(self, manager_type: type, model_name: str, model_cache_dir: Path, worker_count: int) -> None:
+        self._executor = ProcessPoolExecutor(
+            max_workers=worker_count,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(manager_type, model_name, model_cache_dir, max(1, (os.cpu_count() or 1) // worker_count)),
+        )
+        atexit.register(self._executor.shutdown)
+        logger.info("started embedding worker pool", model_name=model_name, worker_count=worker_count)
+
+    @classmethod
+    def get_pool(cls, manager_type: type, model_name: str, model_cache_dir: Path) -> EmbeddingWorkerPool | None:
+        worker_count = Settings().EMBEDDING_WORKER_COUNT
+        if worker_count <= 0:
+            return None
+        return cls._get_instance(manager_type, model_name, model_cache_dir, worker_count)
+
+    @classmethod
+    @lru_cache(maxsize=10)
+    def _get_instance(
+        cls, manager_type: type, model_name: str, model_cache_dir: Path, worker_count: int
+    ) -> EmbeddingWorkerPool:
+        return cls(manager_type, model_name, model_cache_dir, worker_count)
+
+    def embed_batches(self, batches: Sequence[list[str | Image]]) -> list[list[np.ndarray]]:
+        futures = [self._executor.submit(_embed_in_worker, batch) for batch in batches]
+        wait(futures)
+        try:
+            return [self._read_embeddings(*future.result()) for future in futures]
+        finally:
+            # the blocks of every successful batch are released even if another batch failed
+            for future in futures:
+                if not future.cancelled() and future.exception() is None:
+                    self._release_shared_memory(future)
+
+    def _read_embeddings(self, shared_memory_name: str, shape: tuple[int, ...], dtype: str) -> list[np.ndarray]:
+        shared_memory = SharedMemory(name=shared_memory_name)
+        try:
+            embeddings = np.ndarray(shape, dtype=np.dtype(dtype), buffer=shared_memory.buf).copy()
+        finally:
+            shared_memory.close()
+        return list(embeddings)
+
+    def _release_shared_memory(self, future: Future[tuple[str, tuple[int, ...], str]]) -> None:
+        shared_memory = SharedMemory(name=future.result()[0])
+        shared_memory.close()
+        shared_memory.unlink()
+
+
+def _init_worker(manager_type: type, model_name: str, model_cache_dir: Path, thread_count: int) -> None:
+    global _worker_embed_batch  # pylint: disable=global-statement
+    import torch  # pylint: disable=import-outside-toplevel
+
+    torch.set_num_threads(thread_count)
+    manager = manager_type(model_name, model_cache_dir)
+    _worker_embed_batch = partial(manager.embed_batch, device_type=CPU_DEVICE_TYPE)
+
+
+def _embed_in_worker(batch: list[str | Image]) -> tuple[str, tuple[int, ...], str]:
+    if _worker_embed_batch is None:
+        raise RuntimeError("Embedding worker was not initialized.")
+    embeddings = np.asarray(_worker_embed_batch(batch))
+    shared_memory = SharedMemory(create=True, size=max(embeddings.nbytes, 1))
+    try:
+        np.ndarray(embeddings.shape, dtype=embeddings.dtype, buffer=shared_memory.buf)[:] = embeddings
+    finally:
+        shared_memory.close()
+    return shared_memory.name, embeddings.shape, embeddings.dtype.str
@@ -15,7 +15,8 @@
 from pathlib import Path
 
 import structlog
-from beartype.typing import Sequence
+from beartype.typing import Sequence, cast
+from PIL.Image import Image
 from typing_extensions import override
 
 from superlinked.framework.common.dag.context import ExecutionContext
@@ -35,6 +36,9 @@ from superlinked.framework.common.space.embedding.model_manager import ModelMana
 from superlinked.framework.common.space.embedding.open_clip_manager import (
     OpenClipManager,
 )
+from superlinked.framework.common.space.embedding.persistent_embedding_cache import (
+    PersistentEmbeddingCache,
+)
 from superlinked.framework.common.space.embedding.sentence_transformer_manager import (
     SentenceTransformerManager,
 )
@@ -50,11 +54,12 @@ class ImageEmbedding(Embedding[ImageData, ImageEmbeddingConfig]):
     ) -> None:
         super().__init__(embedding_config)
         self.manager = ImageEmbedding.init_manager(self._config.model_handler, self._config.model_name, model_cache_dir)
+        self._persistent_cache = PersistentEmbeddingCache.from_settings()
 
     @override
     def embed_multiple(self, inputs: Sequence[ImageData], context: ExecutionContext) -> list[Vector]:
         images, descriptions = zip(*((input_.image, input_.description) for input_ in inputs))
-        embeddings = self.manager.embed(images + descriptions)
+        embeddings = self._embed_with_cache(images + descriptions)
         if all(embedding is None for embedding in embeddings):
             return [Vector.init_zero_vector(self._config.length)] * len(inputs)
         aggregation = VectorAggregation(VectorAggregationConfig(Vector))
@@ -67,6 +72,29 @@ class ImageEmbedding(Embedding[ImageData, ImageEmbeddingConfig]):
         ]
         return combined_embeddings
 
+    def _embed_with_cache(self, inputs: Sequence[str | Image | None]) -> list[Vector | None]:
+        if self._persistent_cache is None:
+            return self.manager.embed(inputs)
+        embeddable_indices = [i for i, input_ in enumerate(inputs) if input_ is not None]
+        input_hashes = [
+            PersistentEmbeddingCache.hash_input(cast(str | Image, inputs[i])) for i in embeddable_indices
+        ]
+        embeddings: list[Vector | None] = [None] * len(inputs)
+        for i, vector in zip(
+            embeddable_indices, self._persistent_cache.get_vectors(self.manager.model_key, input_hashes)
+        ):
+            embeddings[i] = vector
+        missing_items = [
+            (i, input_hash) for i, input_hash in zip(embeddable_indices, input_hashes) if embeddings[i] is None
+        ]
+        new_embeddings = cast(list[Vector], self.manager.embed([inputs[i] for i, _ in missing_items]))
+        for (i, _), vector in zip(missing_items, new_embeddings):
+            embeddings[i] = vector
+        self._persistent_cache.put_vectors(
+            self.manager.model_key, [input_hash for _, input_hash in missing_items], new_embeddings
+        )
+        return embeddings
+
     @override
     def embed(self, input_: ImageData, context: ExecutionContext) -> Vector:
         return self.embed_multiple([input_], context)[0]
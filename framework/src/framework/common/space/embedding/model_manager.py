@@ -13,6 +13,7 @@
 # limitations under the License.
 
 from abc import ABC, abstractmethod
+from functools import partial
 from pathlib import Path
 
 import numpy as np
@@ -21,6 +22,17 @@ from PIL.Image import Image
 
 from superlinked.framework.common.data_types import Vector
 from superlinked.framework.common.settings import Settings
+from superlinked.framework.common.space.embedding.embedding_scheduler import (
+    EmbeddingScheduler,
+    EmbeddingThroughputMetrics,
+)
+from superlinked.framework.common.space.embedding.embedding_worker_pool import (
+    EmbeddingWorkerPool,
+)
+from superlinked.framework.common.util.gpu_embedding_util import (
+    CPU_DEVICE_TYPE,
+    GpuEmbeddingUtil,
+)
 
 SENTENCE_TRANSFORMERS_ORG_NAME = "sentence-transformers"
 DEFAULT_MODEL_CACHE_DIR = (Path.home() / ".cache" / SENTENCE_TRANSFORMERS_ORG_NAME).absolute().as_posix()
@@ -30,6 +42,18 @@ class ModelManager(ABC):
     def __init__(self, model_name: str, model_cache_dir: Path | None = None) -> None:
         self._model_name = model_name
         self._model_cache_dir = self.__get_cache_folder(model_cache_dir)
+        settings = Settings()
+        self._scheduler = EmbeddingScheduler[list[float] | np.ndarray](
+            settings.EMBEDDING_MICRO_BATCH_SIZE, settings.EMBEDDING_MICRO_BATCH_MAX_CHARACTERS
+        )
+
+    @property
+    def throughput_metrics(self) -> EmbeddingThroughputMetrics:
+        return self._scheduler.metrics
+
+    @property
+    def model_key(self) -> str:
+        return f"{type(self).__name__}:{self._model_name}"
 
     def embed(self, inputs: Sequence[str | Image | None]) -> list[Vector | None]:
         inputs_without_nones = [input_ for input_ in inputs if input_ is not None]
@@ -42,8 +66,27 @@ class ModelManager(ABC):
             result.insert(index, None)
         return result
 
+    def _embed(self, inputs: Sequence[str | Image]) -> list[list[float]] | list[np.ndarray]:
+        device_type = GpuEmbeddingUtil.get_device_type(len(inputs))
+        worker_pool = (
+            EmbeddingWorkerPool.get_pool(type(self), self._model_name, self._model_cache_dir)
+            if device_type == CPU_DEVICE_TYPE
+            else None
+        )
+        embed_batches = (
+            worker_pool.embed_batches
+            if worker_pool is not None
+            else partial(self.__embed_batches_locally, device_type=device_type)
+        )
+        return self._scheduler.schedule(inputs, embed_batches)  # type: ignore[return-value]
+
+    def __embed_batches_locally(
+        self, batches: Sequence[list[str | Image]], device_type: str
+    ) -> list[list[list[float]] | list[np.ndarray]]:
+        return [self.embed_batch(batch, device_type) for batch in batches]
+
     @abstractmethod
-    def _embed(self, inputs: Sequence[str | Image]) -> list[list[float]] | list[np.ndarray]: ...
+    def embed_batch(self, inputs: list[str | Image], device_type: str) -> list[list[float]] | list[np.ndarray]: ...
 
     @abstractmethod
     def calculate_length(self) -> int: ...
@@ -15,7 +15,7 @@
 import math
 
 import numpy as np
-from beartype.typing import cast
+from beartype.typing import Sequence, cast
 from typing_extensions import TypeVar, override
 
 from superlinked.framework.common.dag.context import ExecutionContext
@@ -28,6 +28,7 @@ from superlinked.framework.common.space.config.embedding.number_embedding_config
 from superlinked.framework.common.space.embedding.embedding import InvertibleEmbedding
 
 NumberT = TypeVar("NumberT", int, float)
+NEGATIVE_FILTER_INDICES = frozenset({2})
 
 
 class NumberEmbedding(InvertibleEmbedding[NumberT, NumberEmbeddingConfig]):
@@ -49,30 +50,28 @@ class NumberEmbedding(InvertibleEmbedding[NumberT, NumberEmbeddingConfig]):
 
     @override
     def embed(self, input_: float, context: ExecutionContext) -> Vector:
-        if (
-            input_ < self._config.min_value
-            and self._config.mode
-            in {
-                Mode.MAXIMUM,
-                Mode.SIMILAR,
-            }
-        ) or (
-            input_ > self._config.max_value
-            and self._config.mode
-            in {
-                Mode.MINIMUM,
-                Mode.SIMILAR,
-            }
-        ):
-            return Vector(list(self._value_when_out_of_bounds), {2})
-        transformed_input = self._transform_to_log_if_logarithmic(input_)
+        return self.embed_multiple([input_], context)[0]
+
+    @override
+    def embed_multiple(self, inputs: Sequence[float], context: ExecutionContext) -> list[Vector]:
+        values = np.asarray(inputs, dtype=np.float64)
+        clipped_values = np.clip(values, self._config.min_value, self._config.max_value)
+        transformed_inputs = self._transform_array_to_log_if_logarithmic(clipped_values)
         transformed_min = self._transform_to_log_if_logarithmic(self._config.min_value)
         transformed_max = self._transform_to_log_if_logarithmic(self._config.max_value)
-        constrained_input: float = min(max(transformed_min, transformed_input), transformed_max)
-        normalized_input = (constrained_input - transformed_min) / (transformed_max - transformed_min)
-        angle_in_radians = normalized_input * self._circle_size_in_rad
-        vector_input = np.array([math.sin(angle_in_radians), math.cos(angle_in_radians)])
-        return Vector(np.append(vector_input, [0.0]), {2})
+        normalized_inputs = (transformed_inputs - transformed_min) / (transformed_max - transformed_min)
+        angles_in_radians = normalized_inputs * self._circle_size_in_rad
+        vectors = np.column_stack([np.sin(angles_in_radians), np.cos(angles_in_radians), np.zeros(len(values))])
+        vectors[self._get_out_of_bounds_mask(values)] = self._value_when_out_of_bounds
+        return [Vector(vector, NEGATIVE_FILTER_INDICES) for vector in vectors]
+
+    def _get_out_of_bounds_mask(self, values: np.ndarray) -> np.ndarray:
+        out_of_bounds = np.zeros(len(values), dtype=bool)
+        if self._config.mode in {Mode.MAXIMUM, Mode.SIMILAR}:
+            out_of_bounds |= values < self._config.min_value
+        if self._config.mode in {Mode.MINIMUM, Mode.SIMILAR}:
+            out_of_bounds |= values > self._config.max_value
+        return out_of_bounds
 
     @override
     def inverse_embed(self, vector: Vector, context: ExecutionContext) -> NumberT:
@@ -106,6 +105,11 @@ class NumberEmbedding(InvertibleEmbedding[NumberT, NumberEmbeddingConfig]):
             math.log(1 + value, self._config.scale.base) if isinstance(self._config.scale, LogarithmicScale) else value
         )
 
+    def _transform_array_to_log_if_logarithmic(self, values: np.ndarray) -> np.ndarray:
+        if isinstance(self._config.scale, LogarithmicScale):
+            return np.log(1 + values) / math.log(self._config.scale.base)
+        return values
+
     def _transform_from_log_if_logarithmic(self, value: float) -> float:
         return round(
             (self._config.scale.base**value - 1 if isinstance(self._config.scale, LogarithmicScale) else value),
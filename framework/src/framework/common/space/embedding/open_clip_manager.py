@@ -12,32 +12,40 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from __future__ import annotations
+
 from functools import lru_cache
 from pathlib import Path
 
 import numpy as np
-import torch
-from beartype.typing import Any, Sequence, cast
-from open_clip.factory import create_model_and_transforms, get_tokenizer
-from open_clip.model import CLIP
-from open_clip.tokenizer import HFTokenizer, SimpleTokenizer
+from beartype.typing import TYPE_CHECKING, Any, Sequence, cast
 from PIL.Image import Image
-from torchvision.transforms.transforms import Compose  # type:ignore[import-untyped]
 from typing_extensions import override
 
 from superlinked.framework.common.space.embedding.model_manager import ModelManager
-from superlinked.framework.common.util.gpu_embedding_util import GpuEmbeddingUtil
+from superlinked.framework.common.util.gpu_embedding_util import CPU_DEVICE_TYPE
+
+if TYPE_CHECKING:
+    import torch
+    from open_clip.model import CLIP
+    from open_clip.tokenizer import HFTokenizer, SimpleTokenizer
+    from torchvision.transforms.transforms import (  # type:ignore[import-untyped]
+        Compose,
+    )
 
 
 class OpenClipManager(ModelManager):
     @override
     def calculate_length(self) -> int:
-        embedding_model, _ = self._get_embedding_model(0)
+        embedding_model, _ = self._get_embedding_model(CPU_DEVICE_TYPE)
         return len(self.encode_texts([""], embedding_model)[0])
 
     @override
-    def _embed(self, inputs: Sequence[str | Image]) -> list[list[float]] | list[np.ndarray]:
-        embedding_model, preprocess_val = self._get_embedding_model(len(inputs))
+    def embed_batch(self, inputs: list[str | Image], device_type: str) -> list[list[float]] | list[np.ndarray]:
+        # torch and open_clip take seconds to import, so they are loaded with the first embedding
+        import torch  # pylint: disable=import-outside-toplevel
+
+        embedding_model, preprocess_val = self._get_embedding_model(device_type)
         text_inputs, image_inputs = self._categorize_inputs(inputs)
         self._validate_inputs(inputs)
         with torch.no_grad():
@@ -46,8 +54,7 @@ class OpenClipManager(ModelManager):
         encodings = self._combine_encodings(inputs, text_encodings, image_encodings)
         return [self._normalize_encoding(encoding).tolist() for encoding in encodings]
 
-    def _get_embedding_model(self, number_of_inputs: int) -> tuple[CLIP, Compose]:
-        device_type = GpuEmbeddingUtil.get_device_type(number_of_inputs)
+    def _get_embedding_model(self, device_type: str) -> tuple[CLIP, Compose]:
         return OpenClipModelCache.initialize_model(self._model_name, device_type, self._model_cache_dir)
 
     def _categorize_inputs(self, inputs: Sequence[str | Image]) -> tuple[list[str], list[Image]]:
@@ -74,6 +81,8 @@ class OpenClipManager(ModelManager):
         return encoding / encoding.norm(dim=-1, keepdim=True)
 
     def encode_texts(self, texts: list[str], embedding_model: CLIP) -> torch.Tensor:
+        import torch  # pylint: disable=import-outside-toplevel
+
         if not texts:
             return torch.Tensor()
         tokenizer = OpenClipModelCache.initialize_tokenizer(self._model_name)
@@ -81,6 +90,8 @@ class OpenClipManager(ModelManager):
         return embedding_model.encode_text(texts_tokenized)
 
     def encode_images(self, images: list[Any], embedding_model: CLIP, preprocess_val: Compose) -> torch.Tensor:
+        import torch  # pylint: disable=import-outside-toplevel
+
         if not images:
             return torch.Tensor()
         images_to_process = torch.tensor(np.stack([preprocess_val(image) for image in images]))
@@ -91,8 +102,12 @@ class OpenClipModelCache:
     @staticmethod
     @lru_cache(maxsize=10)
     def initialize_model(model_name: str, device: str, cache_dir: Path) -> tuple[CLIP, Compose]:
+        from open_clip.factory import (  # pylint: disable=import-outside-toplevel
+            create_model_and_transforms,
+        )
+
         model, _, preprocess_val = cast(
-            tuple[CLIP, Any, Compose],
+            "tuple[CLIP, Any, Compose]",
             create_model_and_transforms(model_name, device=device, cache_dir=str(cache_dir)),
         )
         return model, preprocess_val
@@ -100,4 +115,6 @@ class OpenClipModelCache:
     @staticmethod
     @lru_cache(maxsize=10)
     def initialize_tokenizer(model_name: str) -> HFTokenizer | SimpleTokenizer:
+        from open_clip.factory import get_tokenizer  # pylint: disable=import-outside-toplevel
+
         return get_tokenizer(model_name)
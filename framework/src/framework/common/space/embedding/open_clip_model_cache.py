@@ -12,22 +12,32 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from __future__ import annotations
+
 from functools import lru_cache
 from pathlib import Path
 
-from beartype.typing import Any, cast
-from open_clip.factory import create_model_and_transforms, get_tokenizer
-from open_clip.model import CLIP
-from open_clip.tokenizer import HFTokenizer, SimpleTokenizer
-from torchvision.transforms.transforms import Compose  # type:ignore[import-untyped]
+from beartype.typing import TYPE_CHECKING, Any, cast
+
+if TYPE_CHECKING:
+    from open_clip.model import CLIP
+    from open_clip.tokenizer import HFTokenizer, SimpleTokenizer
+    from torchvision.transforms.transforms import (  # type:ignore[import-untyped]
+        Compose,
+    )
 
 
 class OpenClipModelCache:
     @staticmethod
     @lru_cache(maxsize=10)
     def initialize_model(model_name: str, device: str, cache_dir: Path) -> tuple[CLIP, Compose]:
+        # open_clip pulls in torch and transformers, so it is only imported once a model is needed
+        from open_clip.factory import (  # pylint: disable=import-outside-toplevel
+            create_model_and_transforms,
+        )
+
         model, _, preprocess_val = cast(
-            tuple[CLIP, Any, Compose],
+            "tuple[CLIP, Any, Compose]",
             create_model_and_transforms(model_name, device=device, cache_dir=str(cache_dir)),
         )
         return model, preprocess_val
@@ -35,4 +45,6 @@ class OpenClipModelCache:
     @staticmethod
     @lru_cache(maxsize=10)
     def initialize_tokenizer(model_name: str) -> HFTokenizer | SimpleTokenizer:
+        from open_clip.factory import get_tokenizer  # pylint: disable=import-outside-toplevel
+
         return get_tokenizer(model_name)
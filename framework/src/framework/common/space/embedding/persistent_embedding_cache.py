@@ -0,0 +1,167 @@
+# Copyright 2024 Superlinked, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import threading
+import time
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+import structlog
+from beartype.typing import Sequence
+from PIL.Image import Image
+
+from superlinked.framework.common.data_types import Vector
+from superlinked.framework.common.settings import Settings
+
+logger = structlog.getLogger()
+
+CACHE_FILE_NAME = "embedding_cache.sqlite"
+SQLITE_MAX_PARAMETER_COUNT = 500
+SQLITE_BUSY_TIMEOUT_SECONDS = 30.0
+
+
+class PersistentEmbeddingCache:
+    """
+    On-disk embedding store shared by every process pointing at the same directory.
+    Vectors are kept as float32 keyed by (model key, input hash); once `max_entries`
+    is exceeded the least recently used entries are evicted.
+    """
+
+    def __init__(self, cache_dir: Path, max_entries: int) -> None:
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            cache_dir / CACHE_FILE_NAME,
+            timeout=SQLITE_BUSY_TIMEOUT_SECONDS,
+            check_same_thread=False,
+            isolation_level=None,
+        )
+        self._init_database()
+        self._hit_count = 0
+        self._miss_count = 0
+
+    @property
+    def hit_count(self) -> int:
+        return self._hit_count
+
+    @property
+    def miss_count(self) -> int:
+        return self._miss_count
+
+    @classmethod
+    def from_settings(cls) -> PersistentEmbeddingCache | None:
+        settings = Settings()
+        if not settings.EMBEDDING_CACHE_DIR:
+            return None
+        return cls._get_instance(settings.EMBEDDING_CACHE_DIR, settings.EMBEDDING_CACHE_MAX_ENTRIES)
+
+    @classmethod
+    @lru_cache(maxsize=4)
+    def _get_instance(cls, cache_dir: str, max_entries: int) -> PersistentEmbeddingCache:
+        return cls(Path(cache_dir), max_entries)
+
+    @staticmethod
+    def hash_input(input_: str | Image) -> bytes:
+        if isinstance(input_, str):
+            return hashlib.sha256(b"text:" + input_.encode("utf-8")).digest()
+        digest = hashlib.sha256(f"image:{input_.mode}:{input_.size}:".encode("utf-8"))
+        digest.update(input_.tobytes())
+        return digest.digest()
+
+    def get_vectors(self, model_key: str, input_hashes: Sequence[bytes]) -> list[Vector | None]:
+        vector_by_hash: dict[bytes, Vector] = {}
+        with self._lock:
+            for start in range(0, len(input_hashes), SQLITE_MAX_PARAMETER_COUNT):
+                hash_chunk = list(set(input_hashes[start : start + SQLITE_MAX_PARAMETER_COUNT]))
+                rows = self._connection.execute(
+                    "SELECT input_hash, vector FROM embedding WHERE model_key = ? AND input_hash IN "
+                    + f"({', '.join('?' * len(hash_chunk))})",
+                    [model_key, *hash_chunk],
+                ).fetchall()
+                vector_by_hash.update((input_hash, self._to_vector(blob)) for input_hash, blob in rows)
+            if vector_by_hash:
+                self._touch(model_key, list(vector_by_hash))
+        vectors = [vector_by_hash.get(input_hash) for input_hash in input_hashes]
+        hit_count = sum(vector is not None for vector in vectors)
+        self._hit_count += hit_count
+        self._miss_count += len(vectors) - hit_count
+        logger.debug(
+            "looked up persistent embedding cache",
+            model_key=model_key,
+            hit_count=hit_count,
+            miss_count=len(vectors) - hit_count,
+        )
+        return vectors
+
+    def put_vectors(self, model_key: str, input_hashes: Sequence[bytes], vectors: Sequence[Vector]) -> None:
+        if not input_hashes:
+            return
+        access_time = time.time_ns()
+        rows = [
+            (model_key, input_hash, np.asarray(vector.value, dtype=np.float32).tobytes(), access_time)
+            for input_hash, vector in zip(input_hashes, vectors)
+        ]
+        with self._lock:
+            self._connection.execute("BEGIN IMMEDIATE")
+            try:
+                self._connection.executemany(
+                    "INSERT OR REPLACE INTO embedding (model_key, input_hash, vector, last_access) VALUES (?, ?, ?, ?)",
+                    rows,
+                )
+                self._evict()
+                self._connection.execute("COMMIT")
+            except sqlite3.Error:
+                self._connection.execute("ROLLBACK")
+                raise
+
+    def _init_database(self) -> None:
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS embedding ("
+            + "model_key TEXT NOT NULL, input_hash BLOB NOT NULL, vector BLOB NOT NULL, "
+            + "last_access INTEGER NOT NULL, PRIMARY KEY (model_key, input_hash))"
+        )
+        self._connection.execute("CREATE INDEX IF NOT EXISTS embedding_last_access ON embedding (last_access)")
+
+    def _touch(self, model_key: str, input_hashes: list[bytes]) -> None:
+        access_time = time.time_ns()
+        self._connection.execute("BEGIN IMMEDIATE")
+        try:
+            self._connection.executemany(
+                "UPDATE embedding SET last_access = ? WHERE model_key = ? AND input_hash = ?",
+                [(access_time, model_key, input_hash) for input_hash in input_hashes],
+            )
+            self._connection.execute("COMMIT")
+        except sqlite3.Error:
+            self._connection.execute("ROLLBACK")
+            raise
+
+    def _evict(self) -> None:
+        (entry_count,) = self._connection.execute("SELECT COUNT(*) FROM embedding").fetchone()
+        if (overflow := entry_count - self._max_entries) > 0:
+            self._connection.execute(
+                "DELETE FROM embedding WHERE rowid IN (SELECT rowid FROM embedding ORDER BY last_access LIMIT ?)",
+                (overflow,),
+            )
+
+    def _to_vector(self, blob: bytes) -> Vector:
+        return Vector(np.frombuffer(blob, dtype=np.float32).astype(np.float64))
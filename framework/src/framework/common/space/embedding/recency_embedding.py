@@ -14,7 +14,6 @@
 
 import math
 from datetime import datetime, timedelta
-from functools import reduce
 
 import numpy as np
 from beartype.typing import Sequence
@@ -54,17 +53,28 @@ class RecencyEmbedding(InvertibleEmbedding[int, RecencyEmbeddingConfig]):
 
     @override
     def embed(self, input_: int, context: ExecutionContext) -> Vector:
-        return reduce(
-            lambda a, b: a.concatenate(b),
-            (
-                self.calc_recency_vector_for_period_time(
-                    input_,
-                    period_time_param,
-                    context,
-                )
-                for period_time_param in self._period_time_list
-            ),
-        )
+        return self.embed_multiple([input_], context)[0]
+
+    @override
+    def embed_multiple(self, inputs: Sequence[int], context: ExecutionContext) -> list[Vector]:
+        created_ats = np.asarray(inputs, dtype=np.int64)
+        now = context.now()
+        time_period_end = self._calculate_time_period_end(now)
+        columns: list[np.ndarray] = []
+        negative_filter_indices: set[int] = set()
+        for period_time in self._period_time_list:
+            time_period_start = self._calculate_time_period_start(period_time, now)
+            in_time_scope = (time_period_start <= created_ats) & (created_ats <= time_period_end)
+            normalized_time_elapsed = (created_ats - time_period_start) / (time_period_end - time_period_start)
+            angles_in_radians = normalized_time_elapsed * math.pi / 2
+            columns.append(np.where(in_time_scope, np.cos(angles_in_radians) * period_time.weight, 0.0))
+            columns.append(np.where(in_time_scope, np.sin(angles_in_radians) * period_time.weight, 0.0))
+            if period_time.period_time == self.max_period_time.period_time:
+                negative_filter_indices.add(len(columns))
+                columns.append(self._calculate_z_values(in_time_scope, context))
+        vectors = np.column_stack(columns)
+        frozen_negative_filter_indices = frozenset(negative_filter_indices)
+        return [Vector(vector, frozen_negative_filter_indices) for vector in vectors]
 
     @override
     def inverse_embed(self, vector: Vector, context: ExecutionContext) -> int:
@@ -91,50 +101,10 @@ class RecencyEmbedding(InvertibleEmbedding[int, RecencyEmbeddingConfig]):
     def needs_inversion_before_aggregation(self) -> bool:
         return True
 
-    def calc_recency_vector_for_period_time(
-        self,
-        created_at: int,
-        period_time: PeriodTime,
-        context: ExecutionContext,
-    ) -> Vector:
-        time_period_start: int = self._calculate_time_period_start(period_time, context.now())
-        time_period_end: int = self._calculate_time_period_end(context.now())
-        out_of_time_scope = not time_period_start <= created_at <= time_period_end
-        z_value = self.calculate_z_value(period_time, context, out_of_time_scope)
-        if out_of_time_scope:
-            x_value = y_value = 0.0
-        else:
-            time_elapsed: int = created_at - time_period_start
-            normalized_time_elapsed = time_elapsed / (time_period_end - time_period_start)
-            x_value = math.cos(normalized_time_elapsed * math.pi / 2) * period_time.weight
-            y_value = math.sin(normalized_time_elapsed * math.pi / 2) * period_time.weight
-
-        return self._build_vector(x_value, y_value, z_value)
-
-    def calculate_z_value(
-        self,
-        period_time: PeriodTime,
-        context: ExecutionContext,
-        out_of_time_scope: bool,
-    ) -> float | None:
-        if period_time.period_time == self.max_period_time.period_time:
-            if context.is_query_context:
-                z_value = 1.0
-            elif out_of_time_scope:
-                z_value = self._config.negative_filter
-            else:
-                z_value = 0.0
-        else:
-            z_value = None
-        return z_value
-
-    def _build_vector(self, x_value: float, y_value: float, z_value: float | None) -> Vector:
-        vector_input = np.array([x_value, y_value])
-        negative_filter_indices = set()
-        if z_value is not None:
-            vector_input = np.append(vector_input, np.array([z_value]))
-            negative_filter_indices.add(2)
-        return Vector(vector_input, negative_filter_indices)
+    def _calculate_z_values(self, in_time_scope: np.ndarray, context: ExecutionContext) -> np.ndarray:
+        if context.is_query_context:
+            return np.ones(len(in_time_scope))
+        return np.where(in_time_scope, 0.0, self._config.negative_filter)
 
     def _calculate_time_period_start(self, period_time: PeriodTime, now_ts: int) -> int:
         expiry_date = self.__get_expiry_date(now_ts)
@@ -26,6 +26,9 @@ from superlinked.framework.common.space.config.embedding.text_similarity_embeddi
 )
 from superlinked.framework.common.space.embedding.embedding import Embedding
 from superlinked.framework.common.space.embedding.embedding_cache import EmbeddingCache
+from superlinked.framework.common.space.embedding.persistent_embedding_cache import (
+    PersistentEmbeddingCache,
+)
 from superlinked.framework.common.space.embedding.sentence_transformer_manager import (
     SentenceTransformerManager,
 )
@@ -41,7 +44,11 @@ class SentenceTransformerEmbedding(Embedding[str, TextSimilarityEmbeddingConfig]
     ) -> None:
         super().__init__(embedding_config)
         self.manager = SentenceTransformerManager(self._config.model_name, model_cache_dir)
-        self._cache = EmbeddingCache(self._config.cache_size)
+        self._cache = EmbeddingCache(
+            self._config.cache_size,
+            self.manager.model_key,
+            PersistentEmbeddingCache.from_settings(),
+        )
 
     @override
     def embed_multiple(self, inputs: Sequence[str], context: ExecutionContext) -> list[Vector]:
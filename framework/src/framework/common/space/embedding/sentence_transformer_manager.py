@@ -13,11 +13,12 @@
 # limitations under the License.
 
 
+from __future__ import annotations
+
 import numpy as np
 import structlog
-from beartype.typing import Sequence
+from beartype.typing import TYPE_CHECKING, Sequence
 from PIL.Image import Image
-from sentence_transformers import SentenceTransformer
 from typing_extensions import override
 
 from superlinked.framework.common.data_types import Vector
@@ -26,20 +27,22 @@ from superlinked.framework.common.space.embedding.model_manager import ModelMana
 from superlinked.framework.common.space.embedding.sentence_transformer_model_cache import (
     SentenceTransformerModelCache,
 )
-from superlinked.framework.common.util.gpu_embedding_util import GpuEmbeddingUtil
+
+if TYPE_CHECKING:
+    from sentence_transformers import SentenceTransformer
 
 logger = structlog.getLogger()
 
 
 class SentenceTransformerManager(ModelManager):
-
     @override
-    def _embed(self, inputs: Sequence[str | Image]) -> list[list[float]] | list[np.ndarray]:
-        model = self._get_embedding_model(len(inputs))
+    def embed_batch(self, inputs: list[str | Image], device_type: str) -> list[list[float]] | list[np.ndarray]:
+        return self._encode(self._get_embedding_model(device_type), inputs)
 
+    def _encode(self, model: SentenceTransformer, inputs: list[str | Image]) -> list[list[float]]:
         try:
             embeddings = model.encode(
-                list(inputs),  # type: ignore[arg-type] # it also accepts Image
+                inputs,  # type: ignore[arg-type] # it also accepts Image
             )
         except RuntimeError as e:
             if "The size of tensor a" in str(e) and "must match the size of tensor b" in str(e):
@@ -61,6 +64,5 @@ class SentenceTransformerManager(ModelManager):
     def calculate_length(self) -> int:
         return SentenceTransformerModelCache.calculate_length(self._model_name, self._model_cache_dir)
 
-    def _get_embedding_model(self, number_of_inputs: int) -> SentenceTransformer:
-        device_type = GpuEmbeddingUtil.get_device_type(number_of_inputs)
+    def _get_embedding_model(self, device_type: str) -> SentenceTransformer:
         return SentenceTransformerModelCache.initialize_model(self._model_name, device_type, self._model_cache_dir)
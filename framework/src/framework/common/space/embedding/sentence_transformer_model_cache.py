@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from __future__ import annotations
+
 import json
 import os
 from functools import lru_cache
@@ -19,11 +21,8 @@ from pathlib import Path
 from time import sleep
 
 import structlog
-from beartype.typing import Any
+from beartype.typing import TYPE_CHECKING, Any
 from filelock import FileLock
-from huggingface_hub import snapshot_download
-from huggingface_hub.file_download import repo_folder_name
-from sentence_transformers import SentenceTransformer
 
 from superlinked.framework.common.settings import Settings
 from superlinked.framework.common.space.embedding.model_manager import (
@@ -31,6 +30,9 @@ from superlinked.framework.common.space.embedding.model_manager import (
 )
 from superlinked.framework.common.util.gpu_embedding_util import CPU_DEVICE_TYPE
 
+if TYPE_CHECKING:
+    from sentence_transformers import SentenceTransformer
+
 logger = structlog.getLogger()
 
 MODEL_DIMENSION = "hidden_size"
@@ -47,6 +49,11 @@ class SentenceTransformerModelCache:
         device: str,
         model_cache_dir: Path,
     ) -> SentenceTransformer:
+        # sentence_transformers pulls in torch and transformers, so it is only imported once a model is needed
+        from sentence_transformers import (  # pylint: disable=import-outside-toplevel
+            SentenceTransformer,
+        )
+
         cls._ensure_model_downloaded(model_name, model_cache_dir)
         common_params: dict[str, Any] = {
             "model_name_or_path": model_name,
@@ -90,6 +97,10 @@ class SentenceTransformerModelCache:
         retry_delay = settings.SENTENCE_TRANSFORMERS_MODEL_LOCK_RETRY_DELAY
         timeout = max((max_retries * retry_delay) - 10, 5)
 
+        from huggingface_hub import (  # pylint: disable=import-outside-toplevel
+            snapshot_download,
+        )
+
         for attempt in range(max_retries):
             try:
                 with FileLock(lock_file_path, timeout=timeout):
@@ -138,6 +149,10 @@ class SentenceTransformerModelCache:
 
     @classmethod
     def _get_model_folder_path(cls, model_name: str, model_cache_dir: Path) -> Path:
+        from huggingface_hub.file_download import (  # pylint: disable=import-outside-toplevel
+            repo_folder_name,
+        )
+
         return model_cache_dir / repo_folder_name(repo_id=cls._get_repo_id(model_name), repo_type="model")
 
     @classmethod
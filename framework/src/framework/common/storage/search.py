@@ -13,6 +13,7 @@
 # limitations under the License.
 
 
+import asyncio
 from abc import ABC, abstractmethod
 
 from beartype.typing import Generic, Sequence, TypeVar, cast
@@ -40,10 +41,51 @@ class Search(ABC, Generic[SearchParamsT, QuertT, KNNReturnT]):
         returned_fields: Sequence[Field],
         search_params: SearchParamsT,
     ) -> KNNReturnT:
+        return self.knn_search(index_config, self._build_checked_query(index_config, returned_fields, search_params))
+
+    def knn_search_batch_with_checks(
+        self,
+        index_config: IndexConfig,
+        returned_fields: Sequence[Field],
+        search_params_list: Sequence[SearchParamsT],
+    ) -> Sequence[KNNReturnT]:
+        queries = [
+            self._build_checked_query(index_config, returned_fields, search_params)
+            for search_params in search_params_list
+        ]
+        return self.knn_search_batch(index_config, queries)
+
+    async def aknn_search_with_checks(
+        self,
+        index_config: IndexConfig,
+        returned_fields: Sequence[Field],
+        search_params: SearchParamsT,
+    ) -> KNNReturnT:
+        return await self.aknn_search(
+            index_config, self._build_checked_query(index_config, returned_fields, search_params)
+        )
+
+    async def aknn_search_batch_with_checks(
+        self,
+        index_config: IndexConfig,
+        returned_fields: Sequence[Field],
+        search_params_list: Sequence[SearchParamsT],
+    ) -> Sequence[KNNReturnT]:
+        queries = [
+            self._build_checked_query(index_config, returned_fields, search_params)
+            for search_params in search_params_list
+        ]
+        return await self.aknn_search_batch(index_config, queries)
+
+    def _build_checked_query(
+        self,
+        index_config: IndexConfig,
+        returned_fields: Sequence[Field],
+        search_params: SearchParamsT,
+    ) -> QuertT:
         self.check_vector_field(index_config, search_params.vector_field)
         self.check_filters(index_config, search_params.filters)
-        query = self.build_query(search_params, returned_fields)
-        return self.knn_search(index_config, query)
+        return self.build_query(search_params, returned_fields)
 
     @abstractmethod
     def build_query(self, search_params: SearchParamsT, returned_fields: Sequence[Field]) -> QuertT:
@@ -53,6 +95,18 @@ class Search(ABC, Generic[SearchParamsT, QuertT, KNNReturnT]):
     def knn_search(self, index_config: IndexConfig, query: QuertT) -> KNNReturnT:
         pass
 
+    def knn_search_batch(self, index_config: IndexConfig, queries: Sequence[QuertT]) -> Sequence[KNNReturnT]:
+        return [self.knn_search(index_config, query) for query in queries]
+
+    async def aknn_search(self, index_config: IndexConfig, query: QuertT) -> KNNReturnT:
+        """
+        Runs `knn_search` in a worker thread. Override this method in subclasses that have an async client.
+        """
+        return await asyncio.to_thread(self.knn_search, index_config, query)
+
+    async def aknn_search_batch(self, index_config: IndexConfig, queries: Sequence[QuertT]) -> Sequence[KNNReturnT]:
+        return await asyncio.gather(*(self.aknn_search(index_config, query) for query in queries))
+
     @staticmethod
     def check_vector_field(index_config: IndexConfig, vector_field: VectorFieldData) -> None:
         if vector_field.value is None:
@@ -18,3 +18,4 @@ from enum import Enum
 class SearchAlgorithm(Enum):
     FLAT = "FLAT"
     HNSW = "HNSW"
+    IVF_FLAT = "IVF_FLAT"
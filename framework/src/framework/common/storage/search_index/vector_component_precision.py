@@ -17,3 +17,4 @@ from enum import Enum
 
 class VectorComponentPrecision(Enum):
     FLOAT32 = "FLOAT32"
+    FLOAT64 = "FLOAT64"
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 from abc import ABC, abstractmethod
 
 from beartype.typing import Any, Sequence
@@ -82,6 +83,11 @@ class VDBConnector(ABC):
     def close_connection(self) -> None:
         pass
 
+    async def aclose_connection(self) -> None:
+        """
+        Closes the async client of the VDB. Implement this method in subclasses that have one.
+        """
+
     @property
     @abstractmethod
     def search_index_manager(self) -> SearchIndexManager:
@@ -128,6 +134,18 @@ class VDBConnector(ABC):
     def read_entities(self, entities: Sequence[Entity]) -> Sequence[EntityData]:
         pass
 
+    async def awrite_entities(self, entity_data: Sequence[EntityData]) -> None:
+        """
+        Runs `write_entities` in a worker thread. Override this method in subclasses that have an async client.
+        """
+        await asyncio.to_thread(self.write_entities, entity_data)
+
+    async def aread_entities(self, entities: Sequence[Entity]) -> Sequence[EntityData]:
+        """
+        Runs `read_entities` in a worker thread. Override this method in subclasses that have an async client.
+        """
+        return await asyncio.to_thread(self.read_entities, entities)
+
     def knn_search(
         self,
         index_name: str,
@@ -136,19 +154,59 @@ class VDBConnector(ABC):
         vdb_knn_search_params: VDBKNNSearchParams,
         **params: Any,
     ) -> Sequence[ResultEntityData]:
+        search_params = self._apply_default_limit(vdb_knn_search_params)
+        return self._knn_search(index_name, schema_name, returned_fields, search_params, **params)
+
+    def knn_search_batch(
+        self,
+        index_name: str,
+        schema_name: str,
+        returned_fields: Sequence[Field],
+        vdb_knn_search_params_list: Sequence[VDBKNNSearchParams],
+        **params: Any,
+    ) -> list[Sequence[ResultEntityData]]:
+        search_params_list = [
+            self._apply_default_limit(vdb_knn_search_params) for vdb_knn_search_params in vdb_knn_search_params_list
+        ]
+        return self._knn_search_batch(index_name, schema_name, returned_fields, search_params_list, **params)
+
+    async def aknn_search(
+        self,
+        index_name: str,
+        schema_name: str,
+        returned_fields: Sequence[Field],
+        vdb_knn_search_params: VDBKNNSearchParams,
+        **params: Any,
+    ) -> Sequence[ResultEntityData]:
+        search_params = self._apply_default_limit(vdb_knn_search_params)
+        return await self._aknn_search(index_name, schema_name, returned_fields, search_params, **params)
+
+    async def aknn_search_batch(
+        self,
+        index_name: str,
+        schema_name: str,
+        returned_fields: Sequence[Field],
+        vdb_knn_search_params_list: Sequence[VDBKNNSearchParams],
+        **params: Any,
+    ) -> list[Sequence[ResultEntityData]]:
+        search_params_list = [
+            self._apply_default_limit(vdb_knn_search_params) for vdb_knn_search_params in vdb_knn_search_params_list
+        ]
+        return await self._aknn_search_batch(index_name, schema_name, returned_fields, search_params_list, **params)
+
+    def _apply_default_limit(self, vdb_knn_search_params: VDBKNNSearchParams) -> VDBKNNSearchParams:
         # If the limit is set to the default, assign it a database-specific default value
         limit = (
             self._default_search_limit
             if vdb_knn_search_params.limit == constants.DEFAULT_LIMIT
             else vdb_knn_search_params.limit
         )
-        search_params = VDBKNNSearchParams(
+        return VDBKNNSearchParams(
             vector_field=vdb_knn_search_params.vector_field,
             limit=limit,
             filters=vdb_knn_search_params.filters,
             radius=vdb_knn_search_params.radius,
         )
-        return self._knn_search(index_name, schema_name, returned_fields, search_params, **params)
 
     @abstractmethod
     def _knn_search(
@@ -161,5 +219,52 @@ class VDBConnector(ABC):
     ) -> Sequence[ResultEntityData]:
         pass
 
+    def _knn_search_batch(
+        self,
+        index_name: str,
+        schema_name: str,
+        returned_fields: Sequence[Field],
+        vdb_knn_search_params_list: Sequence[VDBKNNSearchParams],
+        **params: Any,
+    ) -> list[Sequence[ResultEntityData]]:
+        """
+        Executes the searches one by one. Override this method in subclasses
+        if the VDB can serve multiple searches in one round trip.
+        """
+        return [
+            self._knn_search(index_name, schema_name, returned_fields, vdb_knn_search_params, **params)
+            for vdb_knn_search_params in vdb_knn_search_params_list
+        ]
+
+    async def _aknn_search(
+        self,
+        index_name: str,
+        schema_name: str,
+        returned_fields: Sequence[Field],
+        vdb_knn_search_params: VDBKNNSearchParams,
+        **params: Any,
+    ) -> Sequence[ResultEntityData]:
+        """
+        Runs `_knn_search` in a worker thread. Override this method in subclasses that have an async client.
+        """
+        return await asyncio.to_thread(
+            self._knn_search, index_name, schema_name, returned_fields, vdb_knn_search_params, **params
+        )
+
+    async def _aknn_search_batch(
+        self,
+        index_name: str,
+        schema_name: str,
+        returned_fields: Sequence[Field],
+        vdb_knn_search_params_list: Sequence[VDBKNNSearchParams],
+        **params: Any,
+    ) -> list[Sequence[ResultEntityData]]:
+        """
+        Runs `_knn_search_batch` in a worker thread. Override this method in subclasses that have an async client.
+        """
+        return await asyncio.to_thread(
+            self._knn_search_batch, index_name, schema_name, returned_fields, vdb_knn_search_params_list, **params
+        )
+
     def _get_index_config(self, index_name: str) -> IndexConfig:
         return self.search_index_manager.get_index_config(index_name)
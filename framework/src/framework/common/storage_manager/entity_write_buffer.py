@@ -0,0 +1,72 @@
+# Copyright 2024 Superlinked, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from dataclasses import dataclass
+from threading import Lock
+
+from beartype.typing import Sequence
+
+from superlinked.framework.common.storage.entity.entity import Entity
+from superlinked.framework.common.storage.entity.entity_data import EntityData
+from superlinked.framework.common.storage.entity.entity_id import EntityId
+from superlinked.framework.common.storage.field.field_data import FieldData
+
+
+@dataclass
+class WriteBufferMetrics:
+    write_count: int = 0
+    flushed_entity_count: int = 0
+    flush_count: int = 0
+
+    @property
+    def merged_write_count(self) -> int:
+        """
+        The number of entity writes saved by merging them with other writes of the same entity.
+        """
+        return self.write_count - self.flushed_entity_count
+
+
+class EntityWriteBuffer:
+    """
+    Collects entity writes, merging the field data written to the same entity. Later writes of a field win.
+    Safe to share between the threads evaluating the same batch.
+    """
+
+    def __init__(self) -> None:
+        self._field_data_by_entity_id: dict[EntityId, dict[str, FieldData]] = {}
+        self._lock = Lock()
+        self.write_count = 0
+
+    def add(self, entity_data: Sequence[EntityData]) -> None:
+        with self._lock:
+            for ed in entity_data:
+                self._field_data_by_entity_id.setdefault(ed.id_, {}).update(ed.field_data)
+            self.write_count += len(entity_data)
+
+    def get_field_data(self, entity: Entity) -> dict[str, FieldData]:
+        """
+        The buffered field data of the fields of `entity`.
+        """
+        with self._lock:
+            buffered_field_data = self._field_data_by_entity_id.get(entity.id_, {})
+            return {name: buffered_field_data[name] for name in entity.fields if name in buffered_field_data}
+
+    def drain(self) -> list[EntityData]:
+        with self._lock:
+            entity_data = [
+                EntityData(entity_id, field_data) for entity_id, field_data in self._field_data_by_entity_id.items()
+            ]
+            self._field_data_by_entity_id = {}
+            self.write_count = 0
+        return entity_data
@@ -12,9 +12,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass
+from threading import Lock
 
-from beartype.typing import Any, Sequence, TypeVar, cast
+import structlog
+from beartype.typing import Any, Iterator, Mapping, Sequence, TypeVar, cast
 
 from superlinked.framework.common.dag.index_node import IndexNode
 from superlinked.framework.common.data_types import NodeDataTypes, PythonTypes
@@ -29,7 +35,9 @@ from superlinked.framework.common.schema.schema_object import (
     SchemaField,
     SchemaObject,
 )
+from superlinked.framework.common.storage.entity.entity import Entity
 from superlinked.framework.common.storage.entity.entity_data import EntityData
+from superlinked.framework.common.storage.entity.entity_id import EntityId
 from superlinked.framework.common.storage.field.field import Field
 from superlinked.framework.common.storage.field.field_data import (
     FieldData,
@@ -50,9 +58,16 @@ from superlinked.framework.common.storage.search_index.index_field_descriptor im
 )
 from superlinked.framework.common.storage.vdb_connector import VDBConnector
 from superlinked.framework.common.storage_manager.entity_builder import EntityBuilder
+from superlinked.framework.common.storage_manager.entity_write_buffer import (
+    EntityWriteBuffer,
+    WriteBufferMetrics,
+)
 from superlinked.framework.common.storage_manager.knn_search_params import (
     KNNSearchParams,
 )
+from superlinked.framework.common.storage_manager.node_result_data import (
+    NodeResultData,
+)
 from superlinked.framework.common.storage_manager.search_result_item import (
     SearchResultItem,
 )
@@ -62,6 +77,11 @@ ResultTypeT = TypeVar("ResultTypeT")
 # NodeDataValueType
 NDVT = TypeVar("NDVT", bound=PythonTypes)
 
+logger = structlog.getLogger()
+
+# a context variable instead of a thread local, so threads started with the context share the buffers
+_write_buffers: ContextVar[Mapping[StorageManager, EntityWriteBuffer]] = ContextVar("write_buffers", default={})
+
 
 @dataclass
 class SearchIndexParams:
@@ -78,10 +98,88 @@ class StorageManager:
         self._vdb_connector = vdb_connector
         self._storage_naming = StorageNaming()
         self._entity_builder = EntityBuilder(self._storage_naming)
+        self._write_buffer_metrics = WriteBufferMetrics()
+        self._write_buffer_metrics_lock = Lock()
+
+    @property
+    def write_buffer_metrics(self) -> WriteBufferMetrics:
+        return self._write_buffer_metrics
+
+    @contextmanager
+    def buffer_writes(self) -> Iterator[None]:
+        """
+        Collects the writes of the current context within the block and writes them at its end,
+        merged into one write per entity. Reads within the block see the collected writes.
+        Nested blocks are written by the outermost one. If the block raises, the writes collected until then
+        are still written, as they would have been without the buffer.
+        """
+        if self._get_write_buffer() is not None:
+            yield
+            return
+        write_buffer = EntityWriteBuffer()
+        token = _write_buffers.set({**_write_buffers.get(), self: write_buffer})
+        try:
+            yield
+        finally:
+            _write_buffers.reset(token)
+            self._flush_write_buffer(write_buffer)
+
+    def _get_write_buffer(self) -> EntityWriteBuffer | None:
+        return _write_buffers.get().get(self)
+
+    def _flush_write_buffer(self, write_buffer: EntityWriteBuffer) -> None:
+        write_count = write_buffer.write_count
+        merged_entity_data = write_buffer.drain()
+        if merged_entity_data:
+            self._vdb_connector.write_entities(merged_entity_data)
+        with self._write_buffer_metrics_lock:
+            self._write_buffer_metrics.write_count += write_count
+            self._write_buffer_metrics.flushed_entity_count += len(merged_entity_data)
+            self._write_buffer_metrics.flush_count += 1
+        logger.debug(
+            "flushed entity writes",
+            n_writes=write_count,
+            n_entities=len(merged_entity_data),
+            n_merged_writes=write_count - len(merged_entity_data),
+        )
+
+    def _write_entities(self, entity_data: Sequence[EntityData]) -> None:
+        if (write_buffer := self._get_write_buffer()) is not None:
+            write_buffer.add(entity_data)
+        else:
+            self._vdb_connector.write_entities(entity_data)
+
+    def _read_entities(self, entities: Sequence[Entity]) -> list[EntityData]:
+        """
+        Reads the entities, overlaid with the writes buffered in the current context.
+        Entities whose requested fields are all buffered are not read from the storage.
+        """
+        if (write_buffer := self._get_write_buffer()) is None:
+            return list(self._vdb_connector.read_entities(entities))
+        buffered_field_data_by_id = {entity.id_: write_buffer.get_field_data(entity) for entity in entities}
+        entities_to_read = [
+            entity for entity in entities if len(buffered_field_data_by_id[entity.id_]) < len(entity.fields)
+        ]
+        read_field_data_by_id: dict[EntityId, dict[str, FieldData]] = (
+            {
+                entity_data.id_: entity_data.field_data
+                for entity_data in self._vdb_connector.read_entities(entities_to_read)
+            }
+            if entities_to_read
+            else {}
+        )
+        return [
+            EntityData(entity.id_, read_field_data_by_id.get(entity.id_, {}) | buffered_field_data_by_id[entity.id_])
+            for entity in entities
+            if entity.id_ in read_field_data_by_id or buffered_field_data_by_id[entity.id_]
+        ]
 
     def close_connection(self) -> None:
         self._vdb_connector.close_connection()
 
+    async def aclose_connection(self) -> None:
+        await self._vdb_connector.aclose_connection()
+
     def init_search_indices(
         self,
         params_list: Sequence[SearchIndexParams],
@@ -110,28 +208,127 @@ class StorageManager:
         schema_fields_to_return: Sequence[SchemaField] | None = None,
         **params: Any,
     ) -> Sequence[SearchResultItem]:
+        return self.knn_search_batch(index_node, schema, [knn_search_params], schema_fields_to_return, **params)[0]
+
+    def knn_search_batch(
+        self,
+        index_node: IndexNode,
+        schema: IdSchemaObject,
+        knn_search_params_list: Sequence[KNNSearchParams],
+        schema_fields_to_return: Sequence[SchemaField] | None = None,
+        **params: Any,
+    ) -> list[Sequence[SearchResultItem]]:
+        index_name, returned_fields, vdb_knn_search_params_list = self._prepare_knn_search(
+            index_node, schema, knn_search_params_list, schema_fields_to_return
+        )
+        if len(vdb_knn_search_params_list) == 1:
+            search_results: Sequence[Sequence[ResultEntityData]] = [
+                self._vdb_connector.knn_search(
+                    index_name,
+                    schema._schema_name,
+                    self._get_fields_to_return(returned_fields),
+                    vdb_knn_search_params_list[0],
+                    **params,
+                )
+            ]
+        else:
+            search_results = self._vdb_connector.knn_search_batch(
+                index_name,
+                schema._schema_name,
+                self._get_fields_to_return(returned_fields),
+                vdb_knn_search_params_list,
+                **params,
+            )
+        return self._map_search_results_to_search_result_items(search_results, returned_fields)
+
+    async def aknn_search(
+        self,
+        index_node: IndexNode,
+        schema: IdSchemaObject,
+        knn_search_params: KNNSearchParams,
+        schema_fields_to_return: Sequence[SchemaField] | None = None,
+        **params: Any,
+    ) -> Sequence[SearchResultItem]:
+        return (
+            await self.aknn_search_batch(index_node, schema, [knn_search_params], schema_fields_to_return, **params)
+        )[0]
+
+    async def aknn_search_batch(
+        self,
+        index_node: IndexNode,
+        schema: IdSchemaObject,
+        knn_search_params_list: Sequence[KNNSearchParams],
+        schema_fields_to_return: Sequence[SchemaField] | None = None,
+        **params: Any,
+    ) -> list[Sequence[SearchResultItem]]:
+        index_name, returned_fields, vdb_knn_search_params_list = self._prepare_knn_search(
+            index_node, schema, knn_search_params_list, schema_fields_to_return
+        )
+        if len(vdb_knn_search_params_list) == 1:
+            search_results: Sequence[Sequence[ResultEntityData]] = [
+                await self._vdb_connector.aknn_search(
+                    index_name,
+                    schema._schema_name,
+                    self._get_fields_to_return(returned_fields),
+                    vdb_knn_search_params_list[0],
+                    **params,
+                )
+            ]
+        else:
+            search_results = await self._vdb_connector.aknn_search_batch(
+                index_name,
+                schema._schema_name,
+                self._get_fields_to_return(returned_fields),
+                vdb_knn_search_params_list,
+                **params,
+            )
+        return self._map_search_results_to_search_result_items(search_results, returned_fields)
+
+    def _prepare_knn_search(
+        self,
+        index_node: IndexNode,
+        schema: IdSchemaObject,
+        knn_search_params_list: Sequence[KNNSearchParams],
+        schema_fields_to_return: Sequence[SchemaField] | None,
+    ) -> tuple[str, dict[Field, SchemaField], list[VDBKNNSearchParams]]:
         self._validate_knn_search_input(schema, schema_fields_to_return)
         if schema_fields_to_return is None:
             schema_fields_to_return = schema._get_schema_fields()
         index_name = self._storage_naming.get_index_name_from_node_id(index_node.node_id)
-        vector_field = cast(
-            VectorFieldData,
-            self._entity_builder.compose_field_data(index_node.node_id, knn_search_params.vector),
-        )
         returned_fields = self._map_schema_fields_to_fields(schema_fields_to_return)
-        search_result: Sequence[ResultEntityData] = self._vdb_connector.knn_search(
-            index_name,
-            schema._schema_name,
-            list(returned_fields.keys()) + list(self._entity_builder._admin_fields.header_fields),
+        vdb_knn_search_params_list = [
             VDBKNNSearchParams(
-                vector_field,
+                cast(
+                    VectorFieldData,
+                    self._entity_builder.compose_field_data(index_node.node_id, knn_search_params.vector),
+                ),
                 knn_search_params.limit,
                 self._compose_filter_field_data(schema, knn_search_params.filters),
                 knn_search_params.radius,
-            ),
-            **params,
-        )
+            )
+            for knn_search_params in knn_search_params_list
+        ]
+        return index_name, returned_fields, vdb_knn_search_params_list
+
+    def _get_fields_to_return(self, returned_fields: dict[Field, SchemaField]) -> list[Field]:
+        return list(returned_fields.keys()) + list(self._entity_builder._admin_fields.header_fields)
+
+    def _map_search_results_to_search_result_items(
+        self,
+        search_results: Sequence[Sequence[ResultEntityData]],
+        returned_fields: dict[Field, SchemaField],
+    ) -> list[Sequence[SearchResultItem]]:
         schema_field_by_field_name = self._create_schema_field_by_field_name(returned_fields)
+        return [
+            self._map_search_result_to_search_result_items(search_result, schema_field_by_field_name)
+            for search_result in search_results
+        ]
+
+    def _map_search_result_to_search_result_items(
+        self,
+        search_result: Sequence[ResultEntityData],
+        schema_field_by_field_name: dict[str, SchemaField],
+    ) -> list[SearchResultItem]:
         return [
             SearchResultItem(
                 self._entity_builder._admin_fields.extract_header(result_entity_data.field_data),
@@ -189,14 +386,14 @@ class StorageManager:
             )
             for schema, id_, data in object_jsons
         ]
-        self._vdb_connector.write_entities(entities)
+        self._write_entities(entities)
 
     def write_parsed_schema_fields(self, parsed_schemas: Sequence[ParsedSchema]) -> None:
         entities_to_write = [
             self._entity_builder.compose_entity_data_from_parsed_schema(parsed_schema)
             for parsed_schema in parsed_schemas
         ]
-        self._vdb_connector.write_entities(entities_to_write)
+        self._write_entities(entities_to_write)
 
     def write_node_result(
         self,
@@ -206,12 +403,20 @@ class StorageManager:
         result: NodeDataTypes,
         origin_id: str | None = None,
     ) -> None:
-        entity_id = self._entity_builder.compose_entity_id(schema._schema_name, object_id)
-        field_data = list(self._entity_builder._admin_fields.create_header_field_data(entity_id, origin_id))
-        if result is not None:
-            result_field_data = self._entity_builder.compose_field_data(node_id, result)
-            field_data.append(result_field_data)
-        self._vdb_connector.write_entities([EntityData(entity_id, {fd.name: fd for fd in field_data})])
+        self.write_node_results_batch([NodeResultData(schema, object_id, node_id, result, origin_id)])
+
+    def write_node_results_batch(self, node_results: Sequence[NodeResultData]) -> None:
+        entity_data = []
+        for node_result in node_results:
+            entity_id = self._entity_builder.compose_entity_id(node_result.schema._schema_name, node_result.object_id)
+            field_data = list(
+                self._entity_builder._admin_fields.create_header_field_data(entity_id, node_result.origin_id)
+            )
+            if node_result.result is not None:
+                field_data.append(self._entity_builder.compose_field_data(node_result.node_id, node_result.result))
+            entity_data.append(EntityData(entity_id, {fd.name: fd for fd in field_data}))
+        if entity_data:
+            self._write_entities(entity_data)
 
     def write_node_data(
         self,
@@ -220,13 +425,35 @@ class StorageManager:
         node_id: str,
         node_data: dict[str, PythonTypes],
     ) -> None:
-        entity_id = self._entity_builder.compose_entity_id(schema._schema_name, object_id)
-        field_data = list(self._entity_builder._admin_fields.create_header_field_data(entity_id))
-        field_data.extend(list(self._entity_builder.compose_field_data_from_node_data(node_id, node_data)))
-        self._vdb_connector.write_entities([EntityData(entity_id, {fd.name: fd for fd in field_data})])
+        self.write_node_data_batch(schema, node_id, {object_id: node_data})
+
+    def write_node_data_batch(
+        self,
+        schema: SchemaObject,
+        node_id: str,
+        node_data_by_object_id: Mapping[str, dict[str, PythonTypes]],
+    ) -> None:
+        entity_data = []
+        for object_id, node_data in node_data_by_object_id.items():
+            entity_id = self._entity_builder.compose_entity_id(schema._schema_name, object_id)
+            field_data = list(self._entity_builder._admin_fields.create_header_field_data(entity_id))
+            field_data.extend(list(self._entity_builder.compose_field_data_from_node_data(node_id, node_data)))
+            entity_data.append(EntityData(entity_id, {fd.name: fd for fd in field_data}))
+        if entity_data:
+            self._write_entities(entity_data)
 
     def read_object_jsons(self, schema: SchemaObject, object_ids: Sequence[str]) -> dict[str, dict[str, Any]]:
-        entities = [
+        entities_data = self._read_entities(self._compose_object_json_entities(schema, object_ids))
+        return {entity.id_.object_id: self._get_object_json_or_raise(entity) for entity in entities_data}
+
+    async def aread_object_jsons(self, schema: SchemaObject, object_ids: Sequence[str]) -> dict[str, dict[str, Any]]:
+        entities_data = await self._vdb_connector.aread_entities(
+            self._compose_object_json_entities(schema, object_ids)
+        )
+        return {entity.id_.object_id: self._get_object_json_or_raise(entity) for entity in entities_data}
+
+    def _compose_object_json_entities(self, schema: SchemaObject, object_ids: Sequence[str]) -> list[Entity]:
+        return [
             self._entity_builder.compose_entity(
                 self._entity_builder.compose_entity_id(schema._schema_name, object_id),
                 [self._entity_builder._admin_fields.object_json.field],
@@ -234,10 +461,6 @@ class StorageManager:
             for object_id in object_ids
         ]
 
-        entities_data: Sequence[EntityData] = self._vdb_connector.read_entities(entities)
-
-        return {entity.id_.object_id: self._get_object_json_or_raise(entity) for entity in entities_data}
-
     def read_schema_field_values(self, object_id: str, schema_fields: Sequence[SchemaField]) -> ParsedSchema:
         schema = self._get_schema_of_schema_fields(schema_fields)
         entity_id = self._entity_builder.compose_entity_id(schema._schema_name, object_id)
@@ -246,7 +469,7 @@ class StorageManager:
             for schema_field in schema_fields
         }
         entity = self._entity_builder.compose_entity(entity_id, list(fields.keys()))
-        entity_data = self._vdb_connector.read_entities([entity])[0]
+        entity_data = self._read_entities([entity])[0]
 
         schema_field_by_field_name = self._create_schema_field_by_field_name(fields)
         return self._entity_builder.parse_entity_data(schema, entity_data, schema_field_by_field_name)
@@ -270,20 +493,21 @@ class StorageManager:
         node_id: str,
         result_type: type[ResultTypeT],
     ) -> ResultTypeT | None:
-        entity_id = self._entity_builder.compose_entity_id(schema._schema_name, object_id)
+        return self.read_node_results_batch(schema, [object_id], node_id, result_type)[object_id]
+
+    def read_node_results_batch(
+        self,
+        schema: SchemaObject,
+        object_ids: Sequence[str],
+        node_id: str,
+        result_type: type[ResultTypeT],
+    ) -> dict[str, ResultTypeT | None]:
         result_field = self._entity_builder.compose_field(node_id, result_type)
-        fields = [result_field]
-        entity = self._entity_builder.compose_entity(entity_id, fields)
-        entity_data = self._vdb_connector.read_entities([entity])[0]
-        result_value = next(
-            (
-                cast(ResultTypeT, field_data.value)
-                for field_data in entity_data.field_data.values()
-                if field_data.name == result_field.name
-            ),
-            None,
-        )
-        return result_value
+        field_data_by_object_id = self._read_field_data_of_objects(schema, object_ids, [result_field])
+        return {
+            object_id: cast(ResultTypeT | None, self._extract_field_value(field_data_by_name, result_field))
+            for object_id, field_data_by_name in field_data_by_object_id.items()
+        }
 
     def read_node_data(
         self,
@@ -292,19 +516,92 @@ class StorageManager:
         node_id: str,
         node_data_descriptor: dict[str, type[NDVT]],
     ) -> dict[str, NDVT]:
-        entity_id = self._entity_builder.compose_entity_id(schema._schema_name, object_id)
+        return self.read_node_data_batch(schema, [object_id], node_id, node_data_descriptor)[object_id]
+
+    def read_node_data_batch(
+        self,
+        schema: SchemaObject,
+        object_ids: Sequence[str],
+        node_id: str,
+        node_data_descriptor: dict[str, type[NDVT]],
+    ) -> dict[str, dict[str, NDVT]]:
         field_by_node_data_key = self._map_fields_by_node_data_keys(node_id, node_data_descriptor or {})
         if not field_by_node_data_key:
-            return {}
-        fields = list(field_by_node_data_key.values())
-        node_data_key_by_field_name = {field.name: key for key, field in field_by_node_data_key.items()}
-        entity = self._entity_builder.compose_entity(entity_id, fields)
-        entity_data = self._vdb_connector.read_entities([entity])[0]
-        node_data = {
-            node_data_key_by_field_name[field_data.name]: cast(NDVT, field_data.value)
-            for field_data in entity_data.field_data.values()
+            return {object_id: {} for object_id in object_ids}
+        field_data_by_object_id = self._read_field_data_of_objects(
+            schema, object_ids, list(field_by_node_data_key.values())
+        )
+        return {
+            object_id: self._extract_node_data(field_data_by_name, field_by_node_data_key)
+            for object_id, field_data_by_name in field_data_by_object_id.items()
+        }
+
+    def read_node_results_with_node_data(  # pylint: disable=too-many-arguments
+        self,
+        schema: SchemaObject,
+        object_ids: Sequence[str],
+        node_id: str,
+        result_type: type[ResultTypeT],
+        node_data_node_id: str,
+        node_data_descriptor: dict[str, type[NDVT]],
+    ) -> dict[str, tuple[ResultTypeT | None, dict[str, NDVT]]]:
+        """
+        Reads the stored results of `node_id` together with the node data stored
+        under `node_data_node_id` for all the given objects in a single read.
+        """
+        result_field = self._entity_builder.compose_field(node_id, result_type)
+        field_by_node_data_key = self._map_fields_by_node_data_keys(node_data_node_id, node_data_descriptor)
+        field_data_by_object_id = self._read_field_data_of_objects(
+            schema, object_ids, [result_field] + list(field_by_node_data_key.values())
+        )
+        return {
+            object_id: (
+                cast(ResultTypeT | None, self._extract_field_value(field_data_by_name, result_field)),
+                self._extract_node_data(field_data_by_name, field_by_node_data_key),
+            )
+            for object_id, field_data_by_name in field_data_by_object_id.items()
+        }
+
+    def _read_field_data_of_objects(
+        self,
+        schema: SchemaObject,
+        object_ids: Sequence[str],
+        fields: Sequence[Field],
+    ) -> dict[str, dict[str, FieldData]]:
+        """
+        Reads `fields` of all the given objects in a single read, keyed by object id and field name.
+        Objects or fields not present in the storage are left empty.
+        """
+        field_data_by_object_id: dict[str, dict[str, FieldData]] = {
+            object_id: {} for object_id in dict.fromkeys(object_ids)
+        }
+        if not field_data_by_object_id:
+            return field_data_by_object_id
+        entities = [
+            self._entity_builder.compose_entity(
+                self._entity_builder.compose_entity_id(schema._schema_name, object_id), list(fields)
+            )
+            for object_id in field_data_by_object_id
+        ]
+        for entity_data in self._read_entities(entities):
+            field_data_by_object_id[entity_data.id_.object_id] = {
+                field_data.name: field_data for field_data in entity_data.field_data.values()
+            }
+        return field_data_by_object_id
+
+    def _extract_field_value(self, field_data_by_name: dict[str, FieldData], field: Field) -> Any:
+        if (field_data := field_data_by_name.get(field.name)) is None:
+            return None
+        return field_data.value
+
+    def _extract_node_data(
+        self, field_data_by_name: dict[str, FieldData], field_by_node_data_key: dict[str, Field]
+    ) -> dict[str, NDVT]:
+        return {
+            node_data_key: cast(NDVT, field_data_by_name[field.name].value)
+            for node_data_key, field in field_by_node_data_key.items()
+            if field.name in field_data_by_name
         }
-        return node_data
 
     def _compile_indexed_fields_to_descriptors(
         self, params: SearchIndexParams
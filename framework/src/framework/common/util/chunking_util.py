@@ -12,7 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from beartype.typing import Callable
+from collections import deque
+
+from beartype.typing import Sequence
 
 DEFAULT_CHUNK_SIZE: int = 250
 DEFAULT_CHUNK_OVERLAP: int = 20
@@ -25,16 +27,20 @@ class Chunker:
     def _split_text_keep_sep(text: str, separator: str, keep_sep: bool = True) -> list[str]:
         """Split text with separator and keep the separator at the end of each split."""
         parts = text.split(separator)
-        result = [
-            part + f"{separator} " * (i < len(parts) - 1) * keep_sep
-            for i, part in enumerate(text.split(separator))
-            if part
-        ]
-        return result
+        return [part + f"{separator} " * (i < len(parts) - 1) * keep_sep for i, part in enumerate(parts) if part]
 
-    def _split_by_sep(self, sep: str, keep_sep: bool = True) -> Callable[[str], list[str]]:
-        """Split text by separator."""
-        return lambda text: self._split_text_keep_sep(text, sep, keep_sep)
+    @staticmethod
+    def _get_separators(
+        remove_splitter_chars: list[str] | None, additional_splitter_chars: list[str] | None
+    ) -> list[tuple[str, bool]]:
+        """The separators to try in order, with whether the splits keep them."""
+        if remove_splitter_chars is None:
+            remove_splitter_chars = DEFAULT_REMOVE_SPLIT_CHARS
+        if additional_splitter_chars is None:
+            additional_splitter_chars = DEFAULT_ADDITIONAL_SPLIT_CHARS
+        return [(sep, False) for sep in remove_splitter_chars] + [
+            (sep, True) for sep in additional_splitter_chars + [" "]
+        ]
 
     def _split(
         self,
@@ -49,36 +55,34 @@ class Chunker:
             - do not contain the separators if separator in remove_splitter_chars
             - contain the separators if separator in additional_splitter_chars.
         """
-        if remove_splitter_chars is None:
-            remove_splitter_chars = DEFAULT_REMOVE_SPLIT_CHARS
-        if additional_splitter_chars is None:
-            additional_splitter_chars = DEFAULT_ADDITIONAL_SPLIT_CHARS
-        splits_to_process: list[str] = [text]
-        new_splits: list[str] = []
-        split_fns: list[Callable[[str], list[str]]] = [
-            self._split_by_sep(sep, keep_sep=False) for sep in remove_splitter_chars
-        ] + [self._split_by_sep(sep, keep_sep=True) for sep in additional_splitter_chars + [" "]]
+        return self._split_by_separators(
+            text, chunk_size, self._get_separators(remove_splitter_chars, additional_splitter_chars)
+        )
 
-        while len(splits_to_process) > 0:
-            current_split: str = splits_to_process.pop(0)
+    def _split_by_separators(self, text: str, chunk_size: int, separators: list[tuple[str, bool]]) -> list[str]:
+        """
+        Too long splits are split by the first separator that breaks them up, depth first.
+        The splits still to process are kept on a stack with the next one on top, so each step is O(1)
+        apart from splitting the text itself.
+        """
+        new_splits: list[str] = []
+        splits_to_process: list[str] = [text]
+        while splits_to_process:
+            current_split = splits_to_process.pop()
             if len(current_split) <= chunk_size:
                 new_splits.append(current_split)
+            elif sub_splits := self._split_by_first_separator(" ".join(current_split.split()), separators):
+                splits_to_process.extend(reversed(sub_splits))
             else:
-                sub_split: list[str] = next(
-                    (
-                        sub_split
-                        for sub_split in [split_fn(" ".join(current_split.split())) for split_fn in split_fns]
-                        if len(sub_split) > 1
-                    ),
-                    [],
-                )
-                if sub_split:
-                    splits_to_process = sub_split + splits_to_process
-                else:
-                    new_splits.append(current_split)
-
+                new_splits.append(current_split)
         return new_splits
 
+    def _split_by_first_separator(self, text: str, separators: list[tuple[str, bool]]) -> list[str]:
+        for sep, keep_sep in separators:
+            if sep in text and len(sub_splits := self._split_text_keep_sep(text, sep, keep_sep)) > 1:
+                return sub_splits
+        return []
+
     def _merge(self, splits: list[str], chunk_size: int, chunk_overlap: int) -> list[str]:
         """Merge splits into chunks.
 
@@ -90,7 +94,7 @@ class Chunker:
         """
         chunks: list[str] = []
 
-        cur_chunk: list[str] = []
+        cur_chunk: deque[str] = deque()
         cur_len = 0
         for split in splits:
             split_len = len(split)
@@ -108,7 +112,7 @@ class Chunker:
                 #   2. the total length is less than chunk size
                 while cur_len > chunk_overlap or cur_len + split_len > chunk_size:
                     # pop off the first element
-                    first_chunk = cur_chunk.pop(0)
+                    first_chunk = cur_chunk.popleft()
                     cur_len -= len(first_chunk)
 
             cur_chunk.append(split)
@@ -129,14 +133,25 @@ class Chunker:
         split_chars_keep: list[str] | None = None,
         split_chars_remove: list[str] | None = None,
     ) -> list[str]:
-        if not text:
-            return []
+        return self.chunk_texts([text], chunk_size, chunk_overlap, split_chars_keep, split_chars_remove)[0]
+
+    def chunk_texts(
+        self,
+        texts: Sequence[str],
+        chunk_size: int | None = None,
+        chunk_overlap: int | None = None,
+        split_chars_keep: list[str] | None = None,
+        split_chars_remove: list[str] | None = None,
+    ) -> list[list[str]]:
+        """
+        Chunks a column of texts with the same settings, chunking repeated texts only once.
+        """
         chunk_size = DEFAULT_CHUNK_SIZE if chunk_size is None else chunk_size
         chunk_overlap = DEFAULT_CHUNK_OVERLAP if chunk_overlap is None else chunk_overlap
-        splits = self._split(
-            text=text,
-            chunk_size=chunk_size,
-            remove_splitter_chars=split_chars_keep,
-            additional_splitter_chars=split_chars_remove,
-        )
-        return self._merge(splits=splits, chunk_size=chunk_size, chunk_overlap=chunk_overlap)
+        separators = self._get_separators(split_chars_keep, split_chars_remove)
+        chunks_by_text: dict[str, list[str]] = {}
+        for text in texts:
+            if text and text not in chunks_by_text:
+                splits = self._split_by_separators(text, chunk_size, separators)
+                chunks_by_text[text] = self._merge(splits=splits, chunk_size=chunk_size, chunk_overlap=chunk_overlap)
+        return [list(chunks_by_text[text]) if text else [] for text in texts]
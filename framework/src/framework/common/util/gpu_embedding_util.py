@@ -14,8 +14,6 @@
 
 from functools import lru_cache
 
-import torch
-
 from superlinked.framework.common.settings import Settings
 
 CPU_DEVICE_TYPE = "cpu"
@@ -37,6 +35,9 @@ class GpuEmbeddingUtil:
     @classmethod
     @lru_cache(3)
     def _get_available_gpu_device(cls) -> str:
+        # torch takes seconds to import, so it is only loaded once an embedding actually needs a device
+        import torch  # pylint: disable=import-outside-toplevel
+
         if torch.cuda.is_available():
             return CUDA_DEVICE_TYPE
         if torch.backends.mps.is_available():
@@ -19,6 +19,8 @@ from beartype.typing import Any, Callable, Sequence, TypeAlias, TypeVar, cast
 from beartype.vale import Is
 from beartype.vale._core._valecore import BeartypeValidator
 
+from superlinked.framework.common.settings import Settings
+
 # WrapableType
 WT = TypeVar(
     "WT",
@@ -92,15 +94,30 @@ class TypeValidator:
         """
         return beartype(conf=conf)(obj)
 
+    @staticmethod
+    def wrap_hot_path(obj: WT, conf: BeartypeConf = BeartypeConf(violation_param_type=TypeError)) -> WT:
+        """
+        Like `wrap`, for the classes and callables used on every query execution.
+        Returns the object unchanged if runtime type checking is disabled in the settings.
+        """
+        if Settings().DISABLE_RUNTIME_TYPE_CHECKING:
+            return obj
+        return TypeValidator.wrap(obj, conf)
+
     @staticmethod
     def list_validator(type_: type[LIT]) -> BeartypeValidator:
         """
         Returns a beartype-compliant validator for lists, which checks if
             the annotated object is a list and, if it is, all elements of it is of the type `type_`.
+        If runtime type checking is disabled, the elements are left to the sampled check of beartype.
         """
 
+        check_items = not Settings().DISABLE_RUNTIME_TYPE_CHECKING
+
         def validator(item_list: Any) -> bool:
-            return isinstance(item_list, list) and all(isinstance(item, type_) for item in item_list)
+            return isinstance(item_list, list) and (
+                not check_items or all(isinstance(item, type_) for item in item_list)
+            )
 
         return Is[validator]
 
@@ -110,11 +127,15 @@ class TypeValidator:
         Returns a beartype-compliant validator for dictionaries, which checks if
             the annotated object is a dictionary and, if it is,
             all keys and values are of the types `key_type` and `value_type` respectively.
+        If runtime type checking is disabled, the items are left to the sampled check of beartype.
         """
 
+        check_items = not Settings().DISABLE_RUNTIME_TYPE_CHECKING
+
         def validator(d: Any) -> bool:
-            return isinstance(d, dict) and all(
-                isinstance(key, key_type) and isinstance(value, value_type) for key, value in d.items()
+            return isinstance(d, dict) and (
+                not check_items
+                or all(isinstance(key, key_type) and isinstance(value, value_type) for key, value in d.items())
             )
 
         return Is[validator]
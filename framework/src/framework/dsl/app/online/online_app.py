@@ -26,6 +26,9 @@ from superlinked.framework.dsl.index.index import Index
 from superlinked.framework.dsl.query.query_mixin import QueryMixin
 from superlinked.framework.dsl.storage.vector_database import VectorDatabase
 from superlinked.framework.online.online_dag_evaluator import OnlineDagEvaluator
+from superlinked.framework.online.source.cross_index_data_processor import (
+    CrossIndexDataProcessor,
+)
 from superlinked.framework.online.source.online_data_processor import (
     OnlineDataProcessor,
 )
@@ -84,9 +87,13 @@ class OnlineApp(App[OnlineSourceT], Generic[OnlineSourceT], QueryMixin):
         Set up the execution environment by initializing data processors and object writers.
         """
         self._data_processors = [self._create_data_processor(index) for index in self._indices]
-        for data_processor, index in zip(self._data_processors, self._indices):
-            for source in self.__filter_index_sources(index):
-                source.register(data_processor)
+        for source in self._sources:
+            source_data_processors = self.__filter_source_data_processors(source)
+            if len(source_data_processors) > 1:
+                source.register(CrossIndexDataProcessor(source_data_processors, self.storage_manager))
+            else:
+                for data_processor in source_data_processors:
+                    source.register(data_processor)
         self._register_object_writer()
 
     def _create_data_processor(self, index: Index) -> OnlineDataProcessor:
@@ -109,8 +116,12 @@ class OnlineApp(App[OnlineSourceT], Generic[OnlineSourceT], QueryMixin):
     def _init_storage_manager(self) -> StorageManager:
         return StorageManager(self._vector_database._vdb_connector)
 
-    def __filter_index_sources(self, index: Index) -> Sequence[OnlineSourceT]:
-        return [source for source in self._sources if index.has_schema(source._schema)]
+    def __filter_source_data_processors(self, source: OnlineSourceT) -> list[OnlineDataProcessor]:
+        return [
+            data_processor
+            for data_processor, index in zip(self._data_processors, self._indices)
+            if index.has_schema(source._schema)
+        ]
 
     def __register_blob_handlers(self, blob_handler: BlobHandler) -> None:
         for source in self._sources:
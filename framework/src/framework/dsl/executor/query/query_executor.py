@@ -13,11 +13,12 @@
 # limitations under the License.
 
 
+import asyncio
 from collections import defaultdict
 from functools import partial
 
 import structlog
-from beartype.typing import Any, Sequence, cast
+from beartype.typing import Any, Mapping, Sequence, cast
 
 from superlinked.framework.common.dag.context import (
     CONTEXT_COMMON,
@@ -45,6 +46,7 @@ from superlinked.framework.dsl.query.query_descriptor import QueryDescriptor
 from superlinked.framework.dsl.query.query_param_value_setter import (
     QueryParamValueSetter,
 )
+from superlinked.framework.dsl.query.query_plan import QueryPlan
 from superlinked.framework.dsl.query.query_vector_factory import QueryVectorFactory
 from superlinked.framework.dsl.query.result import Result, ResultEntry
 from superlinked.framework.query.query_node_input import QueryNodeInput
@@ -62,6 +64,7 @@ class QueryExecutor:
         app: App,
         query_descriptor: QueryDescriptor,
         query_vector_factory: QueryVectorFactory,
+        query_plan: QueryPlan | None = None,
     ) -> None:
         """
         Initializes the QueryExecutor.
@@ -69,11 +72,13 @@ class QueryExecutor:
         Args:
             app: An instance of the App class.
             query_descriptor: An instance of the QueryDescriptor class representing the query to be executed.
-            evaluator: An instance of the QueryDagEvaluator class used to evaluate the query.
+            query_vector_factory: The QueryVectorFactory of the query's index.
+            query_plan: The compiled form of `query_descriptor`, created from it if not given.
         """
         self.app = app
         self._query_descriptor = query_descriptor
         self.query_vector_factory = query_vector_factory
+        self._query_plan = query_plan or query_vector_factory.create_query_plan(query_descriptor)
         self._logger = logger.bind(schema=self._query_descriptor.schema._schema_name)
 
     def query(self, **params: Any) -> Result:
@@ -90,9 +95,59 @@ class QueryExecutor:
             QueryException: If the query index is not amongst the executor's indices.
         """
         self.__check_executor_has_index()
-        query_descriptor = QueryParamValueSetter.set_values(self._query_descriptor, params)
+        query_descriptor = self.__bind_params(params)
         knn_search_params = self._produce_knn_search_params(query_descriptor)
         entities: Sequence[SearchResultItem] = self._knn_search(knn_search_params, query_descriptor)
+        return self._create_result(params, query_descriptor, knn_search_params, entities)
+
+    async def aquery(self, **params: Any) -> Result:
+        """
+        Execute a query with keyword parameters without blocking the event loop.
+        The query vector is produced in a worker thread, as it may embed inputs or call a natural language model,
+        the search and the read of the results use the async API of the vector database.
+
+        Args:
+            **params: Arbitrary arguments with keys corresponding to the `name` attribute of the `Param` instance.
+
+        Returns:
+            Result: The result of the query execution that can be inspected and post-processed.
+
+        Raises:
+            QueryException: If the query index is not amongst the executor's indices.
+        """
+        self.__check_executor_has_index()
+        query_descriptor, knn_search_params = await asyncio.to_thread(self.__bind_params_and_produce_search, params)
+        entities = await self._aknn_search(knn_search_params, query_descriptor)
+        return await self._acreate_result(params, query_descriptor, knn_search_params, entities)
+
+    def _create_result(
+        self,
+        params: Mapping[str, Any],
+        query_descriptor: QueryDescriptor,
+        knn_search_params: KNNSearchParams,
+        entities: Sequence[SearchResultItem],
+    ) -> Result:
+        self.__log_query(params, knn_search_params, entities)
+        return Result(
+            self._map_entities_to_result_entries(query_descriptor.schema, entities),
+            query_descriptor,
+            knn_search_params.vector,
+        )
+
+    async def _acreate_result(
+        self,
+        params: Mapping[str, Any],
+        query_descriptor: QueryDescriptor,
+        knn_search_params: KNNSearchParams,
+        entities: Sequence[SearchResultItem],
+    ) -> Result:
+        self.__log_query(params, knn_search_params, entities)
+        result_entries_list = await self._amap_entities_list_to_result_entries(query_descriptor.schema, [entities])
+        return Result(result_entries_list[0], query_descriptor, knn_search_params.vector)
+
+    def __log_query(
+        self, params: Mapping[str, Any], knn_search_params: KNNSearchParams, entities: Sequence[SearchResultItem]
+    ) -> None:
         self._logger.info(
             "executed query",
             n_results=len(entities),
@@ -101,11 +156,117 @@ class QueryExecutor:
             pii_knn_params=params,
             pii_query_vector=partial(str, knn_search_params.vector),
         )
-        return Result(
-            self._map_entities_to_result_entries(query_descriptor.schema, entities),
-            query_descriptor,
-            knn_search_params.vector,
+
+    def query_batch(self, params_list: Sequence[Mapping[str, Any]]) -> list[Result]:
+        """
+        Execute the query with multiple sets of keyword parameters at once.
+        The query vectors are produced together, embedding the inputs of all queries in a single model call
+        where the space supports it, and the searches are sent to the vector database as one batch.
+
+        Args:
+            params_list: A sequence of parameter mappings, each as it would be passed to `query`.
+
+        Returns:
+            list[Result]: The results of the query executions, in the order of `params_list`.
+
+        Raises:
+            QueryException: If the query index is not amongst the executor's indices.
+        """
+        self.__check_executor_has_index()
+        if not params_list:
+            return []
+        query_descriptors, knn_search_params_list = self.__bind_params_and_produce_search_batch(params_list)
+        entities_list = self.app.storage_manager.knn_search_batch(
+            self._query_descriptor.index._node,
+            self._query_descriptor.schema,
+            knn_search_params_list,
+            schema_fields_to_return=None,
         )
+        self.__log_query_batch(params_list, entities_list)
+        result_entries_list = self._map_entities_list_to_result_entries(self._query_descriptor.schema, entities_list)
+        return self.__create_results(result_entries_list, query_descriptors, knn_search_params_list)
+
+    async def aquery_batch(self, params_list: Sequence[Mapping[str, Any]]) -> list[Result]:
+        """
+        Execute the query with multiple sets of keyword parameters at once without blocking the event loop.
+        See `query_batch` and `aquery`.
+
+        Args:
+            params_list: A sequence of parameter mappings, each as it would be passed to `query`.
+
+        Returns:
+            list[Result]: The results of the query executions, in the order of `params_list`.
+
+        Raises:
+            QueryException: If the query index is not amongst the executor's indices.
+        """
+        self.__check_executor_has_index()
+        if not params_list:
+            return []
+        query_descriptors, knn_search_params_list = await asyncio.to_thread(
+            self.__bind_params_and_produce_search_batch, params_list
+        )
+        entities_list = await self.app.storage_manager.aknn_search_batch(
+            self._query_descriptor.index._node,
+            self._query_descriptor.schema,
+            knn_search_params_list,
+            schema_fields_to_return=None,
+        )
+        self.__log_query_batch(params_list, entities_list)
+        result_entries_list = await self._amap_entities_list_to_result_entries(
+            self._query_descriptor.schema, entities_list
+        )
+        return self.__create_results(result_entries_list, query_descriptors, knn_search_params_list)
+
+    def __bind_params_and_produce_search(self, params: dict[str, Any]) -> tuple[QueryDescriptor, KNNSearchParams]:
+        query_descriptor = self.__bind_params(params)
+        return query_descriptor, self._produce_knn_search_params(query_descriptor)
+
+    def __bind_params_and_produce_search_batch(
+        self, params_list: Sequence[Mapping[str, Any]]
+    ) -> tuple[list[QueryDescriptor], list[KNNSearchParams]]:
+        query_descriptors = [self.__bind_params(dict(params)) for params in params_list]
+        return query_descriptors, self._produce_knn_search_params_batch(query_descriptors)
+
+    def __log_query_batch(
+        self, params_list: Sequence[Mapping[str, Any]], entities_list: Sequence[Sequence[SearchResultItem]]
+    ) -> None:
+        self._logger.info(
+            "executed query batch",
+            n_queries=len(entities_list),
+            n_results=[len(entities) for entities in entities_list],
+            pii_knn_params=params_list,
+        )
+
+    def __create_results(
+        self,
+        result_entries_list: Sequence[Sequence[ResultEntry]],
+        query_descriptors: Sequence[QueryDescriptor],
+        knn_search_params_list: Sequence[KNNSearchParams],
+    ) -> list[Result]:
+        return [
+            Result(result_entries, query_descriptor, knn_search_params.vector)
+            for result_entries, query_descriptor, knn_search_params in zip(
+                result_entries_list, query_descriptors, knn_search_params_list
+            )
+        ]
+
+    def _produce_knn_search_params_batch(self, query_descriptors: Sequence[QueryDescriptor]) -> list[KNNSearchParams]:
+        query_vectors = self.query_vector_factory.produce_vectors(
+            self._query_plan,
+            [self.calculate_query_node_inputs_by_node_id(query_descriptor) for query_descriptor in query_descriptors],
+            [query_descriptor.get_weights_by_space() for query_descriptor in query_descriptors],
+            [self._create_query_context_base(query_descriptor) for query_descriptor in query_descriptors],
+        )
+        return [
+            KNNSearchParams(
+                query_vector,
+                query_descriptor.get_limit(),
+                query_descriptor.get_hard_filters(),
+                query_descriptor.get_radius(),
+            )
+            for query_vector, query_descriptor in zip(query_vectors, query_descriptors)
+        ]
 
     def _produce_knn_search_params(self, query_descriptor: QueryDescriptor) -> KNNSearchParams:
         limit = query_descriptor.get_limit()
@@ -119,10 +280,9 @@ class QueryExecutor:
         context = self._create_query_context_base(query_descriptor)
         query_node_inputs_by_node_id = self.calculate_query_node_inputs_by_node_id(query_descriptor)
         return self.query_vector_factory.produce_vector(
-            query_descriptor.index._node_id,
+            self._query_plan,
             query_node_inputs_by_node_id,
             weight_by_space,
-            query_descriptor.schema,
             context,
         )
 
@@ -156,7 +316,7 @@ class QueryExecutor:
 
         looks_like_clause = query_descriptor.get_clause_by_type(LooksLikeFilterClause)
         if looks_like_clause and looks_like_clause.evaluate():
-            index_node_id = query_descriptor.index._node_id
+            index_node_id = self._query_plan.index_node_id
             if vector := self.__get_looks_like_vector(index_node_id, looks_like_clause):
                 add_input(index_node_id, vector, looks_like_clause.get_weight(), True)
         for similar_clause in query_descriptor.get_clauses_by_type(SimilarFilterClause):
@@ -164,7 +324,7 @@ class QueryExecutor:
             weight = similar_clause.get_weight()
             if value is None or not weight:
                 continue
-            node_id = similar_clause.space._get_embedding_node(query_descriptor.schema).node_id
+            node_id = self._query_plan.embedding_node_id_by_space[similar_clause.space]
             add_input(
                 node_id,
                 similar_clause.field_set._generate_space_input(value),
@@ -174,6 +334,10 @@ class QueryExecutor:
 
         return inputs
 
+    def __bind_params(self, params: dict[str, Any]) -> QueryDescriptor:
+        QueryParamValueSetter.validate_param_names(self._query_plan.param_names, params)
+        return QueryParamValueSetter.bind_values(self._query_plan.query_descriptor, params)
+
     def __get_looks_like_vector(
         self,
         index_node_id: str,
@@ -200,19 +364,60 @@ class QueryExecutor:
             schema_fields_to_return=None,
         )
 
+    async def _aknn_search(
+        self, knn_search_params: KNNSearchParams, query_descriptor: QueryDescriptor
+    ) -> Sequence[SearchResultItem]:
+        return await self.app.storage_manager.aknn_search(
+            query_descriptor.index._node,
+            query_descriptor.schema,
+            knn_search_params,
+            schema_fields_to_return=None,
+        )
+
     def _map_entities_to_result_entries(
         self, schema: IdSchemaObject, result_items: Sequence[SearchResultItem]
     ) -> Sequence[ResultEntry]:
-        object_ids = list({entity.header.origin_id or entity.header.object_id for entity in result_items})
+        return self._map_entities_list_to_result_entries(schema, [result_items])[0]
 
+    def _map_entities_list_to_result_entries(
+        self, schema: IdSchemaObject, result_items_list: Sequence[Sequence[SearchResultItem]]
+    ) -> list[Sequence[ResultEntry]]:
+        object_ids = self.__get_object_ids(result_items_list)
         object_jsons = self.app.storage_manager.read_object_jsons(schema, object_ids)
+        return self.__create_result_entries(schema, result_items_list, object_ids, object_jsons)
+
+    async def _amap_entities_list_to_result_entries(
+        self, schema: IdSchemaObject, result_items_list: Sequence[Sequence[SearchResultItem]]
+    ) -> list[Sequence[ResultEntry]]:
+        object_ids = self.__get_object_ids(result_items_list)
+        object_jsons = await self.app.storage_manager.aread_object_jsons(schema, object_ids)
+        return self.__create_result_entries(schema, result_items_list, object_ids, object_jsons)
 
+    def __get_object_ids(self, result_items_list: Sequence[Sequence[SearchResultItem]]) -> list[str]:
+        return list(
+            {
+                entity.header.origin_id or entity.header.object_id
+                for result_items in result_items_list
+                for entity in result_items
+            }
+        )
+
+    def __create_result_entries(
+        self,
+        schema: IdSchemaObject,
+        result_items_list: Sequence[Sequence[SearchResultItem]],
+        object_ids: Sequence[str],
+        object_jsons: dict[str, dict[str, Any]],
+    ) -> list[Sequence[ResultEntry]]:
         if missing_ids := [id_ for id_ in object_ids if id_ not in object_jsons]:
             raise QueryException(
                 f"Unable to find {schema._schema_name} objects in storage with the following IDs: {missing_ids}"
             )
 
-        return [ResultEntry(item, self.__get_object_json_by_id(object_jsons, item)) for item in result_items]
+        return [
+            [ResultEntry(item, self.__get_object_json_by_id(object_jsons, item)) for item in result_items]
+            for result_items in result_items_list
+        ]
 
     def __get_object_json_by_id(self, object_jsons: dict, search_result_item: SearchResultItem) -> dict:
         object_id = search_result_item.header.origin_id or search_result_item.header.object_id
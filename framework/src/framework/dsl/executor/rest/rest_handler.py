@@ -64,6 +64,10 @@ class RestHandler:
         query = self.__path_to_query_map[path].query_descriptor
         return self.__query_mixin.query(query, **query_descriptor)
 
+    async def _aquery_handler(self, query_descriptor: dict, path: str) -> Result:
+        query = self.__path_to_query_map[path].query_descriptor
+        return await self.__query_mixin.aquery(query, **query_descriptor)
+
     def __create_path_to_resource_mapping(
         self,
         resources: Sequence[REST],
@@ -82,7 +82,7 @@ from superlinked.framework.dsl.space.space_field_set import SpaceFieldSet
 logger = structlog.getLogger()
 
 
-@TypeValidator.wrap
+@TypeValidator.wrap_hot_path
 class QueryDescriptor:  # pylint: disable=too-many-public-methods
     """
     A class representing a query object. Use .with_vector to run queries using a stored
@@ -96,11 +96,13 @@ class QueryDescriptor:  # pylint: disable=too-many-public-methods
         index: Index,
         schema: IdSchemaObject,
         clauses: Sequence[QueryClause] | None = None,
+        validate: bool = True,
     ) -> None:
         self.__index = index
         self.__schema = schema
         self.__clauses: Sequence[QueryClause] = clauses if clauses else []
-        QueryDescriptorValidator.validate(self)
+        if validate:
+            QueryDescriptorValidator.validate(self)
 
     @property
     def clauses(self) -> Sequence[QueryClause]:
@@ -426,8 +428,8 @@ class QueryDescriptor:  # pylint: disable=too-many-public-methods
     def get_clauses_by_type(self, clause_type: Type[QueryClauseT]) -> list[QueryClauseT]:
         return [clause for clause in self.clauses if isinstance(clause, clause_type)]
 
-    def replace_clauses(self, clauses: Sequence[QueryClause]) -> QueryDescriptor:
-        return QueryDescriptor(self.index, self.schema, clauses)
+    def replace_clauses(self, clauses: Sequence[QueryClause], validate: bool = True) -> QueryDescriptor:
+        return QueryDescriptor(self.index, self.schema, clauses, validate)
 
     def calculate_value_by_param_name(self) -> dict[str, Any]:
         value_by_param_name = {clause.value_param_name: clause.get_value() for clause in self.clauses}
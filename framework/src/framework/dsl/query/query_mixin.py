@@ -13,18 +13,22 @@
 # limitations under the License.
 
 
-from beartype.typing import Any, Sequence
+from weakref import WeakKeyDictionary
+
+from beartype.typing import Any, Mapping, Sequence
 
 from superlinked.framework.common.exception import QueryException
 from superlinked.framework.common.util.type_validator import TypeValidator
 from superlinked.framework.dsl.executor.query.query_executor import QueryExecutor
 from superlinked.framework.dsl.index.index import Index
 from superlinked.framework.dsl.query.query_descriptor import QueryDescriptor
+from superlinked.framework.dsl.query.query_plan import QueryPlan
+from superlinked.framework.dsl.query.query_vector_cache import QueryVectorCacheMetrics
 from superlinked.framework.dsl.query.query_vector_factory import QueryVectorFactory
 from superlinked.framework.dsl.query.result import Result
 
 
-@TypeValidator.wrap
+@TypeValidator.wrap_hot_path
 class QueryMixin:
     """
     A mixin class that provides query execution capabilities for classes that include it.
@@ -36,12 +40,24 @@ class QueryMixin:
         """
         Set up the query execution environment by initializing a mapping between indices
         and their corresponding QueryVectorFactory instances.
+        The compiled plans of the executed query descriptors are kept as long as the descriptors are alive.
 
         Args:
             indices (Sequence[Index]): A sequence of Index instances to be used for query execution.
             storage_manager (StorageManager): The storage manager instance to be used.
         """
         self._query_vector_factory_by_index = {index: QueryVectorFactory(index._dag) for index in indices}
+        self._query_plan_by_query_descriptor: WeakKeyDictionary[QueryDescriptor, QueryPlan] = WeakKeyDictionary()
+
+    @property
+    def query_vector_cache_metrics(self) -> dict[Index, QueryVectorCacheMetrics]:
+        """
+        The hit and miss counts of the query vector cache of each index.
+        """
+        return {
+            index: query_vector_factory.query_vector_cache_metrics
+            for index, query_vector_factory in self._query_vector_factory_by_index.items()
+        }
 
     def query(self, query_descriptor: QueryDescriptor, **params: Any) -> Result:
         """
@@ -57,9 +73,71 @@ class QueryMixin:
         Raises:
             QueryException: If the query index is not found among the executor's indices.
         """
+        return self._create_query_executor(query_descriptor).query(**params)
+
+    def query_batch(self, query_descriptor: QueryDescriptor, params_list: Sequence[Mapping[str, Any]]) -> list[Result]:
+        """
+        Execute a query using the provided QueryDescriptor with multiple sets of parameters at once.
+        This is considerably faster than calling `query` repeatedly, as the inputs of all queries
+        are embedded together and the searches are sent to the vector database as one batch.
+
+        Args:
+            query_descriptor (QueryDescriptor): The query object containing the query details.
+            params_list (Sequence[Mapping[str, Any]]): The parameters of each query execution.
+
+        Returns:
+            list[Result]: The results of the query executions, in the order of `params_list`.
+
+        Raises:
+            QueryException: If the query index is not found among the executor's indices.
+        """
+        return self._create_query_executor(query_descriptor).query_batch(params_list)
+
+    async def aquery(self, query_descriptor: QueryDescriptor, **params: Any) -> Result:
+        """
+        Execute a query using the provided QueryDescriptor and additional parameters without blocking the event loop.
+        The query vector is produced in a worker thread, the search and the read of the results
+        use the native async client of the vector database where one is available.
+
+        Args:
+            query_descriptor (QueryDescriptor): The query object containing the query details.
+            **params (Any): Additional parameters for the query execution.
+
+        Returns:
+            Result: The result of the query execution.
+
+        Raises:
+            QueryException: If the query index is not found among the executor's indices.
+        """
+        return await self._create_query_executor(query_descriptor).aquery(**params)
+
+    async def aquery_batch(
+        self, query_descriptor: QueryDescriptor, params_list: Sequence[Mapping[str, Any]]
+    ) -> list[Result]:
+        """
+        Execute a query using the provided QueryDescriptor with multiple sets of parameters at once
+        without blocking the event loop. See `query_batch` and `aquery`.
+
+        Args:
+            query_descriptor (QueryDescriptor): The query object containing the query details.
+            params_list (Sequence[Mapping[str, Any]]): The parameters of each query execution.
+
+        Returns:
+            list[Result]: The results of the query executions, in the order of `params_list`.
+
+        Raises:
+            QueryException: If the query index is not found among the executor's indices.
+        """
+        return await self._create_query_executor(query_descriptor).aquery_batch(params_list)
+
+    def _create_query_executor(self, query_descriptor: QueryDescriptor) -> QueryExecutor:
         if query_vector_factory := self._query_vector_factory_by_index.get(query_descriptor.index):
+            query_plan = self._query_plan_by_query_descriptor.get(query_descriptor)
+            if query_plan is None:
+                query_plan = query_vector_factory.create_query_plan(query_descriptor)
+                self._query_plan_by_query_descriptor[query_descriptor] = query_plan
             # 'self' is an App instance; MyPy can't infer the inheriting class. See [FAI-2085].
-            return QueryExecutor(self, query_descriptor, query_vector_factory).query(**params)  # type: ignore
+            return QueryExecutor(self, query_descriptor, query_vector_factory, query_plan)  # type: ignore
 
         raise QueryException(
             (
@@ -18,6 +18,7 @@ import structlog
 from beartype.typing import Any
 
 from superlinked.framework.common.interface.evaluated import Evaluated
+from superlinked.framework.common.settings import Settings
 from superlinked.framework.dsl.query.nlq.nlq_handler import NLQHandler
 from superlinked.framework.dsl.query.query_clause import (
     NLQClause,
@@ -35,19 +36,39 @@ class QueryParamValueSetter:
     def set_values(cls, query_descriptor: QueryDescriptor, params: dict[str, Any]) -> QueryDescriptor:
         query_descriptor_with_all_clauses = query_descriptor.append_missing_mandatory_clauses()
         cls.validate_params(query_descriptor_with_all_clauses, params)
-        altered_query_descriptor = cls.__alter_query_descriptor(query_descriptor_with_all_clauses, params, True)
+        return cls.bind_values(query_descriptor_with_all_clauses, params)
+
+    @classmethod
+    def bind_values(cls, query_descriptor_with_all_clauses: QueryDescriptor, params: dict[str, Any]) -> QueryDescriptor:
+        """
+        Sets the params of a query descriptor that already has its mandatory clauses and was checked for unknown params.
+        In production mode (runtime type checking disabled) only the final query descriptor is validated.
+        """
+        validate_steps = not Settings().DISABLE_RUNTIME_TYPE_CHECKING
+        altered_query_descriptor = cls.__alter_query_descriptor(
+            query_descriptor_with_all_clauses, params, True, validate_steps
+        )
         nlq_params = cls.__calculate_nlq_params(altered_query_descriptor)
-        nlq_altered_query_descriptor = cls.__alter_query_descriptor(altered_query_descriptor, nlq_params, False)
+        nlq_altered_query_descriptor = cls.__alter_query_descriptor(
+            altered_query_descriptor, nlq_params, False, validate_steps
+        )
         space_weight_params = nlq_altered_query_descriptor.get_param_value_to_set_for_unset_space_weight_clauses()
-        return cls.__alter_query_descriptor(nlq_altered_query_descriptor, space_weight_params, False)
+        return cls.__alter_query_descriptor(nlq_altered_query_descriptor, space_weight_params, False, True)
 
     @classmethod
     def validate_params(cls, query_descriptor: QueryDescriptor, params_to_set: dict[str, Any]) -> None:
+        cls.validate_param_names(cls.get_param_names(query_descriptor), params_to_set)
+
+    @classmethod
+    def get_param_names(cls, query_descriptor: QueryDescriptor) -> frozenset[str]:
         weight_params = [clause.weight_param for clause in query_descriptor.get_weighted_clauses()]
         value_params = [clause.value_param for clause in query_descriptor.clauses]
         all_params = weight_params + value_params
-        param_names = [param.item.name if isinstance(param, Evaluated) else param.name for param in all_params]
-        unknown_params = set(params_to_set.keys()) - set(param_names)
+        return frozenset(param.item.name if isinstance(param, Evaluated) else param.name for param in all_params)
+
+    @classmethod
+    def validate_param_names(cls, param_names: frozenset[str], params_to_set: dict[str, Any]) -> None:
+        unknown_params = set(params_to_set.keys()) - param_names
         if unknown_params:
             unknown_params_text = ", ".join(unknown_params)
             raise ValueError(f"Unknown query parameters: {unknown_params_text}.")
@@ -58,9 +79,10 @@ class QueryParamValueSetter:
         query_descriptor: QueryDescriptor,
         params: dict[str, Any],
         is_override_set: bool,
+        validate: bool,
     ) -> QueryDescriptor:
         altered_clauses = [cls.__alter_clause(clause, params, is_override_set) for clause in query_descriptor.clauses]
-        return query_descriptor.replace_clauses(altered_clauses)
+        return query_descriptor.replace_clauses(altered_clauses, validate)
 
     @classmethod
     def __alter_clause(cls, clause: QueryClause, params: dict[str, Any], is_override_set: bool) -> QueryClause:
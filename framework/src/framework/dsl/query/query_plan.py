@@ -0,0 +1,41 @@
+# Copyright 2024 Superlinked, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from beartype.typing import Mapping
+
+from superlinked.framework.dsl.query.query_descriptor import QueryDescriptor
+from superlinked.framework.dsl.space.space import Space
+
+# Exclude from documentation.
+__pdoc__ = {}
+__pdoc__["QueryPlan"] = False
+
+
+@dataclass(frozen=True)
+class QueryPlan:
+    """
+    The parameter independent part of a query, computed once per `QueryDescriptor`.
+    Executing the query only binds the parameters to `query_descriptor`.
+    """
+
+    query_descriptor: QueryDescriptor
+    param_names: frozenset[str]
+    index_node_id: str
+    schema_name: str
+    embedding_node_id_by_space: Mapping[Space, str]
+    weighable_node_id_by_space: Mapping[Space, str]
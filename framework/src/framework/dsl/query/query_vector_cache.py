@@ -0,0 +1,145 @@
+# Copyright 2024 Superlinked, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from threading import Lock
+
+from beartype.typing import Any, Hashable, Mapping, Sequence
+from cachetools import LRUCache
+
+from superlinked.framework.common.data_types import Vector
+from superlinked.framework.query.query_node_input import QueryNodeInput
+
+SECONDS_PER_DAY = 24 * 60 * 60
+UNCACHEABLE = object()
+
+# Exclude from documentation.
+__pdoc__ = {}
+__pdoc__["QueryVectorCache"] = False
+__pdoc__["QueryVectorCacheMetrics"] = False
+
+
+@dataclass
+class QueryVectorCacheMetrics:
+    hit_count: int = 0
+    miss_count: int = 0
+    uncacheable_count: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookup_count = self.hit_count + self.miss_count + self.uncacheable_count
+        return self.hit_count / lookup_count if lookup_count else 0.0
+
+
+class QueryVectorCache:
+    """
+    LRU cache of final query vectors, keyed by everything the query dag evaluation depends on:
+    the index node, the queried schema, the node inputs and the node weights.
+    If the vector also depends on the context time (the index has a recency space), the time is part of the key,
+    rounded down to `now_bucket_seconds` but never across a UTC day. As the recency periods are anchored to days,
+    the whole cache is dropped once a query arrives on a later day.
+    Queries with inputs that cannot be keyed (e.g. images) are not cached.
+    """
+
+    def __init__(self, max_entries: int, is_time_dependent: bool, now_bucket_seconds: int = 0) -> None:
+        self._max_entries = max_entries
+        self._is_time_dependent = is_time_dependent
+        self._now_bucket_seconds = now_bucket_seconds
+        self._cache: LRUCache = LRUCache(max(max_entries, 1))
+        self._lock = Lock()
+        self._latest_day: int | None = None
+        self._metrics = QueryVectorCacheMetrics()
+
+    @property
+    def metrics(self) -> QueryVectorCacheMetrics:
+        return self._metrics
+
+    def calculate_key(
+        self,
+        index_node_id: str,
+        schema_name: str,
+        query_node_inputs_by_node_id: Mapping[str, Sequence[QueryNodeInput]],
+        weight_by_node_id: Mapping[str, float],
+        now: int,
+    ) -> Hashable | None:
+        if self._max_entries <= 0:
+            return None
+        inputs_key = []
+        for node_id, query_node_inputs in sorted(query_node_inputs_by_node_id.items()):
+            node_inputs_key = []
+            for query_node_input in query_node_inputs:
+                if (value_key := self._to_key(query_node_input.value.item)) is UNCACHEABLE:
+                    return None
+                node_inputs_key.append((value_key, query_node_input.value.weight, query_node_input.to_invert))
+            inputs_key.append((node_id, tuple(node_inputs_key)))
+        return (
+            index_node_id,
+            schema_name,
+            tuple(inputs_key),
+            tuple(sorted(weight_by_node_id.items())),
+            self._calculate_now_key(now),
+        )
+
+    def get(self, key: Hashable | None) -> Vector | None:
+        if self._max_entries <= 0:
+            return None
+        if key is None:
+            with self._lock:
+                self._metrics.uncacheable_count += 1
+            return None
+        with self._lock:
+            self._invalidate_if_day_passed(key)
+            vector = self._cache.get(key)
+            if vector is None:
+                self._metrics.miss_count += 1
+            else:
+                self._metrics.hit_count += 1
+        return vector
+
+    def put(self, key: Hashable | None, vector: Vector) -> None:
+        if key is None:
+            return
+        with self._lock:
+            self._cache[key] = vector
+
+    def _calculate_now_key(self, now: int) -> tuple[int, int] | None:
+        if not self._is_time_dependent:
+            return None
+        day = now // SECONDS_PER_DAY
+        if self._now_bucket_seconds <= 0:
+            return (day, now)
+        return (day, max(now - now % self._now_bucket_seconds, day * SECONDS_PER_DAY))
+
+    def _invalidate_if_day_passed(self, key: Hashable) -> None:
+        now_key = key[-1]  # type: ignore[index]
+        if now_key is None:
+            return
+        day = now_key[0]
+        if self._latest_day is not None and day > self._latest_day:
+            self._cache.clear()
+        if self._latest_day is None or day > self._latest_day:
+            self._latest_day = day
+
+    @classmethod
+    def _to_key(cls, value: Any) -> Hashable:
+        if value is None or isinstance(value, (str, int, float, bool)):
+            return value
+        if isinstance(value, Vector):
+            return (Vector.__name__, value.value.tobytes(), tuple(sorted(value.negative_filter_indices)))
+        if isinstance(value, (list, tuple)):
+            keys = tuple(cls._to_key(item) for item in value)
+            return UNCACHEABLE if UNCACHEABLE in keys else keys
+        return UNCACHEABLE
@@ -14,16 +14,29 @@
 
 from collections.abc import Mapping
 
-from beartype.typing import Sequence
+from beartype.typing import Hashable, Sequence, cast
 
 from superlinked.framework.common.dag.context import (
+    SPACE_WEIGHT_PARAM_NAME,
     ExecutionContext,
-    ExecutionEnvironment,
-    NowStrategy,
 )
 from superlinked.framework.common.dag.dag import Dag
+from superlinked.framework.common.dag.recency_node import RecencyNode
 from superlinked.framework.common.data_types import Vector
-from superlinked.framework.common.schema.id_schema_object import IdSchemaObject
+from superlinked.framework.common.settings import Settings
+from superlinked.framework.dsl.query.query_clause import (
+    SimilarFilterClause,
+    SpaceWeightClause,
+)
+from superlinked.framework.dsl.query.query_descriptor import QueryDescriptor
+from superlinked.framework.dsl.query.query_param_value_setter import (
+    QueryParamValueSetter,
+)
+from superlinked.framework.dsl.query.query_plan import QueryPlan
+from superlinked.framework.dsl.query.query_vector_cache import (
+    QueryVectorCache,
+    QueryVectorCacheMetrics,
+)
 from superlinked.framework.dsl.query.query_weighting import QueryWeighting
 from superlinked.framework.dsl.space.space import Space
 from superlinked.framework.query.dag.query_index_node import (
@@ -41,40 +54,116 @@ class QueryVectorFactory:
     def __init__(self, dag: Dag) -> None:
         self._evaluator = QueryDagEvaluator(dag)
         self._query_weighting = QueryWeighting(dag)
+        settings = Settings()
+        self._query_vector_cache = QueryVectorCache(
+            settings.QUERY_VECTOR_CACHE_MAX_ENTRIES,
+            any(isinstance(node, RecencyNode) for node in dag.nodes),
+            settings.QUERY_VECTOR_CACHE_NOW_BUCKET_SECONDS,
+        )
+
+    @property
+    def query_vector_cache_metrics(self) -> QueryVectorCacheMetrics:
+        return self._query_vector_cache.metrics
+
+    def create_query_plan(self, query_descriptor: QueryDescriptor) -> QueryPlan:
+        query_descriptor_with_all_clauses = query_descriptor.append_missing_mandatory_clauses()
+        schema = query_descriptor_with_all_clauses.schema
+        spaces = [
+            clause.space
+            for clause in query_descriptor_with_all_clauses.clauses
+            if isinstance(clause, (SpaceWeightClause, SimilarFilterClause))
+        ]
+        embedding_node_id_by_space = {space: space._get_embedding_node(schema).node_id for space in spaces}
+        return QueryPlan(
+            query_descriptor_with_all_clauses,
+            QueryParamValueSetter.get_param_names(query_descriptor_with_all_clauses),
+            query_descriptor_with_all_clauses.index._node_id,
+            schema._schema_name,
+            embedding_node_id_by_space,
+            {
+                space: self._query_weighting.get_weighable_node_id(node_id)
+                for space, node_id in embedding_node_id_by_space.items()
+            },
+        )
 
     def produce_vector(
         self,
-        index_node_id: str,
+        query_plan: QueryPlan,
         query_node_inputs_by_node_id: Mapping[str, Sequence[QueryNodeInput]],
-        global_space_weight_map: dict[Space, float],
-        schema: IdSchemaObject,
-        context_base: ExecutionContext,
+        global_space_weight_map: Mapping[Space, float],
+        context: ExecutionContext,
     ) -> Vector:
-        space_node_id_weight_map: dict[str, float] = self.__get_node_id_weight_map_from_space_weight_map(
-            schema, global_space_weight_map
-        )
-        context = self._create_query_context(context_base, index_node_id, schema._schema_name, space_node_id_weight_map)
-        result = self._evaluator.evaluate(query_node_inputs_by_node_id, context)
-        return result
+        weight_by_node_id = self._get_weight_by_node_id(query_plan, global_space_weight_map)
+        cache_key = self._calculate_cache_key(query_plan, query_node_inputs_by_node_id, weight_by_node_id, context)
+        if (vector := self._query_vector_cache.get(cache_key)) is None:
+            vector = self._evaluator.evaluate(
+                query_node_inputs_by_node_id, self._set_query_context(context, query_plan, weight_by_node_id)
+            )
+            self._query_vector_cache.put(cache_key, vector)
+        return vector
 
-    def _create_query_context(
+    def produce_vectors(
         self,
-        context_base: ExecutionContext,
-        index_node_id: str,
-        schema_name: str,
-        node_id_weight_map: dict[str, float],
-    ) -> ExecutionContext:
-        eval_context = ExecutionContext(
-            environment=ExecutionEnvironment.QUERY,
-            data=context_base.data,
-            now_strategy=NowStrategy.CONTEXT_TIME,
+        query_plan: QueryPlan,
+        query_node_inputs_by_node_id_list: Sequence[Mapping[str, Sequence[QueryNodeInput]]],
+        global_space_weight_maps: Sequence[Mapping[Space, float]],
+        contexts: Sequence[ExecutionContext],
+    ) -> list[Vector]:
+        weight_by_node_id_list = [
+            self._get_weight_by_node_id(query_plan, global_space_weight_map)
+            for global_space_weight_map in global_space_weight_maps
+        ]
+        cache_keys = [
+            self._calculate_cache_key(query_plan, query_node_inputs_by_node_id, weight_by_node_id, context)
+            for query_node_inputs_by_node_id, weight_by_node_id, context in zip(
+                query_node_inputs_by_node_id_list, weight_by_node_id_list, contexts
+            )
+        ]
+        vectors: list[Vector | None] = [self._query_vector_cache.get(cache_key) for cache_key in cache_keys]
+        if missing_indices := [i for i, vector in enumerate(vectors) if vector is None]:
+            evaluated_vectors = self._evaluator.evaluate_batch(
+                [query_node_inputs_by_node_id_list[i] for i in missing_indices],
+                [self._set_query_context(contexts[i], query_plan, weight_by_node_id_list[i]) for i in missing_indices],
+            )
+            for i, vector in zip(missing_indices, evaluated_vectors):
+                self._query_vector_cache.put(cache_keys[i], vector)
+                vectors[i] = vector
+        return cast(list[Vector], vectors)
+
+    def _calculate_cache_key(
+        self,
+        query_plan: QueryPlan,
+        query_node_inputs_by_node_id: Mapping[str, Sequence[QueryNodeInput]],
+        weight_by_node_id: Mapping[str, float],
+        context: ExecutionContext,
+    ) -> Hashable | None:
+        return self._query_vector_cache.calculate_key(
+            query_plan.index_node_id,
+            query_plan.schema_name,
+            query_node_inputs_by_node_id,
+            weight_by_node_id,
+            context.now(),
         )
-        eval_context.update_data(self._query_weighting.get_node_weights(node_id_weight_map))
-        eval_context.set_node_context_value(index_node_id, QUERIED_SCHEMA_NAME_CONTEXT_KEY, schema_name)
-        return eval_context
 
     @staticmethod
-    def __get_node_id_weight_map_from_space_weight_map(
-        schema: IdSchemaObject, space_weight_map: dict[Space, float]
-    ) -> dict[str, float]:
-        return {space._get_embedding_node(schema).node_id: weight for space, weight in space_weight_map.items()}
+    def _get_weight_by_node_id(query_plan: QueryPlan, space_weight_map: Mapping[Space, float]) -> dict[str, float]:
+        weighable_node_id_by_space = query_plan.weighable_node_id_by_space
+        return {weighable_node_id_by_space[space]: weight for space, weight in space_weight_map.items()}
+
+    @staticmethod
+    def _set_query_context(
+        context: ExecutionContext,
+        query_plan: QueryPlan,
+        weight_by_node_id: Mapping[str, float],
+    ) -> ExecutionContext:
+        """
+        Writes the node weights and the queried schema into the given, per query context.
+        """
+        for node_id, weight in weight_by_node_id.items():
+            context.set_node_context_value(node_id, SPACE_WEIGHT_PARAM_NAME, weight)
+        context.set_node_context_value(
+            query_plan.index_node_id,
+            QUERIED_SCHEMA_NAME_CONTEXT_KEY,
+            query_plan.schema_name,
+        )
+        return context
@@ -13,7 +13,6 @@
 # limitations under the License.
 
 from superlinked.framework.common.dag.concatenation_node import ConcatenationNode
-from superlinked.framework.common.dag.context import SPACE_WEIGHT_PARAM_NAME
 from superlinked.framework.common.dag.dag import Dag
 from superlinked.framework.common.dag.node import Node
 from superlinked.framework.common.exception import InvalidSchemaException
@@ -29,12 +28,6 @@ class QueryWeighting:
     def __init__(self, dag: Dag) -> None:
         self.__node_id_weighable_node_id_map = self._init_weighable_node_map(dag)
 
-    def get_node_weights(self, node_id_weight_map: dict[str, float]) -> dict[str, dict[str, float]]:
-        return {
-            self.get_weighable_node_id(node_id): {SPACE_WEIGHT_PARAM_NAME: weight}
-            for node_id, weight in node_id_weight_map.items()
-        }
-
     def get_weighable_node_id(self, node_id: str) -> str:
         return self.__node_id_weighable_node_id_map.get(node_id, node_id)
 
@@ -0,0 +1,75 @@
+# Copyright 2024 Superlinked, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import pandas as pd
+from beartype.typing import Any, Callable, Iterator
+
+from superlinked.framework.dsl.source.data_format import DataFormat
+
+
+class DataLoaderReader:
+    """
+    Reads a data file chunk by chunk, so only `chunk_size` rows are held in memory at a time.
+    CSV, FWF and line-delimited JSON are read with the chunked pandas readers, Parquet by record batches.
+    Formats without a streaming reader (XML, ORC and non line-delimited JSON) are read at once and then split.
+    """
+
+    def __init__(self, path: str, data_format: DataFormat, pandas_read_kwargs: dict[str, Any] | None = None) -> None:
+        self._path = path
+        self._format = data_format
+        self._pandas_read_kwargs = pandas_read_kwargs or {}
+
+    def read_chunks(self, chunk_size: int) -> Iterator[pd.DataFrame]:
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+        match self._format:
+            case DataFormat.CSV:
+                yield from self._read_with_chunked_reader(pd.read_csv, chunk_size)
+            case DataFormat.FWF:
+                yield from self._read_with_chunked_reader(pd.read_fwf, chunk_size)
+            case DataFormat.JSON if self._pandas_read_kwargs.get("lines"):
+                yield from self._read_with_chunked_reader(pd.read_json, chunk_size)
+            case DataFormat.PARQUET:
+                yield from self._read_parquet(chunk_size)
+            case _:
+                yield from self._split(self._read_whole(), chunk_size)
+
+    def _read_with_chunked_reader(self, read: Callable[..., Any], chunk_size: int) -> Iterator[pd.DataFrame]:
+        with read(self._path, chunksize=chunk_size, **self._pandas_read_kwargs) as reader:
+            yield from reader
+
+    def _read_parquet(self, chunk_size: int) -> Iterator[pd.DataFrame]:
+        # pyarrow is an optional dependency, pandas needs it for reading parquet files as well
+        import pyarrow.dataset  # pylint: disable=import-outside-toplevel
+
+        dataset = pyarrow.dataset.dataset(self._path, format="parquet")
+        for record_batch in dataset.to_batches(
+            columns=self._pandas_read_kwargs.get("columns"),
+            batch_size=chunk_size,
+        ):
+            yield record_batch.to_pandas()
+
+    def _read_whole(self) -> pd.DataFrame:
+        read_by_format: dict[DataFormat, Callable[..., pd.DataFrame]] = {
+            DataFormat.JSON: pd.read_json,
+            DataFormat.XML: pd.read_xml,
+            DataFormat.ORC: pd.read_orc,
+        }
+        return read_by_format[self._format](self._path, **self._pandas_read_kwargs)
+
+    def _split(self, data: pd.DataFrame, chunk_size: int) -> Iterator[pd.DataFrame]:
+        for start in range(0, len(data), chunk_size):
+            yield data.iloc[start : start + chunk_size]
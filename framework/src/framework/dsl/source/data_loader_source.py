@@ -12,25 +12,21 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import time
 from dataclasses import dataclass
-from enum import Enum, auto
 
-from beartype.typing import Any, Generic, cast
+from beartype.typing import Any, Callable, Generic, cast
 
 from superlinked.framework.common.parser.data_parser import DataParser
 from superlinked.framework.common.parser.dataframe_parser import DataFrameParser
 from superlinked.framework.common.schema.id_schema_object import IdSchemaObjectT
+from superlinked.framework.common.settings import Settings
 from superlinked.framework.common.source.types import SourceTypeT
+from superlinked.framework.dsl.source.data_format import DataFormat
+from superlinked.framework.dsl.source.data_loader_reader import DataLoaderReader
 from superlinked.framework.online.source.online_source import OnlineSource
 
-
-class DataFormat(Enum):
-    CSV = auto()
-    FWF = auto()
-    XML = auto()
-    JSON = auto()
-    PARQUET = auto()
-    ORC = auto()
+CHUNK_SIZE_READ_KWARG = "chunksize"
 
 
 @dataclass
@@ -41,6 +37,24 @@ class DataLoaderConfig:
     pandas_read_kwargs: dict[str, Any] | None = None
 
 
+@dataclass(frozen=True)
+class DataLoadProgress:
+    """
+    `read_seconds` is the time spent reading the file, `ingest_seconds` the time the reader was held back
+    while the chunks already read were parsed, embedded and stored.
+    """
+
+    chunk_count: int = 0
+    row_count: int = 0
+    read_seconds: float = 0.0
+    ingest_seconds: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        elapsed_seconds = self.read_seconds + self.ingest_seconds
+        return self.row_count / elapsed_seconds if elapsed_seconds else 0.0
+
+
 class DataLoaderSource(OnlineSource[IdSchemaObjectT, SourceTypeT], Generic[IdSchemaObjectT, SourceTypeT]):
     def __init__(
         self,
@@ -64,3 +78,42 @@ class DataLoaderSource(OnlineSource[IdSchemaObjectT, SourceTypeT], Generic[IdSch
     @property
     def name(self) -> str:
         return self.config.name or self._schema._schema_name
+
+    def load(self, on_progress: Callable[[DataLoadProgress], None] | None = None) -> DataLoadProgress:
+        """
+        Streams the configured file into the source chunk by chunk, so memory usage is bounded by the chunk size
+        instead of the size of the file. The next chunk is only read once the previous one is ingested.
+
+        Args:
+            on_progress (Callable[[DataLoadProgress], None] | None): Called after every ingested chunk
+                with the cumulative progress. Defaults to None.
+        Returns:
+            DataLoadProgress: The progress after the whole file was loaded.
+        """
+        read_kwargs = dict(self.config.pandas_read_kwargs or {})
+        chunk_size = read_kwargs.pop(CHUNK_SIZE_READ_KWARG, None) or Settings().ONLINE_PUT_CHUNK_SIZE
+        chunks = DataLoaderReader(self.config.path, self.config.format, read_kwargs).read_chunks(chunk_size)
+        progress = DataLoadProgress()
+        while True:
+            read_start = time.perf_counter()
+            chunk = next(chunks, None)
+            ingest_start = time.perf_counter()
+            if chunk is None:
+                break
+            self.put(cast(SourceTypeT, chunk))
+            progress = DataLoadProgress(
+                progress.chunk_count + 1,
+                progress.row_count + len(chunk),
+                progress.read_seconds + ingest_start - read_start,
+                progress.ingest_seconds + time.perf_counter() - ingest_start,
+            )
+            self._logger.info(
+                "loaded data chunk",
+                loader=self.name,
+                chunk_count=progress.chunk_count,
+                row_count=progress.row_count,
+                rows_per_second=progress.rows_per_second,
+            )
+            if on_progress is not None:
+                on_progress(progress)
+        return progress
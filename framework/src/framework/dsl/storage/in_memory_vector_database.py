@@ -12,9 +12,16 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from superlinked.framework.common.storage.search_index.search_algorithm import (
+    SearchAlgorithm,
+)
 from superlinked.framework.dsl.storage.vector_database import VectorDatabase
 from superlinked.framework.storage.common.vdb_settings import VDBSettings
 from superlinked.framework.storage.in_memory.in_memory_vdb import InMemoryVDB
+from superlinked.framework.storage.in_memory.ivf_params import IVFParams
+from superlinked.framework.storage.in_memory.quantization_params import (
+    QuantizationParams,
+)
 
 
 class InMemoryVectorDatabase(VectorDatabase[InMemoryVDB]):
@@ -25,17 +32,32 @@ class InMemoryVectorDatabase(VectorDatabase[InMemoryVDB]):
     and development purposes.
     """
 
-    def __init__(self, default_query_limit: int = -1) -> None:
+    def __init__(
+        self,
+        default_query_limit: int = -1,
+        search_algorithm: SearchAlgorithm = SearchAlgorithm.FLAT,
+        ivf_params: IVFParams | None = None,
+        quantization_params: QuantizationParams | None = None,
+    ) -> None:
         """
         Initialize the InMemoryVectorDatabase.
 
         Args:
             default_query_limit (int): The default limit for query results. A value of -1 indicates no limit.
+            search_algorithm (SearchAlgorithm): FLAT for exact search, IVF_FLAT for approximate search
+                over clustered vectors. Defaults to FLAT.
+            ivf_params (IVFParams | None): Recall-latency settings of the IVF_FLAT search algorithm.
+                Defaults to IVFParams().
+            quantization_params (QuantizationParams | None): Stores the searched vectors as float16 or int8
+                and sets how many candidates are rescored with their float32 copy. Defaults to no quantization.
 
         Sets up an in-memory vector DB connector for testing and development.
         """
         super().__init__()
         self.__settings = VDBSettings(default_query_limit)
+        self.__search_algorithm = search_algorithm
+        self.__ivf_params = ivf_params
+        self.__quantization_params = quantization_params
 
     @property
     def _vdb_connector(self) -> InMemoryVDB:
@@ -45,4 +67,4 @@ class InMemoryVectorDatabase(VectorDatabase[InMemoryVDB]):
         Returns:
             InMemoryVDB: The in-memory vector database connector instance.
         """
-        return InMemoryVDB(self.__settings)
+        return InMemoryVDB(self.__settings, self.__search_algorithm, self.__ivf_params, self.__quantization_params)
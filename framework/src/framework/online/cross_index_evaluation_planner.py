@@ -0,0 +1,31 @@
+# Copyright 2024 Superlinked, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections import Counter
+
+from beartype.typing import Sequence
+
+from superlinked.framework.online.online_dag_evaluator import OnlineDagEvaluator
+
+
+class CrossIndexEvaluationPlanner:
+    """
+    Finds the nodes shared by the compiled online dags of several indices, e.g. the nodes of a space
+    used by more than one index. These are evaluated once per batch and their results reused by every index.
+    """
+
+    @staticmethod
+    def find_shared_node_ids(evaluators: Sequence[OnlineDagEvaluator]) -> frozenset[str]:
+        evaluator_count_by_node_id = Counter(node_id for evaluator in evaluators for node_id in evaluator.node_ids)
+        return frozenset(node_id for node_id, count in evaluator_count_by_node_id.items() if count > 1)
@@ -29,6 +29,7 @@ from superlinked.framework.online.dag.evaluation_result import (
     EvaluationResult,
     SingleEvaluationResult,
 )
+from superlinked.framework.online.dag.online_dag_scheduler import OnlineDagScheduler
 from superlinked.framework.online.dag.online_node import OnlineNode
 from superlinked.framework.online.dag.parent_results import ParentResults
 
@@ -120,7 +121,10 @@ class DefaultOnlineNode(OnlineNode[NT, NodeDataT], ABC, Generic[NT, NodeDataT]):
         parsed_schemas: list[ParsedSchema],
         context: ExecutionContext,
     ) -> list[dict[OnlineNode, EvaluationResult]]:
-        inverse_parent_results = {parent: parent.evaluate_next(parsed_schemas, context) for parent in self.parents}
+        if (scheduler := OnlineDagScheduler.get_scheduler()) is not None:
+            inverse_parent_results = scheduler.evaluate_branches(self.parent_branches, parsed_schemas, context)
+        else:
+            inverse_parent_results = OnlineDagScheduler.evaluate_branch(self.parents, parsed_schemas, context)
         return [
             {parent: inverse_parent_results[parent][i] for parent in self.parents} for i in range(len(parsed_schemas))
         ]
@@ -153,8 +157,15 @@ class DefaultOnlineNode(OnlineNode[NT, NodeDataT], ABC, Generic[NT, NodeDataT]):
         parent_results: list[ParentResults],
     ) -> list[NodeDataT]:
         single_result_all = self._evaluate_singles(parent_results, context)
+        fallback_indices = [i for i, single_result in enumerate(single_result_all) if single_result is None]
+        fallback_results = dict(
+            zip(
+                fallback_indices,
+                self.get_fallback_results([parsed_schemas[i] for i in fallback_indices]),
+            )
+        )
         return [
-            (single_result if single_result is not None else self.get_fallback_result(parsed_schemas[i]))
+            (single_result if single_result is not None else fallback_results[i])
             for i, single_result in enumerate(single_result_all)
         ]
 
@@ -170,4 +181,12 @@ class DefaultOnlineNode(OnlineNode[NT, NodeDataT], ABC, Generic[NT, NodeDataT]):
         self,
         parsed_schema: ParsedSchema,
     ) -> NodeDataT:
-        return self.load_stored_result_or_raise_exception(parsed_schema)
+        return self.get_fallback_results([parsed_schema])[0]
+
+    def get_fallback_results(
+        self,
+        parsed_schemas: list[ParsedSchema],
+    ) -> list[NodeDataT]:
+        if not parsed_schemas:
+            return []
+        return self.load_stored_results_or_raise_exception(parsed_schemas)
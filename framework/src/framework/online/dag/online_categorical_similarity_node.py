@@ -14,7 +14,7 @@
 
 from __future__ import annotations
 
-from beartype.typing import cast
+from beartype.typing import Sequence, cast
 from typing_extensions import override
 
 from superlinked.framework.common.dag.categorical_similarity_node import (
@@ -42,7 +42,7 @@ class OnlineCategoricalSimilarityNode(OnlineNode[CategoricalSimilarityNode, Vect
         storage_manager: StorageManager,
     ) -> None:
         super().__init__(node, parents, storage_manager)
-        self._embedding_transformation = TransformationFactory.create_embedding_transformation(
+        self._embedding_transformation = TransformationFactory.create_multi_embedding_transformation(
             self.node.transformation_config
         )
 
@@ -52,7 +52,7 @@ class OnlineCategoricalSimilarityNode(OnlineNode[CategoricalSimilarityNode, Vect
         return self.node.length
 
     @property
-    def embedding_transformation(self) -> Step[list[str], Vector]:
+    def embedding_transformation(self) -> Step[Sequence[list[str]], list[Vector]]:
         return self._embedding_transformation
 
     @override
@@ -61,23 +61,25 @@ class OnlineCategoricalSimilarityNode(OnlineNode[CategoricalSimilarityNode, Vect
         parsed_schemas: list[ParsedSchema],
         context: ExecutionContext,
     ) -> list[EvaluationResult[Vector]]:
-        return [self.evaluate_self_single(schema, context) for schema in parsed_schemas]
+        results: Sequence[Vector]
+        if len(self.parents) == 0:
+            results = [
+                stored_result if stored_result is not None else Vector.init_zero_vector(self.node.length)
+                for stored_result in self.load_stored_results(parsed_schemas)
+            ]
+        else:
+            inputs = cast(OnlineNode[Node[str | list[str]], str | list[str]], self.parents[0]).evaluate_next(
+                parsed_schemas, context
+            )
+            categories = [
+                input_.main.value if isinstance(input_.main.value, list) else [input_.main.value] for input_ in inputs
+            ]
+            results = self.embedding_transformation.transform(categories, context)
+        return [EvaluationResult(self._get_single_evaluation_result(result)) for result in results]
 
     def evaluate_self_single(
         self,
         parsed_schema: ParsedSchema,
         context: ExecutionContext,
     ) -> EvaluationResult[Vector]:
-        if len(self.parents) == 0:
-            result = self.load_stored_result(parsed_schema.id_, parsed_schema.schema)
-            if result is None:
-                result = Vector.init_zero_vector(self.node.length)
-        else:
-            input_: str | list[str] = (
-                cast(OnlineNode[Node[str | list[str]], str | list[str]], self.parents[0])
-                .evaluate_next_single(parsed_schema, context)
-                .main.value
-            )
-            categories = input_ if isinstance(input_, list) else [input_]
-            result = self.embedding_transformation.transform(categories, context)
-        return EvaluationResult(self._get_single_evaluation_result(result))
+        return self.evaluate_self([parsed_schema], context)[0]
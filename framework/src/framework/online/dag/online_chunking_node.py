@@ -43,44 +43,30 @@ class OnlineChunkingNode(OnlineNode[ChunkingNode, str]):
             ParentValidationType.EXACTLY_ONE_PARENT,
         )
 
-    def __chunk(
-        self,
-        text: str,
-        chunk_size: int | None,
-        chunk_overlap: int | None,
-        split_chars_keep: list[str] | None = None,
-        split_chars_remove: list[str] | None = None,
-    ) -> list[str]:
-        chunker = Chunker()
-        return chunker.chunk_text(text, chunk_size, chunk_overlap, split_chars_keep, split_chars_remove)
-
     @override
     def evaluate_self(
         self,
         parsed_schemas: list[ParsedSchema],
         context: ExecutionContext,
     ) -> list[EvaluationResult[str]]:
-        return [self.evaluate_self_single(schema, context) for schema in parsed_schemas]
-
-    def evaluate_self_single(
-        self,
-        parsed_schema: ParsedSchema,
-        context: ExecutionContext,
-    ) -> EvaluationResult[str]:
-        input_: EvaluationResult[str] = cast(OnlineNode[Node[str], str], self.parents[0]).evaluate_next_single(
-            parsed_schema, context
+        inputs: list[EvaluationResult[str]] = cast(OnlineNode[Node[str], str], self.parents[0]).evaluate_next(
+            parsed_schemas, context
         )
-        if len(input_.chunks) > 0:
+        if any(len(input_.chunks) > 0 for input_ in inputs):
             # We can just log a warning and proceed with input_.main.
             raise ChunkException(f"{self.class_name} cannot have a chunked input.")
-        input_value = input_.main.value
-        chunk_inputs = self.__chunk(
-            input_value,
+        input_values = [input_.main.value for input_ in inputs]
+        chunk_inputs_list = Chunker().chunk_texts(
+            input_values,
             self.node.chunk_size,
             self.node.chunk_overlap,
             self.node.split_chars_keep,
             self.node.split_chars_remove,
         )
-        main = self._get_single_evaluation_result(input_value)
-        chunks = [self._get_single_evaluation_result(chunk_input) for chunk_input in chunk_inputs]
-        return EvaluationResult(main, chunks)
+        return [
+            EvaluationResult(
+                self._get_single_evaluation_result(input_value),
+                [self._get_single_evaluation_result(chunk_input) for chunk_input in chunk_inputs],
+            )
+            for input_value, chunk_inputs in zip(input_values, chunk_inputs_list)
+        ]
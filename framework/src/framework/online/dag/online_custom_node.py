@@ -79,6 +79,11 @@ class OnlineCustomVectorEmbeddingNode(
                 )
             )
             return [result] * len(parsed_schemas)
+        if len(self.parents) == 0:
+            return [
+                EvaluationResult(self._get_single_evaluation_result(stored_result))
+                for stored_result in self.load_stored_results_or_raise_exception(parsed_schemas)
+            ]
         return [self.evaluate_self_single(schema, context) for schema in parsed_schemas]
 
     def evaluate_self_single(
@@ -60,6 +60,15 @@ class OnlineCustomVectorEmbeddingNode(OnlineNode[CustomVectorEmbeddingNode, Vect
         parsed_schemas: list[ParsedSchema],
         context: ExecutionContext,
     ) -> list[EvaluationResult[Vector]]:
+        if len(self.parents) == 0:
+            return [
+                EvaluationResult(
+                    self._get_single_evaluation_result(
+                        stored_result if stored_result is not None else Vector.init_zero_vector(self.node.length)
+                    )
+                )
+                for stored_result in self.load_stored_results(parsed_schemas)
+            ]
         return [self.evaluate_self_single(schema, context) for schema in parsed_schemas]
 
     def evaluate_self_single(
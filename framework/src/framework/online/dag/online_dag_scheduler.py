@@ -0,0 +1,116 @@
+# Copyright 2024 Superlinked, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import atexit
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextvars import ContextVar, copy_context
+from functools import lru_cache
+
+import structlog
+from beartype.typing import TYPE_CHECKING, Sequence
+
+from superlinked.framework.common.dag.context import ExecutionContext
+from superlinked.framework.common.parser.parsed_schema import ParsedSchema
+from superlinked.framework.common.settings import Settings
+from superlinked.framework.online.dag.evaluation_result import EvaluationResult
+
+if TYPE_CHECKING:
+    from superlinked.framework.online.dag.online_node import OnlineNode
+
+logger = structlog.getLogger()
+
+# set in the worker threads, where branches are evaluated one after another to never wait for the pool
+_is_in_worker: ContextVar[bool] = ContextVar("is_in_online_dag_worker", default=False)
+
+
+class OnlineDagScheduler:
+    """
+    Evaluates the independent branches of an online dag concurrently on a thread pool.
+    The model calls of the embedding nodes release the GIL, so evaluating a node with a text and an image
+    branch takes about as long as its slower branch instead of the sum of the two.
+    """
+
+    def __init__(self, worker_count: int) -> None:
+        self._executor = ThreadPoolExecutor(max_workers=worker_count, thread_name_prefix="online-dag")
+        atexit.register(self._executor.shutdown)
+        logger.info("started online dag worker pool", worker_count=worker_count)
+
+    @classmethod
+    def get_scheduler(cls) -> OnlineDagScheduler | None:
+        worker_count = Settings().ONLINE_DAG_WORKER_COUNT
+        if worker_count <= 0:
+            return None
+        return cls._get_instance(worker_count)
+
+    @classmethod
+    @lru_cache(maxsize=1)
+    def _get_instance(cls, worker_count: int) -> OnlineDagScheduler:
+        return cls(worker_count)
+
+    @staticmethod
+    def plan_parent_branches(
+        node: OnlineNode, ancestors_by_node: dict[OnlineNode, frozenset[OnlineNode]]
+    ) -> list[list[OnlineNode]]:
+        """
+        Groups the parents of `node` into branches that share no ancestors,
+        so no node is evaluated by two branches at the same time. Keeps the order of the parents.
+        """
+        branches: list[tuple[set[OnlineNode], list[OnlineNode]]] = []
+        for parent in node.parents:
+            ancestors, parents = set(ancestors_by_node[parent]), [parent]
+            for branch in [branch for branch in branches if branch[0] & ancestors]:
+                branches.remove(branch)
+                ancestors |= branch[0]
+                parents += branch[1]
+            branches.append((ancestors, parents))
+        parent_order = {parent: i for i, parent in enumerate(node.parents)}
+        return sorted(
+            (sorted(parents, key=parent_order.__getitem__) for _, parents in branches),
+            key=lambda parents: parent_order[parents[0]],
+        )
+
+    def evaluate_branches(
+        self,
+        branches: Sequence[Sequence[OnlineNode]],
+        parsed_schemas: list[ParsedSchema],
+        context: ExecutionContext,
+    ) -> dict[OnlineNode, list[EvaluationResult]]:
+        if len(branches) < 2 or _is_in_worker.get():
+            return self.evaluate_branch([parent for branch in branches for parent in branch], parsed_schemas, context)
+        futures = [
+            self._executor.submit(copy_context().run, self._evaluate_branch_in_worker, branch, parsed_schemas, context)
+            for branch in branches[1:]
+        ]
+        try:
+            results = self.evaluate_branch(branches[0], parsed_schemas, context)
+        finally:
+            wait(futures)
+        for future in futures:
+            results.update(future.result())
+        return results
+
+    @staticmethod
+    def evaluate_branch(
+        parents: Sequence[OnlineNode], parsed_schemas: list[ParsedSchema], context: ExecutionContext
+    ) -> dict[OnlineNode, list[EvaluationResult]]:
+        return {parent: parent.evaluate_next(parsed_schemas, context) for parent in parents}
+
+    @classmethod
+    def _evaluate_branch_in_worker(
+        cls, parents: Sequence[OnlineNode], parsed_schemas: list[ParsedSchema], context: ExecutionContext
+    ) -> dict[OnlineNode, list[EvaluationResult]]:
+        _is_in_worker.set(True)
+        return cls.evaluate_branch(parents, parsed_schemas, context)
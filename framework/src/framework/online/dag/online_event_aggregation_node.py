@@ -16,7 +16,7 @@ from __future__ import annotations
 
 import math
 
-from beartype.typing import Sequence
+from beartype.typing import Sequence, cast
 from typing_extensions import override
 
 from superlinked.framework.common.const import constants
@@ -98,42 +98,74 @@ class OnlineEventAggregationNode(OnlineNode[EventAggregationNode, Vector], HasLe
         parsed_schemas: list[ParsedSchema],
         context: ExecutionContext,
     ) -> list[EvaluationResult[Vector]]:
-        return [self.evaluate_self_single(schema, context) for schema in parsed_schemas]
+        """
+        Events affecting the same entity are folded in order, each one building on the result
+        and metadata of the previous one. The stored states of all affected entities are read
+        in a single call, and the updated metadata is written back once per entity.
+        """
+        for parsed_schema in parsed_schemas:
+            self.__check_schema_validity(parsed_schema.schema)
+        stored_states = self._read_stored_states(parsed_schemas)
+        event_inputs_by_index = self._calculate_event_inputs_by_index(parsed_schemas, context)
+        updated_metadata_by_object_id: dict[str, dict[str, int]] = {}
+        results = []
+        for i, parsed_schema in enumerate(parsed_schemas):
+            stored_result, stored_metadata = stored_states[parsed_schema.id_]
+            result = stored_result or Vector.empty_vector()
+            event_input = event_inputs_by_index.get(i)
+            if event_input is not None and not self._should_return_stored_result(*event_input):
+                affecting_vector, weights = event_input
+                event_metadata = self._calculate_metadata(
+                    stored_metadata, cast(ParsedSchemaWithEvent, parsed_schema), len(weights)
+                )
+                event_aggregator_params = EventAggregatorParams(
+                    context,
+                    result,
+                    Weighted(affecting_vector, sum(weights) / len(weights)),
+                    event_metadata,
+                    self.node.effect_modifier,
+                    self._transformation_config,
+                )
+                result = EventAggregator(event_aggregator_params).calculate_event_vector()
+                stored_metadata = self._to_stored_metadata(event_metadata)
+                updated_metadata_by_object_id[parsed_schema.id_] = stored_metadata
+            stored_states[parsed_schema.id_] = (result, stored_metadata)
+            results.append(EvaluationResult(self._get_single_evaluation_result(result)))
+        self._write_updated_metadata(updated_metadata_by_object_id)
+        return results
+
+    def _read_stored_states(self, parsed_schemas: Sequence[ParsedSchema]) -> dict[str, tuple[Vector | None, dict]]:
+        return self.storage_manager.read_node_results_with_node_data(
+            self.node.affected_schema.schema,
+            [parsed_schema.id_ for parsed_schema in parsed_schemas],
+            self.node_id,
+            Vector,
+            self._metadata_key,
+            {
+                OnlineEventAggregationNode.EFFECT_COUNT_KEY: int,
+                OnlineEventAggregationNode.EFFECT_AVG_TS_KEY: int,
+                OnlineEventAggregationNode.EFFECT_OLDEST_TS_KEY: int,
+            },
+        )
 
-    def evaluate_self_single(
+    def _calculate_event_inputs_by_index(
         self,
-        parsed_schema: ParsedSchema,
+        parsed_schemas: Sequence[ParsedSchema],
         context: ExecutionContext,
-    ) -> EvaluationResult[Vector]:
-        self.__check_schema_validity(parsed_schema.schema)
-        stored_result = self.load_stored_result(parsed_schema.id_, parsed_schema.schema) or Vector.empty_vector()
+    ) -> dict[int, tuple[Vector, Sequence[float]]]:
         input_to_aggregate = self._input_to_aggregate
-        if (
-            not isinstance(parsed_schema, ParsedSchemaWithEvent)
-            or self.node.event_schema != parsed_schema.event_parsed_schema.schema
-            or input_to_aggregate is None
-        ):
-            return EvaluationResult(self._get_single_evaluation_result(stored_result))
-
-        affecting_vector = self._calculate_affecting_vector(
-            context, parsed_schema.event_parsed_schema, input_to_aggregate
-        )
-        weights = self._calculate_affecting_weights(parsed_schema.event_parsed_schema, context)
-        if self._should_return_stored_result(affecting_vector, weights):
-            return EvaluationResult(self._get_single_evaluation_result(stored_result))
-
-        avg_affecting_weight = sum(weights) / len(weights)
-        event_metadata: EventMetadata = self._calculate_and_store_metadata(parsed_schema, len(weights))
-        event_aggregator_params = EventAggregatorParams(
-            context,
-            stored_result,
-            Weighted(affecting_vector, avg_affecting_weight),
-            event_metadata,
-            self.node.effect_modifier,
-            self._transformation_config,
-        )
-        event_vector = EventAggregator(event_aggregator_params).calculate_event_vector()
-        return EvaluationResult(self._get_single_evaluation_result(event_vector))
+        if input_to_aggregate is None:
+            return {}
+        event_parsed_schema_by_index = {
+            i: parsed_schema.event_parsed_schema
+            for i, parsed_schema in enumerate(parsed_schemas)
+            if isinstance(parsed_schema, ParsedSchemaWithEvent)
+            and self.node.event_schema == parsed_schema.event_parsed_schema.schema
+        }
+        event_parsed_schemas = list(event_parsed_schema_by_index.values())
+        affecting_vectors = self._calculate_affecting_vectors(context, event_parsed_schemas, input_to_aggregate)
+        weights_list = self._calculate_affecting_weights(event_parsed_schemas, context)
+        return dict(zip(event_parsed_schema_by_index.keys(), zip(affecting_vectors, weights_list)))
 
     def _should_return_stored_result(self, affecting_vector: Vector, weights: Sequence[float]) -> bool:
         """
@@ -145,21 +177,26 @@ class OnlineEventAggregationNode(OnlineNode[EventAggregationNode, Vector], HasLe
         """
         return affecting_vector.is_empty or not weights
 
-    def _calculate_affecting_vector(
+    def _calculate_affecting_vectors(
         self,
         context: ExecutionContext,
-        event_parsed_schema: EventParsedSchema,
+        event_parsed_schemas: list[EventParsedSchema],
         input_to_aggregate: OnlineNode,
-    ) -> Vector:
-        affecting_parsed_schema = self._map_event_schema_to_affecting_schema(event_parsed_schema)
-        affecting_vector = input_to_aggregate.evaluate_next_single(affecting_parsed_schema, context).main.value
-
-        if not isinstance(affecting_vector, Vector):
+    ) -> list[Vector]:
+        if not event_parsed_schemas:
+            return []
+        affecting_parsed_schemas = [
+            self._map_event_schema_to_affecting_schema(event_parsed_schema)
+            for event_parsed_schema in event_parsed_schemas
+        ]
+        affecting_vectors = [
+            result.main.value for result in input_to_aggregate.evaluate_next(affecting_parsed_schemas, context)
+        ]
+        if invalid_types := [type(vector) for vector in affecting_vectors if not isinstance(vector, Vector)]:
             raise DagEvaluationException(
-                "parent_to_aggregate's evaluation result must be of type Vector" + f", got {type(affecting_vector)}"
+                "parent_to_aggregate's evaluation result must be of type Vector" + f", got {invalid_types[0]}"
             )
-
-        return affecting_vector
+        return cast(list[Vector], affecting_vectors)
 
     def __check_schema_validity(self, schema: SchemaObject) -> None:
         if schema != self.node.affected_schema.schema:
@@ -171,13 +208,22 @@ class OnlineEventAggregationNode(OnlineNode[EventAggregationNode, Vector], HasLe
 
     def _calculate_affecting_weights(
         self,
-        event_parsed_schema: EventParsedSchema,
+        event_parsed_schemas: list[EventParsedSchema],
         context: ExecutionContext,
-    ) -> Sequence[float]:
+    ) -> list[list[float]]:
+        if not event_parsed_schemas:
+            return []
+        filter_results_by_parent = {
+            filter_parent: filter_parent.evaluate_next(event_parsed_schemas, context)
+            for filter_parent in self.weighted_filter_parents
+        }
         return [
-            weight
-            for filter_parent, weight in self.weighted_filter_parents.items()
-            if filter_parent.evaluate_next_single(event_parsed_schema, context).main.value
+            [
+                weight
+                for filter_parent, weight in self.weighted_filter_parents.items()
+                if filter_results_by_parent[filter_parent][i].main.value
+            ]
+            for i in range(len(event_parsed_schemas))
         ]
 
     def _map_event_schema_to_affecting_schema(self, event_parsed_schema: EventParsedSchema) -> ParsedSchema:
@@ -187,12 +233,12 @@ class OnlineEventAggregationNode(OnlineNode[EventAggregationNode, Vector], HasLe
             if field.schema_field == self.node.affecting_schema.reference_field
         )
 
-    def _calculate_and_store_metadata(
+    def _calculate_metadata(
         self,
+        stored_by_key: dict,
         parsed_schema: ParsedSchemaWithEvent,
         new_effect_count: int,
     ) -> EventMetadata:
-        stored_by_key = self._read_stored_metadata(parsed_schema)
         recalculated_effect_count = (
             stored_by_key.get(OnlineEventAggregationNode.EFFECT_COUNT_KEY) or 0
         ) + new_effect_count
@@ -200,30 +246,12 @@ class OnlineEventAggregationNode(OnlineNode[EventAggregationNode, Vector], HasLe
             stored_by_key, parsed_schema, recalculated_effect_count, new_effect_count
         )
         recalculated_oldest_ts = self._calculate_oldest_ts(stored_by_key, parsed_schema)
-        self._write_updated_metadata(
-            parsed_schema,
-            recalculated_effect_count,
-            recalculated_avg_ts,
-            recalculated_oldest_ts,
-        )
         return EventMetadata(
             recalculated_effect_count,
             recalculated_avg_ts,
             recalculated_oldest_ts,
         )
 
-    def _read_stored_metadata(self, parsed_schema: ParsedSchemaWithEvent) -> dict:
-        return self.storage_manager.read_node_data(
-            parsed_schema.schema,
-            parsed_schema.id_,
-            self._metadata_key,
-            {
-                OnlineEventAggregationNode.EFFECT_COUNT_KEY: int,
-                OnlineEventAggregationNode.EFFECT_AVG_TS_KEY: int,
-                OnlineEventAggregationNode.EFFECT_OLDEST_TS_KEY: int,
-            },
-        )
-
     def _calculate_avg_ts(
         self,
         stored_by_key: dict,
@@ -254,20 +282,16 @@ class OnlineEventAggregationNode(OnlineNode[EventAggregationNode, Vector], HasLe
             else parsed_schema.event_parsed_schema.created_at
         )
 
-    def _write_updated_metadata(
-        self,
-        parsed_schema: ParsedSchemaWithEvent,
-        recalculated_effect_count: int,
-        recalculated_avg_ts: int,
-        recalculated_oldest_ts: int,
-    ) -> None:
-        self.storage_manager.write_node_data(
-            parsed_schema.schema,
-            parsed_schema.id_,
+    def _to_stored_metadata(self, event_metadata: EventMetadata) -> dict[str, int]:
+        return {
+            OnlineEventAggregationNode.EFFECT_COUNT_KEY: event_metadata.effect_count,
+            OnlineEventAggregationNode.EFFECT_AVG_TS_KEY: event_metadata.effect_avg_ts,
+            OnlineEventAggregationNode.EFFECT_OLDEST_TS_KEY: event_metadata.effect_oldest_ts,
+        }
+
+    def _write_updated_metadata(self, metadata_by_object_id: dict[str, dict[str, int]]) -> None:
+        self.storage_manager.write_node_data_batch(
+            self.node.affected_schema.schema,
             self._metadata_key,
-            {
-                OnlineEventAggregationNode.EFFECT_COUNT_KEY: recalculated_effect_count,
-                OnlineEventAggregationNode.EFFECT_AVG_TS_KEY: recalculated_avg_ts,
-                OnlineEventAggregationNode.EFFECT_OLDEST_TS_KEY: recalculated_oldest_ts,
-            },
+            metadata_by_object_id,
         )
@@ -15,10 +15,11 @@
 from __future__ import annotations
 
 from abc import ABC, ABCMeta, abstractmethod
+from collections import defaultdict
 from functools import partial
 
 import structlog
-from beartype.typing import Generic
+from beartype.typing import Generic, cast
 
 from superlinked.framework.common.dag.context import ExecutionContext
 from superlinked.framework.common.dag.exception import ParentCountException
@@ -26,12 +27,16 @@ from superlinked.framework.common.dag.node import NT, NodeDataT
 from superlinked.framework.common.exception import DagEvaluationException
 from superlinked.framework.common.parser.parsed_schema import ParsedSchema
 from superlinked.framework.common.schema.schema_object import SchemaObject
+from superlinked.framework.common.storage_manager.node_result_data import (
+    NodeResultData,
+)
 from superlinked.framework.common.storage_manager.storage_manager import StorageManager
 from superlinked.framework.online.dag.evaluation_result import (
     EvaluationResult,
     SingleEvaluationResult,
 )
 from superlinked.framework.online.dag.parent_validator import ParentValidationType
+from superlinked.framework.online.dag.shared_node_results import SharedNodeResults
 
 logger = structlog.get_logger()
 
@@ -47,6 +52,8 @@ class OnlineNode(ABC, Generic[NT, NodeDataT], metaclass=ABCMeta):
         self.node = node
         self.children: list[OnlineNode] = []
         self.parents = parents
+        # groups of parents sharing no ancestors, planned by the schema dag for the OnlineDagScheduler
+        self.parent_branches: list[list[OnlineNode]] = [list(parents)]
         self.storage_manager = storage_manager
         self.validate_parents(parent_validation_type)
         for parent in self.parents:
@@ -67,13 +74,49 @@ class OnlineNode(ABC, Generic[NT, NodeDataT], metaclass=ABCMeta):
         self,
         parsed_schemas: list[ParsedSchema],
         context: ExecutionContext,
+    ) -> list[EvaluationResult[NodeDataT]]:
+        shared_node_results = SharedNodeResults.get_current()
+        if shared_node_results is not None and shared_node_results.is_shared(self.node_id):
+            return shared_node_results.get_or_evaluate(
+                self.node_id, parsed_schemas, partial(self._evaluate_and_persist, parsed_schemas, context)
+            )
+        return self._evaluate_and_persist(parsed_schemas, context)
+
+    def _evaluate_and_persist(
+        self,
+        parsed_schemas: list[ParsedSchema],
+        context: ExecutionContext,
     ) -> list[EvaluationResult[NodeDataT]]:
         results = self.evaluate_self(parsed_schemas, context)
         if self.node.persist_evaluation_result:
-            for i, result in enumerate(results):
-                self.persist(result, parsed_schemas[i])
+            results_to_persist = self._get_results_to_persist(results, parsed_schemas)
+            self.persist_batch(
+                [result for result, _ in results_to_persist],
+                [parsed_schema for _, parsed_schema in results_to_persist],
+            )
         return results
 
+    def _get_results_to_persist(
+        self,
+        results: list[EvaluationResult[NodeDataT]],
+        parsed_schemas: list[ParsedSchema],
+    ) -> list[tuple[EvaluationResult[NodeDataT], ParsedSchema]]:
+        """
+        An object can occur multiple times in a batch, e.g. when several events affect the same entity.
+        Its results without chunks would overwrite each other, so only the last one holding a value is persisted.
+        """
+        last_index_by_object = {
+            (parsed_schema.schema._schema_name, parsed_schema.id_): i
+            for i, (result, parsed_schema) in enumerate(zip(results, parsed_schemas))
+            if result.main.value is not None and not result.chunks
+        }
+        return [
+            (result, parsed_schema)
+            for i, (result, parsed_schema) in enumerate(zip(results, parsed_schemas))
+            if last_index_by_object.get((parsed_schema.schema._schema_name, parsed_schema.id_), i) <= i
+            or result.chunks
+        ]
+
     def evaluate_next_single(
         self,
         parsed_schema: ParsedSchema,
@@ -94,26 +137,30 @@ class OnlineNode(ABC, Generic[NT, NodeDataT], metaclass=ABCMeta):
         result: EvaluationResult[NodeDataT],
         parsed_schema: ParsedSchema,
     ) -> None:
-        self.storage_manager.write_node_result(
-            parsed_schema.schema,
-            parsed_schema.id_,
-            result.main.node_id,
-            result.main.value,
-        )
-        for chunk in result.chunks:
-            self.storage_manager.write_node_result(
-                parsed_schema.schema,
-                chunk.object_id,
-                chunk.node_id,
-                chunk.value,
-                parsed_schema.id_,
+        self.persist_batch([result], [parsed_schema])
+
+    def persist_batch(
+        self,
+        results: list[EvaluationResult[NodeDataT]],
+        parsed_schemas: list[ParsedSchema],
+    ) -> None:
+        node_results: list[NodeResultData] = []
+        for result, parsed_schema in zip(results, parsed_schemas):
+            node_results.append(
+                NodeResultData(parsed_schema.schema, parsed_schema.id_, result.main.node_id, result.main.value)
+            )
+            node_results.extend(
+                NodeResultData(parsed_schema.schema, chunk.object_id, chunk.node_id, chunk.value, parsed_schema.id_)
+                for chunk in result.chunks
+            )
+        self.storage_manager.write_node_results_batch(node_results)
+        for result, parsed_schema in zip(results, parsed_schemas):
+            logger.debug(
+                "stored online node data",
+                schema=parsed_schema.schema._schema_name,
+                pii_main_result=partial(str, result.main.value),
+                pii_chunk_result=lambda result=result: [str(chunk.value) for chunk in result.chunks],
             )
-        logger.debug(
-            "stored online node data",
-            schema=parsed_schema.schema._schema_name,
-            pii_main_result=partial(str, result.main.value),
-            pii_chunk_result=lambda: [str(chunk.value) for chunk in result.chunks],
-        )
 
     def load_stored_result(self, object_id: str, schema: SchemaObject) -> NodeDataT | None:
         return self.storage_manager.read_node_result(
@@ -123,17 +170,44 @@ class OnlineNode(ABC, Generic[NT, NodeDataT], metaclass=ABCMeta):
             self.node.node_data_type,
         )
 
+    def load_stored_results(self, parsed_schemas: list[ParsedSchema]) -> list[NodeDataT | None]:
+        """
+        Loads the stored results of all the given objects with a single read per schema.
+        """
+        object_ids_by_schema: dict[SchemaObject, list[str]] = defaultdict(list)
+        for parsed_schema in parsed_schemas:
+            object_ids_by_schema[parsed_schema.schema].append(parsed_schema.id_)
+        stored_results_by_schema = {
+            schema: self.storage_manager.read_node_results_batch(
+                schema,
+                object_ids,
+                self.node_id,
+                self.node.node_data_type,
+            )
+            for schema, object_ids in object_ids_by_schema.items()
+        }
+        return [
+            stored_results_by_schema[parsed_schema.schema][parsed_schema.id_] for parsed_schema in parsed_schemas
+        ]
+
     def load_stored_result_or_raise_exception(
         self,
         parsed_schema: ParsedSchema,
     ) -> NodeDataT:
-        stored_result = self.load_stored_result(parsed_schema.id_, parsed_schema.schema)
-        if stored_result is None:
-            raise DagEvaluationException(
-                f"{self.node_id} doesn't have a stored value for (schema, object_id):"
-                + f" ({parsed_schema.schema._schema_name}, {parsed_schema.id_})"
-            )
-        return stored_result
+        return self.load_stored_results_or_raise_exception([parsed_schema])[0]
+
+    def load_stored_results_or_raise_exception(
+        self,
+        parsed_schemas: list[ParsedSchema],
+    ) -> list[NodeDataT]:
+        stored_results = self.load_stored_results(parsed_schemas)
+        for parsed_schema, stored_result in zip(parsed_schemas, stored_results):
+            if stored_result is None:
+                raise DagEvaluationException(
+                    f"{self.node_id} doesn't have a stored value for (schema, object_id):"
+                    + f" ({parsed_schema.schema._schema_name}, {parsed_schema.id_})"
+                )
+        return cast(list[NodeDataT], stored_results)
 
     def validate_parents(
         self,
@@ -14,7 +14,7 @@
 
 from __future__ import annotations
 
-from beartype.typing import cast
+from beartype.typing import Sequence, cast
 from typing_extensions import override
 
 from superlinked.framework.common.dag.context import ExecutionContext
@@ -45,7 +45,7 @@ class OnlineNumberEmbeddingNode(
         storage_manager: StorageManager,
     ) -> None:
         super().__init__(node, parents, storage_manager)
-        self._embedding_transformation = TransformationFactory.create_embedding_transformation(
+        self._embedding_transformation = TransformationFactory.create_multi_embedding_transformation(
             self.node.transformation_config
         )
         self.embedding_config = cast(NumberEmbeddingConfig, self.node.transformation_config.embedding_config)
@@ -56,7 +56,7 @@ class OnlineNumberEmbeddingNode(
         return self.node.length
 
     @property
-    def embedding_transformation(self) -> Step[float, Vector]:
+    def embedding_transformation(self) -> Step[Sequence[float], list[Vector]]:
         return self._embedding_transformation
 
     @override
@@ -65,18 +65,19 @@ class OnlineNumberEmbeddingNode(
         parsed_schemas: list[ParsedSchema],
         context: ExecutionContext,
     ) -> list[EvaluationResult[Vector]]:
-        return [self.evaluate_self_single(schema, context) for schema in parsed_schemas]
+        results: Sequence[Vector]
+        if self.embedding_config.should_return_default(context):
+            results = [self.node.transformation_config.embedding_config.default_vector] * len(parsed_schemas)
+        elif len(self.parents) == 0:
+            results = self.load_stored_results_or_raise_exception(parsed_schemas)
+        else:
+            inputs = self.parents[0].evaluate_next(parsed_schemas, context)
+            results = self.embedding_transformation.transform([input_.main.value for input_ in inputs], context)
+        return [EvaluationResult(self._get_single_evaluation_result(result)) for result in results]
 
     def evaluate_self_single(
         self,
         parsed_schema: ParsedSchema,
         context: ExecutionContext,
     ) -> EvaluationResult[Vector]:
-        if self.embedding_config.should_return_default(context):
-            result = self.node.transformation_config.embedding_config.default_vector
-        elif len(self.parents) == 0:
-            result = self.load_stored_result_or_raise_exception(parsed_schema)
-        else:
-            input_ = self.parents[0].evaluate_next_single(parsed_schema, context)
-            result = self.embedding_transformation.transform(input_.main.value, context)
-        return EvaluationResult(self._get_single_evaluation_result(result))
+        return self.evaluate_self([parsed_schema], context)[0]
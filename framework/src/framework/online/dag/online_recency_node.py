@@ -45,7 +45,7 @@ class OnlineRecencyNode(DefaultOnlineNode[RecencyNode, Vector], HasLength):
         storage_manager: StorageManager,
     ) -> None:
         super().__init__(node, parents, storage_manager)
-        self._embedding_transformation = TransformationFactory.create_embedding_transformation(
+        self._embedding_transformation = TransformationFactory.create_multi_embedding_transformation(
             self.node.transformation_config
         )
 
@@ -55,7 +55,7 @@ class OnlineRecencyNode(DefaultOnlineNode[RecencyNode, Vector], HasLength):
         return self.node.length
 
     @property
-    def embedding_transformation(self) -> Step[int, Vector]:
+    def embedding_transformation(self) -> Step[Sequence[int], list[Vector]]:
         return self._embedding_transformation
 
     @override
@@ -72,14 +72,9 @@ class OnlineRecencyNode(DefaultOnlineNode[RecencyNode, Vector], HasLength):
         parent_results: list[dict[OnlineNode, SingleEvaluationResult]],
         context: ExecutionContext,
     ) -> Sequence[Vector | None]:
-        return [self._evaluate_single(parent_result, context) for parent_result in parent_results]
-
-    def _evaluate_single(
-        self,
-        parent_results: dict[OnlineNode, SingleEvaluationResult],
-        context: ExecutionContext,
-    ) -> Vector | None:
-        if len(parent_results.items()) != 1:
-            return None
-        input_: int = list(parent_results.values())[0].value
-        return self.embedding_transformation.transform(input_, context)
+        input_indices = [i for i, parent_result in enumerate(parent_results) if len(parent_result) == 1]
+        inputs: list[int] = [next(iter(parent_results[i].values())).value for i in input_indices]
+        results: list[Vector | None] = [None] * len(parent_results)
+        for i, vector in zip(input_indices, self.embedding_transformation.transform(inputs, context)):
+            results[i] = vector
+        return results
@@ -26,6 +26,7 @@ from superlinked.framework.common.parser.parsed_schema import ParsedSchema
 from superlinked.framework.common.schema.exception import SchemaMismatchException
 from superlinked.framework.common.schema.schema_object import SchemaObject
 from superlinked.framework.online.dag.evaluation_result import EvaluationResult
+from superlinked.framework.online.dag.online_dag_scheduler import OnlineDagScheduler
 from superlinked.framework.online.dag.online_index_node import OnlineIndexNode
 from superlinked.framework.online.dag.online_node import OnlineNode
 from superlinked.framework.online.dag.online_schema_field_node import (
@@ -47,6 +48,7 @@ class OnlineSchemaDag:
             OnlineIndexNode,
             [node for node in self.__nodes if len(node.children) == 0][0],
         )
+        self.__plan_parent_branches()
 
     @property
     def nodes(self) -> list[OnlineNode]:
@@ -63,6 +65,26 @@ class OnlineSchemaDag:
     ) -> list[EvaluationResult[Vector]]:
         return self.leaf_node.evaluate_next(parsed_schemas, context)
 
+    def __plan_parent_branches(self) -> None:
+        """
+        Plans once per schema dag which parents of each node can be evaluated concurrently.
+        """
+        ancestors_by_node: dict[OnlineNode, frozenset[OnlineNode]] = {}
+        for node in self.__nodes:
+            self.__collect_ancestors(node, ancestors_by_node)
+        for node in self.__nodes:
+            if len(node.parents) > 1:
+                node.parent_branches = OnlineDagScheduler.plan_parent_branches(node, ancestors_by_node)
+
+    def __collect_ancestors(
+        self, node: OnlineNode, ancestors_by_node: dict[OnlineNode, frozenset[OnlineNode]]
+    ) -> frozenset[OnlineNode]:
+        if node not in ancestors_by_node:
+            ancestors_by_node[node] = frozenset({node}).union(
+                *(self.__collect_ancestors(parent, ancestors_by_node) for parent in node.parents)
+            )
+        return ancestors_by_node[node]
+
     def __validate(self, schema: SchemaObject, nodes: list[OnlineNode]) -> None:
         class_name = type(self).__name__
         leaf_nodes = [node for node in nodes if len(node.children) == 0]
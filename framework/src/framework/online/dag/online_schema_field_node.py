@@ -51,27 +51,51 @@ class OnlineSchemaFieldNode(Generic[SFT], OnlineNode[SchemaFieldNode, SFT]):
         parsed_schemas: list[ParsedSchema],
         context: ExecutionContext,
     ) -> list[EvaluationResult[SFT]]:
-        return [self.evaluate_self_single(schema) for schema in parsed_schemas]
+        return self.__evaluate(parsed_schemas)
 
     def evaluate_self_single(
         self,
         parsed_schema: ParsedSchema,
     ) -> EvaluationResult[SFT]:
-        parsed_nodes: list[ParsedSchemaField] = [
-            field for field in parsed_schema.fields if field.schema_field == self.node.schema_field
+        return self.__evaluate([parsed_schema])[0]
+
+    def __evaluate(self, parsed_schemas: list[ParsedSchema]) -> list[EvaluationResult[SFT]]:
+        parsed_values = [self.__get_parsed_value(parsed_schema) for parsed_schema in parsed_schemas]
+        missing_indices = [i for i, parsed_value in enumerate(parsed_values) if parsed_value is None]
+        default_results = dict(
+            zip(
+                missing_indices,
+                self.__get_default_results([parsed_schemas[i] for i in missing_indices]),
+            )
+        )
+        return [
+            EvaluationResult(
+                self._get_single_evaluation_result(
+                    parsed_value.value if parsed_value is not None else default_results[i]
+                )
+            )
+            for i, parsed_value in enumerate(parsed_values)
         ]
-        result: SFT
-        if parsed_nodes:
-            result = parsed_nodes[0].value
-        else:
-            result = self.__get_default_result(parsed_schema)
-        return EvaluationResult(self._get_single_evaluation_result(result))
+
+    def __get_parsed_value(self, parsed_schema: ParsedSchema) -> ParsedSchemaField | None:
+        return next(
+            (field for field in parsed_schema.fields if field.schema_field == self.node.schema_field),
+            None,
+        )
+
+    def __get_default_results(
+        self,
+        parsed_schemas: list[ParsedSchema],
+    ) -> list[SFT]:
+        if not parsed_schemas:
+            return []
+        stored_results = self.load_stored_results(parsed_schemas)
+        return [self.__get_default_result(stored_result) for stored_result in stored_results]
 
     def __get_default_result(
         self,
-        parsed_schema: ParsedSchema,
+        stored_result: SFT | None,
     ) -> SFT:
-        stored_result = self.load_stored_result(parsed_schema.id_, parsed_schema.schema)
         if stored_result:
             return stored_result
         field_name = ".".join(
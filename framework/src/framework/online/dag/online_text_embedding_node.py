@@ -66,11 +66,13 @@ class OnlineTextEmbeddingNode(DefaultOnlineNode[TextEmbeddingNode, Vector], HasL
         return super().evaluate_self(parsed_schemas, context)
 
     @override
-    def get_fallback_result(self, parsed_schema: ParsedSchema) -> Vector:
-        stored_result = self.load_stored_result(parsed_schema.id_, parsed_schema.schema)
-        if stored_result is not None:
-            return stored_result
-        return Vector.init_zero_vector(self.node.length)
+    def get_fallback_results(self, parsed_schemas: list[ParsedSchema]) -> list[Vector]:
+        if not parsed_schemas:
+            return []
+        return [
+            stored_result if stored_result is not None else Vector.init_zero_vector(self.node.length)
+            for stored_result in self.load_stored_results(parsed_schemas)
+        ]
 
     @override
     def _evaluate_singles(
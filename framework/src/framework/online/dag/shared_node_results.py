@@ -0,0 +1,84 @@
+# Copyright 2024 Superlinked, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from threading import Lock
+
+from beartype.typing import Callable, Hashable, Iterator, Sequence
+
+from superlinked.framework.common.parser.parsed_schema import (
+    ParsedSchema,
+    ParsedSchemaWithEvent,
+)
+from superlinked.framework.online.dag.evaluation_result import EvaluationResult
+
+_current_shared_node_results: ContextVar[SharedNodeResults | None] = ContextVar(
+    "current_shared_node_results", default=None
+)
+
+
+class SharedNodeResults:
+    """
+    Results of the online nodes that are part of more than one index, collected while a batch is evaluated.
+    Nodes with the same id compute the same result in every index, so the first index evaluates
+    and persists them and the others reuse the results.
+    Inputs are matched by identity, as every index receives the same parsed schema objects of the batch.
+    """
+
+    def __init__(self, shared_node_ids: frozenset[str]) -> None:
+        self._shared_node_ids = shared_node_ids
+        self._results: dict[tuple[str, tuple[Hashable, ...]], list[EvaluationResult]] = {}
+        self._lock = Lock()
+        self.reused_count = 0
+
+    @staticmethod
+    def get_current() -> SharedNodeResults | None:
+        return _current_shared_node_results.get()
+
+    @contextmanager
+    def activate(self) -> Iterator[None]:
+        token = _current_shared_node_results.set(self)
+        try:
+            yield
+        finally:
+            _current_shared_node_results.reset(token)
+
+    def is_shared(self, node_id: str) -> bool:
+        return node_id in self._shared_node_ids
+
+    def get_or_evaluate(
+        self,
+        node_id: str,
+        parsed_schemas: Sequence[ParsedSchema],
+        evaluate: Callable[[], list[EvaluationResult]],
+    ) -> list[EvaluationResult]:
+        key = (node_id, tuple(self._to_key(parsed_schema) for parsed_schema in parsed_schemas))
+        with self._lock:
+            if (results := self._results.get(key)) is not None:
+                self.reused_count += 1
+                return results
+        results = evaluate()
+        with self._lock:
+            self._results[key] = results
+        return results
+
+    @staticmethod
+    def _to_key(parsed_schema: ParsedSchema) -> Hashable:
+        # every index wraps the events into its own objects, the wrapped event is the same
+        if isinstance(parsed_schema, ParsedSchemaWithEvent):
+            return (parsed_schema.schema._schema_name, parsed_schema.id_, id(parsed_schema.event_parsed_schema))
+        return id(parsed_schema)
@@ -58,6 +58,13 @@ class OnlineDagEvaluator:
         )
         self._log_dag_init()
 
+    @property
+    def node_ids(self) -> set[str]:
+        online_schema_dags = list(self._schema_online_schema_dag_mapper.values()) + list(
+            self._dag_effect_online_schema_dag_mapper.values()
+        )
+        return {node.node_id for online_schema_dag in online_schema_dags for node in online_schema_dag.nodes}
+
     def _log_dag_init(self) -> None:
         for schema, online_schema_dag in self._schema_online_schema_dag_mapper.items():
             logger.info(
@@ -111,10 +118,19 @@ class OnlineDagEvaluator:
         context: ExecutionContext,
         dag_effect: DagEffect,
     ) -> EvaluationResult[Vector]:
+        return self.evaluate_by_dag_effect_batch([parsed_schema_with_event], context, dag_effect)[0]
+
+    def evaluate_by_dag_effect_batch(
+        self,
+        parsed_schemas_with_event: list[ParsedSchemaWithEvent],
+        context: ExecutionContext,
+        dag_effect: DagEffect,
+    ) -> list[EvaluationResult[Vector]]:
         if (online_schema_dag := self._dag_effect_online_schema_dag_mapper.get(dag_effect)) is not None:
-            result = online_schema_dag.evaluate([parsed_schema_with_event], context)[0]
-            self._log_evaluated_event(parsed_schema_with_event, result)
-            return result
+            results = online_schema_dag.evaluate(list(parsed_schemas_with_event), context)
+            for parsed_schema_with_event, result in zip(parsed_schemas_with_event, results):
+                self._log_evaluated_event(parsed_schema_with_event, result)
+            return results
         raise InvalidDagEffectException(f"DagEffect ({dag_effect}) isn't present in the index.")
 
     def _log_evaluated_event(self, parsed_schema_with_event: ParsedSchemaWithEvent, result: EvaluationResult) -> None:
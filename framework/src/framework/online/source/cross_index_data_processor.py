@@ -0,0 +1,56 @@
+# Copyright 2024 Superlinked, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import structlog
+from beartype.typing import Sequence
+
+from superlinked.framework.common.observable import Subscriber
+from superlinked.framework.common.parser.parsed_schema import ParsedSchema
+from superlinked.framework.common.storage_manager.storage_manager import StorageManager
+from superlinked.framework.online.cross_index_evaluation_planner import (
+    CrossIndexEvaluationPlanner,
+)
+from superlinked.framework.online.dag.shared_node_results import SharedNodeResults
+from superlinked.framework.online.source.online_data_processor import (
+    OnlineDataProcessor,
+)
+
+logger = structlog.get_logger()
+
+
+class CrossIndexDataProcessor(Subscriber[ParsedSchema]):
+    """
+    Passes each batch of a source to the data processors of all the indices of the source.
+    The nodes the indices have in common are evaluated once and the writes of all indices are merged.
+    """
+
+    def __init__(self, data_processors: Sequence[OnlineDataProcessor], storage_manager: StorageManager) -> None:
+        super().__init__()
+        self._data_processors = data_processors
+        self._storage_manager = storage_manager
+        self._shared_node_ids = CrossIndexEvaluationPlanner.find_shared_node_ids(
+            [data_processor.evaluator for data_processor in data_processors]
+        )
+
+    def update(self, messages: Sequence[ParsedSchema]) -> None:
+        shared_node_results = SharedNodeResults(self._shared_node_ids)
+        with self._storage_manager.buffer_writes(), shared_node_results.activate():
+            for data_processor in self._data_processors:
+                data_processor.update(messages)
+        logger.debug(
+            "evaluated batch for all indices",
+            n_indices=len(self._data_processors),
+            n_shared_nodes=len(self._shared_node_ids),
+            n_reused_node_results=shared_node_results.reused_count,
+        )
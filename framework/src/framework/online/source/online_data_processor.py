@@ -64,16 +64,20 @@ class OnlineDataProcessor(Subscriber[ParsedSchema]):
 
     def update(self, messages: Sequence[ParsedSchema]) -> None:
         regular_msgs: list[ParsedSchema] = []
+        event_msgs: list[EventParsedSchema] = []
         for message in messages:
             self._validate_mandatory_fields_are_present(message)
         for message in messages:
             if message.schema in self.effect_schemas:
-                self._process_event(cast(EventParsedSchema, message))
+                event_msgs.append(cast(EventParsedSchema, message))
             else:
                 regular_msgs.append(message)
-        if regular_msgs:
-            self.storage_manager.write_parsed_schema_fields(regular_msgs)
-            self.evaluator.evaluate(regular_msgs, self.context)
+        with self.storage_manager.buffer_writes():
+            if event_msgs:
+                self._process_events(event_msgs)
+            if regular_msgs:
+                self.storage_manager.write_parsed_schema_fields(regular_msgs)
+                self.evaluator.evaluate(regular_msgs, self.context)
 
         logger.info(
             "stored input data",
@@ -94,13 +98,21 @@ class OnlineDataProcessor(Subscriber[ParsedSchema]):
                 f"Message with id '{message.id_}' is missing mandatory index fields: {missing_fields_text}."
             )
 
-    def _process_event(
+    def _process_events(
         self,
-        event_parsed_schema: EventParsedSchema,
+        event_parsed_schemas: Sequence[EventParsedSchema],
     ) -> None:
-        effect_parsed_schema_map = self._map_event_parsed_schema_by_dag_effects(event_parsed_schema)
-        for effect, parsed_schema_with_event in effect_parsed_schema_map.items():
-            self.evaluator.evaluate_by_dag_effect(parsed_schema_with_event, self.context, effect)
+        """
+        Evaluates the events grouped by their dag effects, keeping their order within each group,
+        so that the events affecting the same entity are folded in a single dag evaluation.
+        """
+        parsed_schemas_with_event_by_effect: defaultdict[DagEffect, list[ParsedSchemaWithEvent]] = defaultdict(list)
+        for event_parsed_schema in event_parsed_schemas:
+            effect_parsed_schema_map = self._map_event_parsed_schema_by_dag_effects(event_parsed_schema)
+            for effect, parsed_schema_with_event in effect_parsed_schema_map.items():
+                parsed_schemas_with_event_by_effect[effect].append(parsed_schema_with_event)
+        for effect, parsed_schemas_with_event in parsed_schemas_with_event_by_effect.items():
+            self.evaluator.evaluate_by_dag_effect_batch(parsed_schemas_with_event, self.context, effect)
 
     def _map_event_parsed_schema_by_dag_effects(
         self, event_parsed_schema: EventParsedSchema
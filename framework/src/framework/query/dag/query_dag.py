@@ -18,6 +18,9 @@ from superlinked.framework.common.dag.context import ExecutionContext
 from superlinked.framework.common.dag.exception import LeafNodeCountException
 from superlinked.framework.common.data_types import Vector
 from superlinked.framework.query.dag.exception import QueryEvaluationException
+from superlinked.framework.query.dag.query_embedding_orphan_node import (
+    QueryEmbeddingOrphanNode,
+)
 from superlinked.framework.query.dag.query_index_node import QueryIndexNode
 from superlinked.framework.query.dag.query_node import QueryNode
 from superlinked.framework.query.query_node_input import QueryNodeInput
@@ -27,6 +30,9 @@ class QueryDag:
     def __init__(self, nodes: Sequence[QueryNode]) -> None:
         self.__nodes = nodes
         self.__leaf_node = self.__validate_and_get_leaf_node(self.__nodes)
+        self.__batch_embeddable_nodes = [
+            node for node in self.__nodes if isinstance(node, QueryEmbeddingOrphanNode) and node.is_batch_embeddable
+        ]
 
     @property
     def leaf_node(self) -> QueryIndexNode:
@@ -44,6 +50,22 @@ class QueryDag:
             )
         return result
 
+    def evaluate_batch(
+        self,
+        inputs_list: Sequence[Mapping[str, Sequence[QueryNodeInput]]],
+        contexts: Sequence[ExecutionContext],
+    ) -> list[Vector]:
+        if len(inputs_list) != len(contexts):
+            raise QueryEvaluationException(
+                f"Mismatching number of inputs {len(inputs_list)} and contexts {len(contexts)}."
+            )
+        if not inputs_list:
+            return []
+        pre_embedded_inputs_list: Sequence[Mapping[str, Sequence[QueryNodeInput]]] = inputs_list
+        for node in self.__batch_embeddable_nodes:
+            pre_embedded_inputs_list = node.pre_embed_inputs(pre_embedded_inputs_list, contexts[0])
+        return [self.evaluate(inputs, context) for inputs, context in zip(pre_embedded_inputs_list, contexts)]
+
     def __validate_and_get_leaf_node(self, nodes: Sequence[QueryNode]) -> QueryIndexNode:
         class_name = type(self).__name__
         index_nodes = [node for node in nodes if isinstance(node, QueryIndexNode)]
@@ -20,6 +20,7 @@ from typing_extensions import override
 from superlinked.framework.common.dag.context import ExecutionContext
 from superlinked.framework.common.dag.embedding_node import EmbeddingNodeT
 from superlinked.framework.common.dag.node import NodeDataT
+from superlinked.framework.common.interface.weighted import Weighted
 from superlinked.framework.common.space.config.aggregation.aggregation_config import (
     AggregationInputT,
 )
@@ -41,3 +42,47 @@ class QueryEmbeddingOrphanNode(
         context: ExecutionContext,
     ) -> list[QueryEvaluationResult]:
         return []
+
+    @property
+    def is_batch_embeddable(self) -> bool:
+        """
+        Whether the inputs of multiple queries can be embedded together, independently of their contexts.
+        """
+        return False
+
+    def pre_embed_inputs(
+        self,
+        inputs_list: Sequence[Mapping[str, Sequence[QueryNodeInput]]],
+        context: ExecutionContext,
+    ) -> list[dict[str, Sequence[QueryNodeInput]]]:
+        """
+        Embeds the inputs addressed to this node across all queries in a single transformation call.
+        The embedded inputs are readdressed as vectors to be inverted, which the node aggregates as they are.
+        """
+        simple_inputs_list = [
+            [input_ for input_ in inputs.get(self.node_id, []) if not input_.to_invert] for inputs in inputs_list
+        ]
+        weighted_items = self._validate_and_cast_items(
+            [input_.value for simple_inputs in simple_inputs_list for input_ in simple_inputs], self._input_type
+        )
+        if not weighted_items:
+            return [dict(inputs) for inputs in inputs_list]
+        embeddings = iter(
+            self._multi_embedding_transformation.transform(
+                [weighted_item.item for weighted_item in weighted_items], context
+            )
+        )
+        pre_embedded_inputs_list = []
+        for inputs, simple_inputs in zip(inputs_list, simple_inputs_list):
+            pre_embedded_inputs = dict(inputs)
+            if simple_inputs:
+                pre_embedded_inputs[self.node_id] = [
+                    (
+                        input_
+                        if input_.to_invert
+                        else QueryNodeInput(Weighted(next(embeddings), input_.value.weight), to_invert=True)
+                    )
+                    for input_ in inputs[self.node_id]
+                ]
+            pre_embedded_inputs_list.append(pre_embedded_inputs)
+        return pre_embedded_inputs_list
@@ -13,6 +13,7 @@
 # limitations under the License.
 
 from beartype.typing import Sequence
+from typing_extensions import override
 
 from superlinked.framework.common.dag.image_embedding_node import ImageEmbeddingNode
 from superlinked.framework.common.data_types import Vector
@@ -26,3 +27,8 @@ from superlinked.framework.query.dag.query_node import QueryNode
 class QueryImageEmbeddingNode(QueryEmbeddingOrphanNode[Vector, ImageEmbeddingNode, ImageData]):
     def __init__(self, node: ImageEmbeddingNode, parents: Sequence[QueryNode]) -> None:
         super().__init__(node, parents, ImageData)
+
+    @property
+    @override
+    def is_batch_embeddable(self) -> bool:
+        return True
@@ -15,6 +15,7 @@
 from __future__ import annotations
 
 from beartype.typing import Sequence
+from typing_extensions import override
 
 from superlinked.framework.common.dag.text_embedding_node import TextEmbeddingNode
 from superlinked.framework.common.data_types import Vector
@@ -27,3 +28,8 @@ from superlinked.framework.query.dag.query_node import QueryNode
 class QueryTextEmbeddingNode(QueryEmbeddingOrphanNode[Vector, TextEmbeddingNode, str]):
     def __init__(self, node: TextEmbeddingNode, parents: Sequence[QueryNode]) -> None:
         super().__init__(node, parents, str)
+
+    @property
+    @override
+    def is_batch_embeddable(self) -> bool:
+        return True
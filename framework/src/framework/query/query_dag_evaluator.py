@@ -49,3 +49,16 @@ class QueryDagEvaluator:
             pii_vector=partial(str, result),
         )
         return result
+
+    def evaluate_batch(
+        self,
+        inputs_list: Sequence[Mapping[str, Sequence[QueryNodeInput]]],
+        contexts: Sequence[ExecutionContext],
+    ) -> list[Vector]:
+        results = self._query_dag.evaluate_batch(inputs_list, contexts)
+        logger.info(
+            "evaluated query batch",
+            n_queries=len(results),
+            pii_inputs=inputs_list,
+        )
+        return results
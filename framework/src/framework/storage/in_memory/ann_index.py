@@ -0,0 +1,42 @@
+# Copyright 2024 Superlinked, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from abc import ABC, abstractmethod
+
+import numpy as np
+
+from superlinked.framework.storage.in_memory.vector_matrix import VectorMatrix
+
+
+class ANNIndex(ABC):
+    """
+    Approximate nearest neighbour index over the slots of a VectorMatrix.
+    It only narrows down the candidates of a search, their exact scores are calculated by the InMemorySearch.
+    """
+
+    def __init__(self, vector_matrix: VectorMatrix) -> None:
+        self._vector_matrix = vector_matrix
+
+    @abstractmethod
+    def add(self, slot: int) -> None:
+        """
+        Called whenever the vector in the given slot of the VectorMatrix is set.
+        """
+
+    @abstractmethod
+    def select_candidates(self, vector: np.ndarray, candidate_slots: np.ndarray, limit: int) -> np.ndarray:
+        """
+        Selects the slots among `candidate_slots` that are likely to contain the `limit` nearest neighbours.
+        A negative limit means all candidates are needed.
+        """
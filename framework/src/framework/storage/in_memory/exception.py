@@ -22,3 +22,7 @@ class VectorFieldTypeException(ValidationException):
 
 class VectorFieldDimensionException(ValidationException):
     pass
+
+
+class InMemoryVDBSnapshotException(Exception):
+    pass
@@ -0,0 +1,72 @@
+# Copyright 2024 Superlinked, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from abc import ABC, abstractmethod
+
+import numpy as np
+from beartype.typing import Any
+
+from superlinked.framework.common.interface.comparison_operand import (
+    ComparisonOperation,
+)
+from superlinked.framework.common.storage.field.field import Field
+
+INITIAL_CAPACITY = 1024
+
+
+class FieldIndex(ABC):
+    """
+    Secondary index of a single field of the in-memory rows.
+    Filters are answered with boolean masks over the row positions of the InMemoryVDB.
+    """
+
+    def __init__(self) -> None:
+        self._has_value = np.zeros(INITIAL_CAPACITY, dtype=np.bool_)
+
+    def has_value_mask(self, size: int) -> np.ndarray:
+        return FieldIndex._fit_mask(self._has_value, size)
+
+    def set_value(self, position: int, value: Any) -> None:
+        self._ensure_capacity(position)
+        self._has_value[position] = value is not None
+        self._set_value(position, value)
+
+    @abstractmethod
+    def _set_value(self, position: int, value: Any) -> None:
+        pass
+
+    @abstractmethod
+    def evaluate(self, filter_: ComparisonOperation[Field], size: int) -> np.ndarray | None:
+        """
+        Returns the mask of the first `size` rows satisfying the filter,
+        or None if the filter cannot be answered by the index.
+        """
+
+    def _ensure_capacity(self, position: int) -> None:
+        if position < self._has_value.shape[0]:
+            return
+        capacity = max(2 * self._has_value.shape[0], position + 1)
+        self._has_value = FieldIndex._fit_mask(self._has_value, capacity)
+        self._grow(capacity)
+
+    def _grow(self, capacity: int) -> None:
+        pass
+
+    @staticmethod
+    def _fit_mask(mask: np.ndarray, size: int) -> np.ndarray:
+        if mask.shape[0] >= size:
+            return mask[:size].copy()
+        fitted = np.zeros(size, dtype=np.bool_)
+        fitted[: mask.shape[0]] = mask
+        return fitted
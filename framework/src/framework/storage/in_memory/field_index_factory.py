@@ -0,0 +1,41 @@
+# Copyright 2024 Superlinked, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+from beartype.typing import Callable, Mapping
+
+from superlinked.framework.common.storage.field.field_data_type import FieldDataType
+from superlinked.framework.storage.in_memory.field_index import FieldIndex
+from superlinked.framework.storage.in_memory.hash_field_index import HashFieldIndex
+from superlinked.framework.storage.in_memory.sorted_field_index import (
+    SortedFieldIndex,
+)
+
+FIELD_INDEX_FACTORY_BY_FIELD_DATA_TYPE: Mapping[FieldDataType, Callable[[], FieldIndex]] = {
+    FieldDataType.STRING: lambda: HashFieldIndex(is_list=False),
+    FieldDataType.STRING_LIST: lambda: HashFieldIndex(is_list=True),
+    FieldDataType.INT: lambda: SortedFieldIndex(np.int64),
+    FieldDataType.DOUBLE: lambda: SortedFieldIndex(np.float64),
+}
+
+
+class FieldIndexFactory:
+    @staticmethod
+    def create_field_index(field_data_type: FieldDataType) -> FieldIndex | None:
+        """
+        Returns None for field types that are filtered by evaluating the rows one by one.
+        """
+        if field_index_factory := FIELD_INDEX_FACTORY_BY_FIELD_DATA_TYPE.get(field_data_type):
+            return field_index_factory()
+        return None
@@ -0,0 +1,115 @@
+# Copyright 2024 Superlinked, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections import defaultdict
+
+import numpy as np
+from beartype.typing import Any, Sequence
+from typing_extensions import override
+
+from superlinked.framework.common.interface.comparison_operand import (
+    ComparisonOperation,
+)
+from superlinked.framework.common.interface.comparison_operation_type import (
+    ComparisonOperationType,
+)
+from superlinked.framework.common.storage.field.field import Field
+from superlinked.framework.storage.in_memory.field_index import FieldIndex
+
+EQUALITY_OPERATION_TYPES = [ComparisonOperationType.EQUAL, ComparisonOperationType.NOT_EQUAL]
+
+
+class HashFieldIndex(FieldIndex):
+    """
+    Maps each distinct value of a string field (or each item of a string list field) to the rows holding it.
+    Answers equality and membership filters on string fields and containment filters on string list fields.
+    """
+
+    def __init__(self, is_list: bool) -> None:
+        super().__init__()
+        self.__is_list = is_list
+        self.__positions_by_key: defaultdict[str, set[int]] = defaultdict(set)
+        self.__keys_by_position: dict[int, frozenset[str]] = {}
+        self.__position_array_by_key: dict[str, np.ndarray] = {}
+
+    @override
+    def _set_value(self, position: int, value: Any) -> None:
+        new_keys = self.__to_keys(value)
+        old_keys = self.__keys_by_position.get(position, frozenset())
+        for key in old_keys - new_keys:
+            self.__positions_by_key[key].discard(position)
+            self.__position_array_by_key.pop(key, None)
+        for key in new_keys - old_keys:
+            self.__positions_by_key[key].add(position)
+            self.__position_array_by_key.pop(key, None)
+        self.__keys_by_position[position] = new_keys
+
+    def __to_keys(self, value: Any) -> frozenset[str]:
+        if value is None:
+            return frozenset()
+        if self.__is_list:
+            return frozenset(value)
+        return frozenset([value])
+
+    @override
+    def evaluate(self, filter_: ComparisonOperation[Field], size: int) -> np.ndarray | None:
+        if filter_._op in EQUALITY_OPERATION_TYPES and not isinstance(filter_._other, str):
+            return None
+        keys = filter_._get_other_as_sequence()
+        if not all(isinstance(key, str) for key in keys):
+            return None
+        if self.__is_list:
+            return self.__evaluate_list_filter(filter_._op, keys, size)
+        return self.__evaluate_filter(filter_._op, keys, size)
+
+    def __evaluate_filter(self, op: ComparisonOperationType, keys: Sequence[str], size: int) -> np.ndarray | None:
+        match op:
+            case ComparisonOperationType.EQUAL | ComparisonOperationType.IN:
+                return self.__any_key_mask(keys, size)
+            case ComparisonOperationType.NOT_EQUAL | ComparisonOperationType.NOT_IN:
+                return ~self.__any_key_mask(keys, size)
+            case _:
+                return None
+
+    def __evaluate_list_filter(self, op: ComparisonOperationType, keys: Sequence[str], size: int) -> np.ndarray | None:
+        match op:
+            case ComparisonOperationType.CONTAINS:
+                return self.__any_key_mask(keys, size)
+            case ComparisonOperationType.NOT_CONTAINS:
+                return self.has_value_mask(size) & ~self.__any_key_mask(keys, size)
+            case ComparisonOperationType.CONTAINS_ALL:
+                return ~self.has_value_mask(size) | self.__all_keys_mask(keys, size)
+            case _:
+                return None
+
+    def __any_key_mask(self, keys: Sequence[str], size: int) -> np.ndarray:
+        mask = np.zeros(size, dtype=np.bool_)
+        for key in set(keys):
+            mask[self.__get_positions(key, size)] = True
+        return mask
+
+    def __all_keys_mask(self, keys: Sequence[str], size: int) -> np.ndarray:
+        mask = np.ones(size, dtype=np.bool_)
+        for key in set(keys):
+            key_mask = np.zeros(size, dtype=np.bool_)
+            key_mask[self.__get_positions(key, size)] = True
+            mask &= key_mask
+        return mask
+
+    def __get_positions(self, key: str, size: int) -> np.ndarray:
+        if (positions := self.__position_array_by_key.get(key)) is None:
+            key_positions = self.__positions_by_key.get(key, set())
+            positions = np.fromiter(key_positions, dtype=np.int64, count=len(key_positions))
+            self.__position_array_by_key[key] = positions
+        return positions[positions < size]
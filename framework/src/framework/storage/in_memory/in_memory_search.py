@@ -12,9 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import math
 from collections import defaultdict
 
-from beartype.typing import Any, Sequence, cast
+import numpy as np
+from beartype.typing import Any, Callable, Sequence, cast
 
 from superlinked.framework.common.calculation.distance_metric import DistanceMetric
 from superlinked.framework.common.calculation.vector_similarity import (
@@ -25,149 +27,382 @@ from superlinked.framework.common.interface.comparison_operand import (
     ComparisonOperation,
 )
 from superlinked.framework.common.storage.field.field import Field
-from superlinked.framework.common.storage.field.field_data import VectorFieldData
 from superlinked.framework.common.storage.index_config import IndexConfig
 from superlinked.framework.common.storage.query.vdb_knn_search_params import (
     VDBKNNSearchParams,
 )
 from superlinked.framework.common.storage.search import Search
+from superlinked.framework.storage.in_memory.ann_index import ANNIndex
 from superlinked.framework.storage.in_memory.exception import (
     VectorFieldDimensionException,
-    VectorFieldTypeException,
 )
+from superlinked.framework.storage.in_memory.field_index import FieldIndex
+from superlinked.framework.storage.in_memory.vector_matrix import VectorMatrix
 
 # This is associated with the DEFAULT_LIMIT from superlinked.framework.common.const
 UNLIMITED_SEARCH_RESULTS = -1
+# Upper bound on the number of scores computed at once by a batched search
+SIMILARITY_MATRIX_MAX_SIZE = 2**24
+# The number of quantized vectors dequantized at once for scoring
+DEQUANTIZATION_CHUNK_SIZE = 4096
 
 
 class InMemorySearch:
+    """
+    Rows are addressed by their position in `row_ids`.
+    Filters are evaluated into boolean masks over these positions, using the field indices where possible
+    and falling back to evaluating the remaining candidate rows one by one.
+    Searches of a quantized VectorMatrix rescore their best candidates with its float32 copy of the vectors, if kept.
+    """
+
+    def __init__(self, rescoring_factor: float = 0.0) -> None:
+        self._rescoring_factor = rescoring_factor
+
     def search(
         self,
         vdb: defaultdict[str, dict[str, Any]],
+        row_ids: Sequence[str],
+        field_indices: dict[str, FieldIndex],
         filters: Sequence[ComparisonOperation[Field]],
         has_fields: Sequence[Field],
     ) -> Sequence[str]:
-        return [row_id for row_id, values in vdb.items() if InMemorySearch._is_subset(values, filters, has_fields)]
+        mask = self.filter_rows(vdb, row_ids, field_indices, filters, has_fields)
+        return [row_ids[position] for position in np.flatnonzero(mask).tolist()]
 
-    def knn_search(
+    def knn_search(  # pylint: disable=too-many-arguments
         self,
         index_config: IndexConfig,
         vdb: defaultdict[str, dict[str, Any]],
+        row_ids: Sequence[str],
+        field_indices: dict[str, FieldIndex],
+        vector_matrix: VectorMatrix,
         search_params: VDBKNNSearchParams,
+        ann_index: ANNIndex | None = None,
     ) -> Sequence[tuple[str, float]]:
-        Search.check_vector_field(index_config, search_params.vector_field)
-        Search.check_filters(index_config, search_params.filters)
-        filtered_vectors = self._filter_indexed_vectors(
-            vdb,
-            search_params.vector_field,
-            search_params.filters,
+        vector, slots = self._select_candidate_slots(
+            index_config, vdb, row_ids, field_indices, vector_matrix, search_params
         )
+        if ann_index is not None:
+            slots = ann_index.select_candidates(vector.value, slots, search_params.limit)
         similarities = self._calculate_similarities(
             index_config.vector_field_descriptor.distance_metric,
-            search_params.vector_field.value,
-            filtered_vectors,
+            vector,
+            vector_matrix,
+            slots,
         )
-        sorted_similarities = self._sort_similarities(
+        slots, similarities = self._rescore(
+            index_config.vector_field_descriptor.distance_metric,
+            vector_matrix,
+            vector,
+            slots,
             similarities,
-            search_params.radius,
+            search_params.limit,
         )
-        return (
-            sorted_similarities[: search_params.limit]
-            if search_params.limit != UNLIMITED_SEARCH_RESULTS
-            else sorted_similarities
+        return self._to_sorted_scores(row_ids, vector_matrix, slots, similarities, search_params)
+
+    def knn_search_batch(  # pylint: disable=too-many-arguments
+        self,
+        index_config: IndexConfig,
+        vdb: defaultdict[str, dict[str, Any]],
+        row_ids: Sequence[str],
+        field_indices: dict[str, FieldIndex],
+        vector_matrix: VectorMatrix,
+        search_params_list: Sequence[VDBKNNSearchParams],
+        ann_index: ANNIndex | None = None,
+    ) -> list[Sequence[tuple[str, float]]]:
+        """
+        Scores the queries against the whole matrix at once in a matrix-matrix product,
+        processing them in chunks to bound the size of the similarity matrix.
+        With an ANN index the candidates differ per query, so those are searched one by one.
+        """
+        if ann_index is not None:
+            return [
+                self.knn_search(index_config, vdb, row_ids, field_indices, vector_matrix, search_params, ann_index)
+                for search_params in search_params_list
+            ]
+        candidates = [
+            self._select_candidate_slots(index_config, vdb, row_ids, field_indices, vector_matrix, search_params)
+            for search_params in search_params_list
+        ]
+        chunk_size = max(1, SIMILARITY_MATRIX_MAX_SIZE // max(len(vector_matrix), 1))
+        sorted_scores_list: list[Sequence[tuple[str, float]]] = []
+        for start in range(0, len(candidates), chunk_size):
+            chunk = list(zip(candidates[start : start + chunk_size], search_params_list[start : start + chunk_size]))
+            scored_queries = [(vector, slots) for (vector, slots), _ in chunk if slots.size]
+            similarity_matrix = self._calculate_similarity_matrix(
+                index_config.vector_field_descriptor.distance_metric,
+                [vector for vector, _ in scored_queries],
+                vector_matrix,
+            )
+            column = 0
+            for (vector, slots), search_params in chunk:
+                if slots.size:
+                    similarities = similarity_matrix[slots, column]
+                    column += 1
+                else:
+                    similarities = np.empty(0, dtype=vector_matrix.dtype)
+                slots, similarities = self._rescore(
+                    index_config.vector_field_descriptor.distance_metric,
+                    vector_matrix,
+                    vector,
+                    slots,
+                    similarities,
+                    search_params.limit,
+                )
+                sorted_scores_list.append(
+                    self._to_sorted_scores(row_ids, vector_matrix, slots, similarities, search_params)
+                )
+        return sorted_scores_list
+
+    def filter_rows(
+        self,
+        vdb: defaultdict[str, dict[str, Any]],
+        row_ids: Sequence[str],
+        field_indices: dict[str, FieldIndex],
+        filters: Sequence[ComparisonOperation[Field]],
+        has_fields: Sequence[Field],
+    ) -> np.ndarray:
+        """
+        Returns the mask of the rows for which all filters are True.
+        """
+        mask = np.ones(len(row_ids), dtype=np.bool_)
+        for field in has_fields:
+            if (field_index := field_indices.get(field.name)) is not None:
+                mask &= field_index.has_value_mask(len(row_ids))
+            else:
+                InMemorySearch._evaluate_on_rows(
+                    mask, vdb, row_ids, lambda entity, field=field: entity.get(field.name) is not None
+                )
+        grouped_filters = ComparisonOperation._group_filters_by_group_key(filters)
+        for group_key, group in grouped_filters.items():
+            if group_key is None:
+                InMemorySearch._evaluate_and_group(mask, vdb, row_ids, field_indices, group)
+            else:
+                mask &= InMemorySearch._evaluate_or_group(mask, vdb, row_ids, field_indices, group)
+        return mask
+
+    def _select_candidate_slots(  # pylint: disable=too-many-arguments
+        self,
+        index_config: IndexConfig,
+        vdb: defaultdict[str, dict[str, Any]],
+        row_ids: Sequence[str],
+        field_indices: dict[str, FieldIndex],
+        vector_matrix: VectorMatrix,
+        search_params: VDBKNNSearchParams,
+    ) -> tuple[Vector, np.ndarray]:
+        Search.check_vector_field(index_config, search_params.vector_field)
+        Search.check_filters(index_config, search_params.filters)
+        vector = cast(Vector, search_params.vector_field.value)
+        row_mask = self.filter_rows(vdb, row_ids, field_indices, search_params.filters or [], [])
+        slots = np.flatnonzero(vector_matrix.is_set & row_mask[vector_matrix.row_positions])
+        self._validate_dimensions(vector_matrix, row_mask, slots, vector)
+        return vector, slots
+
+    def _to_sorted_scores(
+        self,
+        row_ids: Sequence[str],
+        vector_matrix: VectorMatrix,
+        slots: np.ndarray,
+        similarities: np.ndarray,
+        search_params: VDBKNNSearchParams,
+    ) -> Sequence[tuple[str, float]]:
+        top_slots, top_similarities = self._select_top_similarities(
+            slots,
+            similarities,
+            search_params.limit,
+            search_params.radius,
         )
+        return [
+            (row_ids[row_position], float(similarity))
+            for row_position, similarity in zip(
+                vector_matrix.row_positions[top_slots].tolist(), top_similarities.tolist()
+            )
+        ]
 
-    def _filter_indexed_vectors(
+    def _validate_dimensions(
         self,
-        vdb: dict[str, dict[str, Any]],
-        vector_field: VectorFieldData,
-        filters: Sequence[ComparisonOperation[Field]] | None,
-    ) -> dict[str, Vector]:
-        filtered_unchecked_vectors = {
-            row_id: values[vector_field.name]
-            for row_id, values in vdb.items()
-            if InMemorySearch._is_subset(values, filters or []) and values.get(vector_field.name) is not None
+        vector_matrix: VectorMatrix,
+        row_mask: np.ndarray,
+        slots: np.ndarray,
+        vector: Vector,
+    ) -> None:
+        stored_dimensions = {
+            dimension
+            for row_position, dimension in vector_matrix.mismatching_dimension_by_row_position.items()
+            if row_mask[row_position]
         }
-        filtered_vectors = self._validate_filtered_vectors(
-            filtered_unchecked_vectors,
-            cast(Vector, vector_field.value),
-        )
-        return filtered_vectors
-
-    def _validate_filtered_vectors(
-        self, filtered_unchecked_vectors: dict[str, Any], vector: Vector
-    ) -> dict[str, Vector]:
-        if wrong_types := {
-            type(value) for value in filtered_unchecked_vectors.values() if not isinstance(value, Vector)
-        }:
-            raise VectorFieldTypeException(f"Indexed vector field contains non-vectors: {wrong_types}")
-        if wrong_dimensions := {
-            value.dimension for value in filtered_unchecked_vectors.values() if value.dimension != vector.dimension
-        }:
+        if slots.size:
+            stored_dimensions.add(vector_matrix.dimension)
+        if wrong_dimensions := {dimension for dimension in stored_dimensions if dimension != vector.dimension}:
             raise VectorFieldDimensionException(
                 f"Indexed vector field contains vectors with wrong dimensions: {wrong_dimensions}"
             )
-        return cast(dict[str, Vector], filtered_unchecked_vectors)
 
     def _calculate_similarities(
         self,
         distance_metric: DistanceMetric,
         vector: Vector,
-        filtered_vectors: dict[str, Vector],
-    ) -> dict[str, float]:
+        vector_matrix: VectorMatrix,
+        slots: np.ndarray,
+    ) -> np.ndarray:
         vector_similarity_calculator = VectorSimilarityCalculator(distance_metric)
-        return {
-            row_id: vector_similarity_calculator.calculate_similarity(filtered_vector, vector)
-            for row_id, filtered_vector in filtered_vectors.items()
-        }
+        query_vector = vector.value.astype(vector_matrix.dtype)
+        if vector_matrix.is_quantized:
+            return self._calculate_quantized_similarities(
+                vector_similarity_calculator, vector_matrix, slots, query_vector
+            )
+        matrix = vector_matrix.matrix if slots.size == len(vector_matrix) else vector_matrix.matrix[slots]
+        return vector_similarity_calculator.calculate_similarities_np(matrix, query_vector)
 
-    def _sort_similarities(
+    def _calculate_similarity_matrix(
         self,
-        similarities: dict[str, float],
-        radius: float | None,
-    ) -> Sequence[tuple[str, float]]:
-        return sorted(
-            {
-                k: similarity for k, similarity in similarities.items() if not radius or similarity >= (1 - radius)
-            }.items(),
-            key=lambda x: x[1],
-            reverse=True,
+        distance_metric: DistanceMetric,
+        vectors: Sequence[Vector],
+        vector_matrix: VectorMatrix,
+    ) -> np.ndarray:
+        if not vectors:
+            return np.empty((len(vector_matrix), 0), dtype=vector_matrix.dtype)
+        vector_similarity_calculator = VectorSimilarityCalculator(distance_metric)
+        query_matrix = np.stack([vector.value for vector in vectors], axis=1).astype(vector_matrix.dtype)
+        if vector_matrix.is_quantized:
+            return self._calculate_quantized_similarities(
+                vector_similarity_calculator, vector_matrix, np.arange(len(vector_matrix)), query_matrix
+            )
+        return vector_similarity_calculator.calculate_similarities_np(vector_matrix.matrix, query_matrix)
+
+    def _rescore(  # pylint: disable=too-many-arguments
+        self,
+        distance_metric: DistanceMetric,
+        vector_matrix: VectorMatrix,
+        vector: Vector,
+        slots: np.ndarray,
+        similarities: np.ndarray,
+        limit: int,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Keeps the best `limit * rescoring_factor` candidates by quantized score
+        and scores them again with the float32 copy of their vectors.
+        """
+        if not vector_matrix.has_exact_vectors or self._rescoring_factor <= 0 or limit == UNLIMITED_SEARCH_RESULTS:
+            return slots, similarities
+        rescored_count = max(limit, math.ceil(limit * self._rescoring_factor))
+        if rescored_count < similarities.size:
+            slots = slots[np.argpartition(-similarities, rescored_count)[:rescored_count]]
+        vector_similarity_calculator = VectorSimilarityCalculator(distance_metric)
+        return slots, vector_similarity_calculator.calculate_similarities_np(
+            vector_matrix.get_exact_vectors(slots), vector.value
         )
 
     @staticmethod
-    def _is_subset(
-        raw_entity: dict[str, Any],
-        filters: Sequence[ComparisonOperation[Field]],
-        has_fields: Sequence[Field] | None = None,
-    ) -> bool:
+    def _calculate_quantized_similarities(
+        vector_similarity_calculator: VectorSimilarityCalculator,
+        vector_matrix: VectorMatrix,
+        slots: np.ndarray,
+        query: np.ndarray,
+    ) -> np.ndarray:
         """
-        Return true if all filters are True for the entity.
+        Dequantizes the vectors chunk by chunk, so only a chunk of the matrix is held in full precision at once.
+        Inner products scale with the vectors, so the INT8 scales are applied to the scores instead of the vectors.
         """
-        if not (filters or has_fields):
-            return True
-        grouped_filters = ComparisonOperation._group_filters_by_group_key(filters)
-        filters_evaluation = InMemorySearch._evaluate_grouped_filters(grouped_filters, raw_entity)
-        has_fields_evaluation = InMemorySearch._evaluate_has_fields(has_fields, raw_entity)
-        return filters_evaluation and has_fields_evaluation
+        similarities_list = []
+        for start in range(0, max(slots.size, 1), DEQUANTIZATION_CHUNK_SIZE):
+            chunk = slots[start : start + DEQUANTIZATION_CHUNK_SIZE]
+            similarities = vector_similarity_calculator.calculate_similarities_np(
+                vector_matrix.dequantize(chunk, scaled=False), query
+            )
+            if (scales := vector_matrix.scales) is not None:
+                similarities = (similarities.T * scales[chunk]).T
+            similarities_list.append(similarities)
+        return np.concatenate(similarities_list)
+
+    def _select_top_similarities(
+        self,
+        slots: np.ndarray,
+        similarities: np.ndarray,
+        limit: int,
+        radius: float | None,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        if radius:
+            within_radius = similarities >= (1 - radius)
+            slots, similarities = slots[within_radius], similarities[within_radius]
+        if limit != UNLIMITED_SEARCH_RESULTS and limit < similarities.size:
+            top = np.argpartition(-similarities, limit)[:limit]
+            slots, similarities = slots[top], similarities[top]
+        # ties are broken by insertion order
+        order = np.lexsort((slots, -similarities))
+        return slots[order], similarities[order]
 
     @staticmethod
-    def _evaluate_grouped_filters(
-        grouped_filters: dict[int | None, list[ComparisonOperation[Field]]],
-        entity: dict[str, Any],
-    ) -> bool:
-        return all(
-            InMemorySearch._evaluate_group(group, group_key, entity) for group_key, group in grouped_filters.items()
-        )
+    def _evaluate_and_group(
+        mask: np.ndarray,
+        vdb: defaultdict[str, dict[str, Any]],
+        row_ids: Sequence[str],
+        field_indices: dict[str, FieldIndex],
+        group: Sequence[ComparisonOperation[Field]],
+    ) -> None:
+        unindexed_filters = []
+        for filter_ in group:
+            if (filter_mask := InMemorySearch._evaluate_indexed(field_indices, filter_, len(row_ids))) is not None:
+                mask &= filter_mask
+            else:
+                unindexed_filters.append(filter_)
+        for filter_ in unindexed_filters:
+            InMemorySearch._evaluate_on_rows(mask, vdb, row_ids, InMemorySearch._to_row_predicate(filter_))
 
     @staticmethod
-    def _evaluate_group(
-        group: list[ComparisonOperation[Field]],
-        group_key: int | None,
-        entity: dict[str, Any],
-    ) -> bool:
-        evaluate_func = all if group_key is None else any
-        return evaluate_func(filter_.evaluate(entity.get(cast(Field, filter_._operand).name)) for filter_ in group)
+    def _evaluate_or_group(
+        mask: np.ndarray,
+        vdb: defaultdict[str, dict[str, Any]],
+        row_ids: Sequence[str],
+        field_indices: dict[str, FieldIndex],
+        group: Sequence[ComparisonOperation[Field]],
+    ) -> np.ndarray:
+        group_mask = np.zeros(len(row_ids), dtype=np.bool_)
+        unindexed_filters = []
+        for filter_ in group:
+            if (filter_mask := InMemorySearch._evaluate_indexed(field_indices, filter_, len(row_ids))) is not None:
+                group_mask |= filter_mask
+            else:
+                unindexed_filters.append(filter_)
+        if unindexed_filters:
+            remaining_mask = mask & ~group_mask
+            InMemorySearch._evaluate_on_rows(
+                remaining_mask,
+                vdb,
+                row_ids,
+                lambda entity: any(InMemorySearch._to_row_predicate(filter_)(entity) for filter_ in unindexed_filters),
+            )
+            group_mask |= remaining_mask
+        return group_mask
+
+    @staticmethod
+    def _evaluate_indexed(
+        field_indices: dict[str, FieldIndex],
+        filter_: ComparisonOperation[Field],
+        size: int,
+    ) -> np.ndarray | None:
+        if (field_index := field_indices.get(cast(Field, filter_._operand).name)) is None:
+            return None
+        return field_index.evaluate(filter_, size)
+
+    @staticmethod
+    def _evaluate_on_rows(
+        mask: np.ndarray,
+        vdb: defaultdict[str, dict[str, Any]],
+        row_ids: Sequence[str],
+        predicate: Callable[[dict[str, Any]], bool],
+    ) -> None:
+        """
+        Narrows `mask` in place by evaluating `predicate` on the rows that are still candidates.
+        """
+        positions = np.flatnonzero(mask)
+        mask[positions] = np.fromiter(
+            (predicate(vdb[row_ids[position]]) for position in positions.tolist()),
+            dtype=np.bool_,
+            count=positions.size,
+        )
 
     @staticmethod
-    def _evaluate_has_fields(has_fields: Sequence[Field] | None, entity: dict[str, Any]) -> bool:
-        return all(entity.get(field.name) is not None for field in has_fields or [])
+    def _to_row_predicate(filter_: ComparisonOperation[Field]) -> Callable[[dict[str, Any]], bool]:
+        field_name = cast(Field, filter_._operand).name
+        return lambda entity: filter_.evaluate(entity.get(field_name))
@@ -14,10 +14,12 @@
 
 import json
 from collections import defaultdict
+from threading import RLock
 
 from beartype.typing import Any, Sequence
 from typing_extensions import override
 
+from superlinked.framework.common.data_types import Vector
 from superlinked.framework.common.interface.comparison_operand import (
     ComparisonOperation,
 )
@@ -26,6 +28,7 @@ from superlinked.framework.common.storage.entity.entity_data import EntityData
 from superlinked.framework.common.storage.entity.entity_id import EntityId
 from superlinked.framework.common.storage.field.field import Field
 from superlinked.framework.common.storage.field.field_data import FieldData
+from superlinked.framework.common.storage.index_config import IndexConfig
 from superlinked.framework.common.storage.query.vdb_knn_search_params import (
     VDBKNNSearchParams,
 )
@@ -33,28 +36,72 @@ from superlinked.framework.common.storage.result_entity_data import ResultEntity
 from superlinked.framework.common.storage.search_index.manager.search_index_manager import (
     SearchIndexManager,
 )
+from superlinked.framework.common.storage.search_index.search_algorithm import (
+    SearchAlgorithm,
+)
+from superlinked.framework.common.storage.search_index.vector_component_precision import (
+    VectorComponentPrecision,
+)
 from superlinked.framework.common.storage.vdb_connector import VDBConnector
 from superlinked.framework.storage.common.vdb_settings import VDBSettings
+from superlinked.framework.storage.in_memory.ann_index import ANNIndex
+from superlinked.framework.storage.in_memory.exception import VectorFieldTypeException
+from superlinked.framework.storage.in_memory.field_index import FieldIndex
+from superlinked.framework.storage.in_memory.field_index_factory import (
+    FieldIndexFactory,
+)
 from superlinked.framework.storage.in_memory.in_memory_search import InMemorySearch
 from superlinked.framework.storage.in_memory.in_memory_search_index_manager import (
     InMemorySearchIndexManager,
 )
+from superlinked.framework.storage.in_memory.in_memory_vdb_snapshot import (
+    InMemoryVDBSnapshot,
+)
+from superlinked.framework.storage.in_memory.ivf_index import IVFIndex
+from superlinked.framework.storage.in_memory.ivf_params import IVFParams
 from superlinked.framework.storage.in_memory.json_codec import JsonDecoder, JsonEncoder
 from superlinked.framework.storage.in_memory.object_serializer import ObjectSerializer
+from superlinked.framework.storage.in_memory.quantization_params import (
+    QuantizationParams,
+)
+from superlinked.framework.storage.in_memory.vector_matrix import VectorMatrix
+
+# Row store value of a vector kept only by the quantized VectorMatrix of its field.
+STORED_IN_VECTOR_MATRIX = object()
 
 
 class InMemoryVDB(VDBConnector):
-    def __init__(self, vdb_settings: VDBSettings) -> None:
-        super().__init__()
+    def __init__(
+        self,
+        vdb_settings: VDBSettings,
+        search_algorithm: SearchAlgorithm = SearchAlgorithm.FLAT,
+        ivf_params: IVFParams | None = None,
+        quantization_params: QuantizationParams | None = None,
+    ) -> None:
+        super().__init__(
+            search_algorithm=search_algorithm,
+            vector_coordinate_type=VectorComponentPrecision.FLOAT64,
+        )
         self._vdb = defaultdict[str, dict[str, Any]](dict)
-        self._search = InMemorySearch()
+        self._row_ids: list[str] = []
+        self._row_position_by_row_id: dict[str, int] = {}
+        self._field_indices: dict[str, FieldIndex] = {}
+        self._vector_matrices: dict[str, VectorMatrix] = {}
+        self._ann_indices: dict[str, ANNIndex] = {}
         self.__vdb_settings = vdb_settings
+        self.__ivf_params = ivf_params or IVFParams()
+        self.__quantization_params = quantization_params or QuantizationParams()
+        self._search = InMemorySearch(self.__quantization_params.rescoring_factor)
         self.__search_index_manager = InMemorySearchIndexManager()
+        # the async API searches in worker threads, so reads must not interleave with writes
+        self._lock = RLock()
 
     @override
     def close_connection(self) -> None:
-        self._vdb = defaultdict[str, dict[str, Any]](dict)
-        self.search_index_manager.clear_configs()
+        with self._lock:
+            self._vdb = defaultdict[str, dict[str, Any]](dict)
+            self.search_index_manager.clear_configs()
+            self._build_indices()
 
     @override
     @property
@@ -66,29 +113,119 @@ class InMemoryVDB(VDBConnector):
     def _default_search_limit(self) -> int:
         return self.__vdb_settings.default_query_limit
 
+    @override
+    def init_search_index_configs(
+        self,
+        index_configs: Sequence[IndexConfig],
+        create_search_indices: bool,
+        override_existing: bool = False,
+    ) -> None:
+        with self._lock:
+            super().init_search_index_configs(index_configs, create_search_indices, override_existing)
+            self._build_indices()
+
     @override
     def write_entities(self, entity_data: Sequence[EntityData]) -> None:
-        for ed in entity_data:
-            row_id = InMemoryVDB._get_row_id_from_entity_id(ed.id_)
-            self._vdb[row_id].update({name: fd.value for name, fd in ed.field_data.items()})
+        with self._lock:
+            for ed in entity_data:
+                row_id = InMemoryVDB._get_row_id_from_entity_id(ed.id_)
+                values = {name: fd.value for name, fd in ed.field_data.items()}
+                self._index_row(row_id, values)
+                self._vdb[row_id].update(values)
+
+    def _build_indices(self) -> None:
+        for row_id, values in self._vdb.items():
+            self._vdb[row_id] = self._materialize_row(row_id, values)
+        self._row_ids = []
+        self._row_position_by_row_id = {}
+        self._field_indices = {}
+        self._vector_matrices = {}
+        self._ann_indices = {}
+        for index_config in self.search_index_manager._index_configs.values():
+            for field_descriptor in index_config.field_descriptors:
+                if field_descriptor.field_name in self._field_indices:
+                    continue
+                if field_index := FieldIndexFactory.create_field_index(field_descriptor.field_data_type):
+                    self._field_indices[field_descriptor.field_name] = field_index
+            vector_field_descriptor = index_config.vector_field_descriptor
+            vector_matrix = VectorMatrix(
+                vector_field_descriptor.field_size,
+                vector_field_descriptor.coordinate_type,
+                quantization=self.__quantization_params.quantization,
+                keep_exact_vectors=self.__quantization_params.rescoring_factor > 0,
+            )
+            self._vector_matrices[vector_field_descriptor.field_name] = vector_matrix
+            if ann_index := self._create_ann_index(vector_field_descriptor.search_algorithm, vector_matrix):
+                self._ann_indices[vector_field_descriptor.field_name] = ann_index
+        for row_id, values in self._vdb.items():
+            if values:
+                self._index_row(row_id, values)
+
+    def _index_row(self, row_id: str, values: dict[str, Any]) -> None:
+        """
+        Replaces the vectors stored only by quantized vector matrices in `values` with `STORED_IN_VECTOR_MATRIX`.
+        """
+        if wrong_types := {
+            type(value)
+            for name, value in values.items()
+            if name in self._vector_matrices and value is not None and not isinstance(value, Vector)
+        }:
+            raise VectorFieldTypeException(f"Indexed vector field contains non-vectors: {wrong_types}")
+        if (row_position := self._row_position_by_row_id.get(row_id)) is None:
+            row_position = len(self._row_ids)
+            self._row_ids.append(row_id)
+            self._row_position_by_row_id[row_id] = row_position
+        for name, value in values.items():
+            if (field_index := self._field_indices.get(name)) is not None:
+                field_index.set_value(row_position, value)
+            elif (vector_matrix := self._vector_matrices.get(name)) is not None:
+                if value is None:
+                    vector_matrix.unset_vector(row_position)
+                    continue
+                slot = vector_matrix.set_vector(row_position, value)
+                if slot is not None and vector_matrix.is_quantized:
+                    values[name] = STORED_IN_VECTOR_MATRIX
+                if slot is not None and (ann_index := self._ann_indices.get(name)) is not None:
+                    ann_index.add(slot)
+
+    def _materialize_row(self, row_id: str, values: dict[str, Any]) -> dict[str, Any]:
+        """
+        The row with the vectors kept only by quantized vector matrices read back from them.
+        """
+        if not any(value is STORED_IN_VECTOR_MATRIX for value in values.values()):
+            return values
+        return {name: self._get_value(row_id, name, value) for name, value in values.items()}
+
+    def _get_value(self, row_id: str, name: str, value: Any) -> Any:
+        if value is STORED_IN_VECTOR_MATRIX:
+            return self._vector_matrices[name].get_vector(self._row_position_by_row_id[row_id])
+        return value
+
+    def _create_ann_index(self, search_algorithm: SearchAlgorithm, vector_matrix: VectorMatrix) -> ANNIndex | None:
+        match search_algorithm:
+            case SearchAlgorithm.IVF_FLAT:
+                return IVFIndex(vector_matrix, self.__ivf_params)
+            case _:
+                return None
 
     @override
     def read_entities(self, entities: Sequence[Entity]) -> Sequence[EntityData]:
-        return [
-            EntityData(
-                entity.id_,
-                self._find_field_data(
-                    InMemoryVDB._get_row_id_from_entity_id(entity.id_),
-                    list(entity.fields.values()),
-                ),
-            )
-            for entity in entities
-        ]
+        with self._lock:
+            return [
+                EntityData(
+                    entity.id_,
+                    self._find_field_data(
+                        InMemoryVDB._get_row_id_from_entity_id(entity.id_),
+                        list(entity.fields.values()),
+                    ),
+                )
+                for entity in entities
+            ]
 
     def _find_field_data(self, row_id: str, fields: Sequence[Field]) -> dict[str, FieldData]:
-        raw_entity = self._vdb[row_id]
+        raw_entity = self._vdb.get(row_id, {})
         return {
-            field.name: FieldData.from_field(field, raw_entity.get(field.name))
+            field.name: FieldData.from_field(field, self._get_value(row_id, field.name, raw_entity[field.name]))
             for field in fields
             if raw_entity.get(field.name) is not None
         }
@@ -99,14 +236,15 @@ class InMemoryVDB(VDBConnector):
         has_fields: Sequence[Field],
         return_fields: Sequence[Field],
     ) -> Sequence[EntityData]:
-        row_ids = self._search.search(self._vdb, filters, has_fields)
-        return [
-            EntityData(
-                InMemoryVDB._get_entity_id_from_row_id(row_id),
-                self._find_field_data(row_id, return_fields),
-            )
-            for row_id in row_ids
-        ]
+        with self._lock:
+            row_ids = self._search.search(self._vdb, self._row_ids, self._field_indices, filters, has_fields)
+            return [
+                EntityData(
+                    InMemoryVDB._get_entity_id_from_row_id(row_id),
+                    self._find_field_data(row_id, return_fields),
+                )
+                for row_id in row_ids
+            ]
 
     @override
     def _knn_search(
@@ -118,26 +256,71 @@ class InMemoryVDB(VDBConnector):
         **params: Any,
     ) -> Sequence[ResultEntityData]:
         index_config = self._get_index_config(index_name)
-        sorted_scores = self._search.knn_search(index_config, self._vdb, vdb_knn_search_params)
-        return [self._get_result_entity_data(row_id, score, returned_fields) for row_id, score in sorted_scores]
+        vector_field_name = index_config.vector_field_descriptor.field_name
+        with self._lock:
+            sorted_scores = self._search.knn_search(
+                index_config,
+                self._vdb,
+                self._row_ids,
+                self._field_indices,
+                self._vector_matrices[vector_field_name],
+                vdb_knn_search_params,
+                self._ann_indices.get(vector_field_name),
+            )
+            return [self._get_result_entity_data(row_id, score, returned_fields) for row_id, score in sorted_scores]
+
+    @override
+    def _knn_search_batch(
+        self,
+        index_name: str,
+        schema_name: str,
+        returned_fields: Sequence[Field],
+        vdb_knn_search_params_list: Sequence[VDBKNNSearchParams],
+        **params: Any,
+    ) -> list[Sequence[ResultEntityData]]:
+        index_config = self._get_index_config(index_name)
+        vector_field_name = index_config.vector_field_descriptor.field_name
+        with self._lock:
+            sorted_scores_list = self._search.knn_search_batch(
+                index_config,
+                self._vdb,
+                self._row_ids,
+                self._field_indices,
+                self._vector_matrices[vector_field_name],
+                vdb_knn_search_params_list,
+                self._ann_indices.get(vector_field_name),
+            )
+            return [
+                [self._get_result_entity_data(row_id, score, returned_fields) for row_id, score in sorted_scores]
+                for sorted_scores in sorted_scores_list
+            ]
 
     @override
     def persist(self, serializer: ObjectSerializer) -> None:
         app_identifier = "_".join(self.search_index_manager._index_configs.keys())
+        with self._lock:
+            vdb = {row_id: self._materialize_row(row_id, values) for row_id, values in self._vdb.items()}
+        if serializer.supports_binary:
+            InMemoryVDBSnapshot(serializer, app_identifier).write(vdb)
+            return
         serializer.write(
-            json.dumps(self._vdb, cls=JsonEncoder),
+            json.dumps(vdb, cls=JsonEncoder),
             app_identifier,
         )
 
     @override
     def restore(self, serializer: ObjectSerializer) -> None:
         app_identifier = "_".join(self.search_index_manager._index_configs.keys())
-        self._vdb.update(
-            json.loads(
+        if serializer.supports_binary:
+            vdb = InMemoryVDBSnapshot(serializer, app_identifier).read()
+        else:
+            vdb = json.loads(
                 serializer.read(app_identifier),
                 cls=JsonDecoder,
             )
-        )
+        with self._lock:
+            self._vdb.update(vdb)
+            self._build_indices()
 
     def _get_result_entity_data(self, row_id: str, score: float, returned_fields: Sequence[Field]) -> ResultEntityData:
         return ResultEntityData(
@@ -0,0 +1,109 @@
+# Copyright 2024 Superlinked, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import io
+import json
+from collections import defaultdict
+
+import numpy as np
+from beartype.typing import Any, Mapping
+
+from superlinked.framework.common.data_types import Vector
+from superlinked.framework.storage.in_memory.exception import (
+    InMemoryVDBSnapshotException,
+)
+from superlinked.framework.storage.in_memory.json_codec import JsonDecoder, JsonEncoder
+from superlinked.framework.storage.in_memory.object_serializer import ObjectSerializer
+
+SNAPSHOT_FORMAT_VERSION = 1
+MANIFEST_KEY_SUFFIX = ".manifest"
+COLUMNS_KEY_SUFFIX = ".columns"
+VECTORS_KEY_SUFFIX = ".vectors.{block}.npy"
+VECTOR_ROWS_KEY_SUFFIX = ".vector_rows.{block}.npy"
+
+
+class InMemoryVDBSnapshot:
+    """
+    Binary snapshot of the rows of an InMemoryVDB.
+    Vectors are stored per (field, dimension) as raw `.npy` blocks together with the positions of their rows,
+    every other field is stored column by column in a single JSON side object.
+    Blocks backed by a local file are memory-mapped on read, so restoring costs about a disk read.
+    """
+
+    def __init__(self, serializer: ObjectSerializer, key: str) -> None:
+        self._serializer = serializer
+        self._key = key
+
+    def write(self, rows: Mapping[str, Mapping[str, Any]]) -> None:
+        row_ids = [row_id for row_id, values in rows.items() if values]
+        columns: dict[str, dict[str, list]] = defaultdict(lambda: {"rows": [], "values": []})
+        vector_rows_by_block: dict[tuple[str, int], list[int]] = defaultdict(list)
+        vectors_by_block: dict[tuple[str, int], list[np.ndarray]] = defaultdict(list)
+        for row_position, row_id in enumerate(row_ids):
+            for field_name, value in rows[row_id].items():
+                if isinstance(value, Vector):
+                    vector_rows_by_block[(field_name, value.dimension)].append(row_position)
+                    vectors_by_block[(field_name, value.dimension)].append(value.value)
+                else:
+                    columns[field_name]["rows"].append(row_position)
+                    columns[field_name]["values"].append(value)
+        vector_blocks = []
+        for block, ((field_name, dimension), vectors) in enumerate(vectors_by_block.items()):
+            vector_block = np.array(vectors, dtype=np.float64).reshape(len(vectors), dimension)
+            self._write_array(vector_block, VECTORS_KEY_SUFFIX, block)
+            self._write_array(
+                np.array(vector_rows_by_block[(field_name, dimension)], dtype=np.int64), VECTOR_ROWS_KEY_SUFFIX, block
+            )
+            vector_blocks.append({"field_name": field_name, "dimension": dimension})
+        self._serializer.write(
+            json.dumps({"row_ids": row_ids, "columns": columns}, cls=JsonEncoder),
+            self._key + COLUMNS_KEY_SUFFIX,
+        )
+        self._serializer.write(
+            json.dumps({"version": SNAPSHOT_FORMAT_VERSION, "vector_blocks": vector_blocks}),
+            self._key + MANIFEST_KEY_SUFFIX,
+        )
+
+    def read(self) -> dict[str, dict[str, Any]]:
+        manifest = json.loads(self._serializer.read(self._key + MANIFEST_KEY_SUFFIX))
+        if manifest.get("version") != SNAPSHOT_FORMAT_VERSION:
+            raise InMemoryVDBSnapshotException(f"Unsupported snapshot format version: {manifest.get('version')}.")
+        columns_data = json.loads(self._serializer.read(self._key + COLUMNS_KEY_SUFFIX), cls=JsonDecoder)
+        row_ids: list[str] = columns_data["row_ids"]
+        rows: list[dict[str, Any]] = [{} for _ in row_ids]
+        for field_name, column in columns_data["columns"].items():
+            for row_position, value in zip(column["rows"], column["values"]):
+                rows[row_position][field_name] = value
+        for block, vector_block in enumerate(manifest["vector_blocks"]):
+            vectors = self._read_array(VECTORS_KEY_SUFFIX, block)
+            vector_rows = self._read_array(VECTOR_ROWS_KEY_SUFFIX, block)
+            field_name = vector_block["field_name"]
+            for row_position, vector in zip(vector_rows.tolist(), vectors):
+                rows[row_position][field_name] = Vector(vector)
+        return dict(zip(row_ids, rows))
+
+    def _write_array(self, array: np.ndarray, key_suffix: str, block: int) -> None:
+        key = self._key + key_suffix.format(block=block)
+        if (path := self._serializer.get_local_path(key)) is not None:
+            np.save(path, array, allow_pickle=False)
+            return
+        buffer = io.BytesIO()
+        np.save(buffer, array, allow_pickle=False)
+        self._serializer.write_binary(buffer.getvalue(), key)
+
+    def _read_array(self, key_suffix: str, block: int) -> np.ndarray:
+        key = self._key + key_suffix.format(block=block)
+        if (path := self._serializer.get_local_path(key)) is not None:
+            return np.asarray(np.load(path, mmap_mode="r", allow_pickle=False))
+        return np.load(io.BytesIO(self._serializer.read_binary(key)), allow_pickle=False)
@@ -0,0 +1,124 @@
+# Copyright 2024 Superlinked, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+from typing_extensions import override
+
+from superlinked.framework.storage.in_memory.ann_index import ANNIndex
+from superlinked.framework.storage.in_memory.ivf_params import IVFParams
+from superlinked.framework.storage.in_memory.vector_matrix import VectorMatrix
+
+TRAINING_SAMPLE_SIZE_PER_LIST = 64
+ASSIGNMENT_CHUNK_SIZE = 65536
+RANDOM_SEED = 0
+UNASSIGNED = -1
+
+
+class IVFIndex(ANNIndex):
+    """
+    Inverted file index: the vectors are partitioned by spherical k-means and a search
+    only scans the clusters whose centroids are the most similar to the searched vector.
+    New vectors are assigned to their closest cluster when written, and the clusters are
+    retrained as the number of vectors grows. Training is deferred to the next search,
+    so writes never wait for the k-means.
+    """
+
+    def __init__(self, vector_matrix: VectorMatrix, params: IVFParams) -> None:
+        super().__init__(vector_matrix)
+        self.__params = params
+        self.__centroids: np.ndarray | None = None
+        self.__list_by_slot = np.full(0, UNASSIGNED, dtype=np.int32)
+        self.__trained_size = 0
+        self.__is_training_due = False
+
+    @property
+    def is_trained(self) -> bool:
+        return self.__centroids is not None
+
+    @override
+    def add(self, slot: int) -> None:
+        size = len(self._vector_matrix)
+        if size >= max(self.__params.training_threshold, self.__trained_size * self.__params.retraining_growth_factor):
+            self.__is_training_due = True
+        if self.__centroids is None:
+            return
+        self.__ensure_capacity(size)
+        vector = self._vector_matrix.dequantize(slot).astype(np.float32)
+        self.__list_by_slot[slot] = int(np.argmax(self.__centroids @ vector))
+
+    @override
+    def select_candidates(self, vector: np.ndarray, candidate_slots: np.ndarray, limit: int) -> np.ndarray:
+        if self.__is_training_due:
+            self.train()
+        if self.__centroids is None or limit < 0 or candidate_slots.size < self.__params.exact_search_threshold:
+            return candidate_slots
+        list_count = self.__centroids.shape[0]
+        list_order = np.argsort(-(self.__centroids @ vector.astype(np.float32)))
+        candidate_lists = self.__list_by_slot[candidate_slots]
+        probe_count = min(max(self.__params.probe_count, 1), list_count)
+        while True:
+            is_probed = np.zeros(list_count, dtype=np.bool_)
+            is_probed[list_order[:probe_count]] = True
+            selected_slots = candidate_slots[is_probed[candidate_lists]]
+            # selective filters can leave too few candidates in the closest clusters
+            if selected_slots.size >= limit or probe_count == list_count:
+                return selected_slots
+            probe_count = min(2 * probe_count, list_count)
+
+    def train(self) -> None:
+        self.__is_training_due = False
+        slots = np.flatnonzero(self._vector_matrix.is_set)
+        if not slots.size:
+            return
+        rng = np.random.default_rng(RANDOM_SEED)
+        list_count = min(self.__params.list_count or max(int(np.sqrt(slots.size)), 1), slots.size)
+        sample_size = min(slots.size, list_count * TRAINING_SAMPLE_SIZE_PER_LIST)
+        sample = self._vector_matrix.dequantize(np.sort(rng.choice(slots, sample_size, replace=False)))
+        sample = sample.astype(np.float32)
+        centroids = sample[rng.choice(sample_size, list_count, replace=False)]
+        for _ in range(self.__params.training_iteration_count):
+            centroids = IVFIndex.__update_centroids(sample, IVFIndex.__normalize(centroids), rng)
+        self.__centroids = IVFIndex.__normalize(centroids)
+        self.__trained_size = len(self._vector_matrix)
+        self.__assign_all()
+
+    def __assign_all(self) -> None:
+        if self.__centroids is None:
+            return
+        size = len(self._vector_matrix)
+        self.__list_by_slot = np.full(max(size, 1), UNASSIGNED, dtype=np.int32)
+        for start in range(0, size, ASSIGNMENT_CHUNK_SIZE):
+            chunk = self._vector_matrix.dequantize(slice(start, start + ASSIGNMENT_CHUNK_SIZE)).astype(np.float32)
+            self.__list_by_slot[start : start + chunk.shape[0]] = np.argmax(chunk @ self.__centroids.T, axis=1)
+
+    def __ensure_capacity(self, size: int) -> None:
+        if size <= self.__list_by_slot.shape[0]:
+            return
+        list_by_slot = np.full(max(2 * self.__list_by_slot.shape[0], size), UNASSIGNED, dtype=np.int32)
+        list_by_slot[: self.__list_by_slot.shape[0]] = self.__list_by_slot
+        self.__list_by_slot = list_by_slot
+
+    @staticmethod
+    def __update_centroids(sample: np.ndarray, centroids: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+        assignment = np.argmax(sample @ centroids.T, axis=1)
+        order = np.argsort(assignment, kind="stable")
+        lists, starts = np.unique(assignment[order], return_index=True)
+        updated = sample[rng.choice(sample.shape[0], centroids.shape[0])]  # reseeds the empty clusters
+        updated[lists] = np.add.reduceat(sample[order], starts, axis=0)
+        return updated
+
+    @staticmethod
+    def __normalize(centroids: np.ndarray) -> np.ndarray:
+        norms = np.linalg.norm(centroids, axis=1, keepdims=True)
+        return centroids / np.where(norms == 0, 1, norms)
@@ -0,0 +1,41 @@
+# Copyright 2024 Superlinked, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class IVFParams:
+    """
+    Parameters of the in-memory IVF-flat index, trading recall for latency.
+
+    Attributes:
+        list_count (int | None): The number of clusters the vectors are partitioned into.
+            Defaults to the square root of the number of vectors at training time.
+        probe_count (int): The number of clusters scanned per query. Higher values mean better recall.
+        training_threshold (int): The number of vectors needed before the clusters are trained.
+            Until then every search is exact.
+        retraining_growth_factor (float): The clusters are retrained whenever the number of vectors
+            grows by this factor since the last training.
+        exact_search_threshold (int): Searches with fewer candidates than this (e.g. due to selective filters)
+            skip the clusters and are exact.
+        training_iteration_count (int): The number of k-means iterations of a training.
+    """
+
+    list_count: int | None = None
+    probe_count: int = 8
+    training_threshold: int = 10000
+    retraining_growth_factor: float = 2.0
+    exact_search_threshold: int = 10000
+    training_iteration_count: int = 10
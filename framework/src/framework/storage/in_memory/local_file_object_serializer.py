@@ -0,0 +1,54 @@
+# Copyright 2024 Superlinked, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from pathlib import Path
+
+from typing_extensions import override
+
+from superlinked.framework.storage.in_memory.object_serializer import ObjectSerializer
+
+
+class LocalFileObjectSerializer(ObjectSerializer):
+    """
+    Stores every object in its own file under `directory`, named after its key.
+    """
+
+    def __init__(self, directory: Path | str) -> None:
+        self._directory = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+
+    @override
+    def read(self, key: str) -> str:
+        return self.get_local_path(key).read_text(encoding="utf-8")
+
+    @override
+    def write(self, serialized_object: str, key: str) -> None:
+        self.get_local_path(key).write_text(serialized_object, encoding="utf-8")
+
+    @property
+    @override
+    def supports_binary(self) -> bool:
+        return True
+
+    @override
+    def read_binary(self, key: str) -> bytes:
+        return self.get_local_path(key).read_bytes()
+
+    @override
+    def write_binary(self, data: bytes, key: str) -> None:
+        self.get_local_path(key).write_bytes(data)
+
+    @override
+    def get_local_path(self, key: str) -> Path:
+        return self._directory / key
@@ -13,6 +13,7 @@
 # limitations under the License.
 
 from abc import ABC, abstractmethod
+from pathlib import Path
 
 
 class ObjectSerializer(ABC):
@@ -33,3 +34,30 @@ class ObjectSerializer(ABC):
         Write the serialized object under the specified key.
         The serialized_object parameter should be a string representation of a serialized dictionary.
         """
+
+    @property
+    def supports_binary(self) -> bool:
+        """
+        Whether the serializer implements `read_binary` and `write_binary`.
+        Binary snapshots are much faster to write and restore than the string representation.
+        """
+        return False
+
+    def read_binary(self, key: str) -> bytes:
+        """
+        Read the binary object associated with the given key.
+        """
+        raise NotImplementedError(f"{type(self).__name__} doesn't support binary objects.")
+
+    def write_binary(self, data: bytes, key: str) -> None:
+        """
+        Write the binary object under the specified key.
+        """
+        raise NotImplementedError(f"{type(self).__name__} doesn't support binary objects.")
+
+    def get_local_path(self, key: str) -> Path | None:  # pylint: disable=unused-argument
+        """
+        Return the local file backing the given key, if there is one.
+        Binary objects stored in local files are memory-mapped on restore instead of being read.
+        """
+        return None
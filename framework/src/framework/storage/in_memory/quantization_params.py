@@ -0,0 +1,40 @@
+# Copyright 2024 Superlinked, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from dataclasses import dataclass
+
+from superlinked.framework.storage.in_memory.vector_quantization import (
+    VectorQuantization,
+)
+
+
+@dataclass(frozen=True)
+class QuantizationParams:
+    """
+    Parameters of the quantized in-memory search matrix, trading recall for memory.
+    Without quantization every indexed vector component takes 16 bytes, 8 in the row store and 8 in the search matrix.
+    With quantization the row store doesn't keep the indexed vectors, they are read back from the search matrix.
+
+    Attributes:
+        quantization (VectorQuantization): The format of the search matrix. FLOAT16 stores 2 bytes per component,
+            INT8 1 byte per component and a float32 scale per vector.
+        rescoring_factor (float): The `limit * rescoring_factor` best candidates by quantized score
+            are rescored with a float32 copy of the vectors, so the returned order and scores are exact among them.
+            The copy adds 4 bytes per component and is also what reads return.
+            0 disables rescoring and drops the copy, reads then return the dequantized vectors.
+            Searches without a limit return the quantized scores.
+    """
+
+    quantization: VectorQuantization = VectorQuantization.NONE
+    rescoring_factor: float = 4.0
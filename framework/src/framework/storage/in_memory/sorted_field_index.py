@@ -0,0 +1,136 @@
+# Copyright 2024 Superlinked, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+from beartype.typing import Any, Sequence
+from typing_extensions import override
+
+from superlinked.framework.common.interface.comparison_operand import (
+    ComparisonOperation,
+)
+from superlinked.framework.common.interface.comparison_operation_type import (
+    ComparisonOperationType,
+)
+from superlinked.framework.common.storage.field.field import Field
+from superlinked.framework.storage.in_memory.field_index import FieldIndex
+
+
+class SortedFieldIndex(FieldIndex):
+    """
+    Keeps the values of a numeric field in a dense column and a sorted copy of it.
+    Answers equality, membership and range filters with binary searches over the sorted values.
+    The positions set since the last filter are merged into the sorted copy before the next one,
+    so a filter after `k` writes costs O(N + k log k) instead of a full re-sort.
+    """
+
+    def __init__(self, dtype: type[np.number]) -> None:
+        super().__init__()
+        self.__dtype = dtype
+        self.__values = np.zeros(self._has_value.shape[0], dtype=dtype)
+        self.__sorted_positions: np.ndarray | None = None
+        self.__sorted_values: np.ndarray | None = None
+        self.__changed_positions: set[int] = set()
+
+    @override
+    def _grow(self, capacity: int) -> None:
+        values = np.zeros(capacity, dtype=self.__dtype)
+        values[: self.__values.shape[0]] = self.__values
+        self.__values = values
+
+    @override
+    def _set_value(self, position: int, value: Any) -> None:
+        if value is not None:
+            self.__values[position] = value
+        if self.__sorted_positions is not None:
+            self.__changed_positions.add(position)
+
+    @override
+    def evaluate(self, filter_: ComparisonOperation[Field], size: int) -> np.ndarray | None:
+        others = filter_._get_other_as_sequence()
+        if not all(SortedFieldIndex.__is_number(other) for other in others):
+            return None
+        match filter_._op:
+            case ComparisonOperationType.EQUAL:
+                return self.__equal_mask(others, size) if SortedFieldIndex.__is_number(filter_._other) else None
+            case ComparisonOperationType.NOT_EQUAL:
+                return ~self.__equal_mask(others, size) if SortedFieldIndex.__is_number(filter_._other) else None
+            case ComparisonOperationType.IN:
+                return self.__equal_mask(others, size)
+            case ComparisonOperationType.NOT_IN:
+                return ~self.__equal_mask(others, size)
+            case ComparisonOperationType.GREATER_THAN:
+                return self.__range_mask(filter_._other, "right", None, "left", size)
+            case ComparisonOperationType.GREATER_EQUAL:
+                return self.__range_mask(filter_._other, "left", None, "left", size)
+            case ComparisonOperationType.LESS_THAN:
+                return self.__range_mask(None, "left", filter_._other, "left", size)
+            case ComparisonOperationType.LESS_EQUAL:
+                return self.__range_mask(None, "left", filter_._other, "right", size)
+            case _:
+                return None
+
+    def __equal_mask(self, others: Sequence[float | int], size: int) -> np.ndarray:
+        mask = np.zeros(size, dtype=np.bool_)
+        for other in others:
+            mask |= self.__range_mask(other, "left", other, "right", size)
+        return mask
+
+    def __range_mask(
+        self,
+        lower: Any,
+        lower_side: str,
+        upper: Any,
+        upper_side: str,
+        size: int,
+    ) -> np.ndarray:
+        sorted_positions, sorted_values = self.__get_sorted()
+        start = 0 if lower is None else int(np.searchsorted(sorted_values, lower, side=lower_side))
+        end = sorted_values.shape[0] if upper is None else int(np.searchsorted(sorted_values, upper, side=upper_side))
+        positions = sorted_positions[start:end]
+        mask = np.zeros(size, dtype=np.bool_)
+        mask[positions[positions < size]] = True
+        return mask
+
+    def __get_sorted(self) -> tuple[np.ndarray, np.ndarray]:
+        if self.__sorted_positions is None or self.__sorted_values is None:
+            positions = np.arange(self._has_value.shape[0])
+            self.__sorted_positions, self.__sorted_values = self.__sort_comparable(positions)
+        elif self.__changed_positions:
+            self.__merge_changed_positions(self.__sorted_positions, self.__sorted_values)
+        return self.__sorted_positions, self.__sorted_values
+
+    def __merge_changed_positions(self, sorted_positions: np.ndarray, sorted_values: np.ndarray) -> None:
+        changed_positions = np.fromiter(self.__changed_positions, dtype=np.int64, count=len(self.__changed_positions))
+        self.__changed_positions = set()
+        is_changed = np.zeros(self._has_value.shape[0], dtype=np.bool_)
+        is_changed[changed_positions] = True
+        is_kept = ~is_changed[sorted_positions]
+        sorted_positions, sorted_values = sorted_positions[is_kept], sorted_values[is_kept]
+        new_positions, new_values = self.__sort_comparable(changed_positions)
+        insertion_indices = np.searchsorted(sorted_values, new_values, side="right")
+        self.__sorted_positions = np.insert(sorted_positions, insertion_indices, new_positions)
+        self.__sorted_values = np.insert(sorted_values, insertion_indices, new_values)
+
+    def __sort_comparable(self, positions: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        values = self.__values[positions]
+        # NaN never satisfies a comparison, so it is left out of the sorted values
+        is_comparable = self._has_value[positions] & ~np.isnan(values)
+        positions, values = positions[is_comparable], values[is_comparable]
+        order = np.argsort(values, kind="stable")
+        return positions[order], values[order]
+
+    @staticmethod
+    def __is_number(value: Any) -> bool:
+        # NaN compares to nothing, that is left to the row by row evaluation
+        return isinstance(value, int | float) and not isinstance(value, bool) and value == value
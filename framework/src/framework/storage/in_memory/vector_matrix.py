@@ -0,0 +1,214 @@
+# Copyright 2024 Superlinked, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+
+from superlinked.framework.common.data_types import Vector
+from superlinked.framework.common.storage.search_index.vector_component_precision import (
+    VectorComponentPrecision,
+)
+from superlinked.framework.storage.in_memory.vector_quantization import (
+    VectorQuantization,
+)
+
+INITIAL_CAPACITY = 1024
+DTYPE_BY_PRECISION: dict[VectorComponentPrecision, type[np.floating]] = {
+    VectorComponentPrecision.FLOAT32: np.float32,
+    VectorComponentPrecision.FLOAT64: np.float64,
+}
+STORAGE_DTYPE_BY_QUANTIZATION: dict[VectorQuantization, type[np.number]] = {
+    VectorQuantization.FLOAT16: np.float16,
+    VectorQuantization.INT8: np.int8,
+}
+INT8_MAX = 127
+
+
+class VectorMatrix:
+    """
+    Columnar storage of a single indexed vector field.
+    Slot `i` of `matrix` holds the vector of the row at `row_positions[i]`,
+    so a search is a single matrix-vector product.
+    Vectors that don't match the indexed dimension are not stored in the matrix,
+    only their dimensions are kept so that searches can report them.
+    A quantized matrix stores float16 or int8 components, the latter with a scale per vector,
+    and `dequantize` turns its rows back into float32 vectors for scoring.
+    `get_vector` reads the vectors back, so the row store doesn't need to keep them. With `keep_exact_vectors`
+    they are read from a float32 copy, also used for rescoring, otherwise they are dequantized.
+    """
+
+    def __init__(
+        self,
+        dimension: int,
+        precision: VectorComponentPrecision,
+        initial_capacity: int = INITIAL_CAPACITY,
+        quantization: VectorQuantization = VectorQuantization.NONE,
+        keep_exact_vectors: bool = False,
+    ) -> None:
+        self.__dimension = dimension
+        self.__quantization = quantization
+        self.__dtype = DTYPE_BY_PRECISION[precision] if quantization == VectorQuantization.NONE else np.float32
+        self.__storage_dtype = STORAGE_DTYPE_BY_QUANTIZATION.get(quantization, self.__dtype)
+        self.__matrix = np.zeros((initial_capacity, dimension), dtype=self.__storage_dtype)
+        self.__scales = np.ones(initial_capacity if quantization == VectorQuantization.INT8 else 0, dtype=np.float32)
+        self.__has_exact_vectors = self.is_quantized and keep_exact_vectors
+        self.__exact_matrix = np.zeros(
+            (initial_capacity if self.__has_exact_vectors else 0, dimension),
+            dtype=np.float32,
+        )
+        self.__negative_filter_indices_by_slot: dict[int, frozenset[int]] = {}
+        self.__is_set = np.zeros(initial_capacity, dtype=np.bool_)
+        self.__row_positions = np.zeros(initial_capacity, dtype=np.int64)
+        self.__slot_by_row_position: dict[int, int] = {}
+        self.__mismatching_dimension_by_row_position: dict[int, int] = {}
+
+    @property
+    def dimension(self) -> int:
+        return self.__dimension
+
+    @property
+    def dtype(self) -> type[np.floating]:
+        """
+        The dtype of the vectors returned by `dequantize`, searches score in this precision.
+        """
+        return self.__dtype
+
+    @property
+    def is_quantized(self) -> bool:
+        return self.__quantization != VectorQuantization.NONE
+
+    @property
+    def has_exact_vectors(self) -> bool:
+        return self.__has_exact_vectors
+
+    @property
+    def matrix(self) -> np.ndarray:
+        return self.__matrix[: len(self)]
+
+    @property
+    def scales(self) -> np.ndarray | None:
+        """
+        The per vector scales of an INT8 matrix, `dequantize(slots, scaled=False)` returns the vectors divided by these.
+        """
+        return self.__scales[: len(self)] if self.__quantization == VectorQuantization.INT8 else None
+
+    @property
+    def nbytes(self) -> int:
+        return self.__matrix.nbytes + self.__scales.nbytes + self.__exact_matrix.nbytes
+
+    @property
+    def is_set(self) -> np.ndarray:
+        return self.__is_set[: len(self)]
+
+    @property
+    def row_positions(self) -> np.ndarray:
+        return self.__row_positions[: len(self)]
+
+    @property
+    def mismatching_dimension_by_row_position(self) -> dict[int, int]:
+        return self.__mismatching_dimension_by_row_position
+
+    def __len__(self) -> int:
+        return len(self.__slot_by_row_position)
+
+    def set_vector(self, row_position: int, vector: Vector) -> int | None:
+        """
+        Returns the slot the vector was stored in, or None if it was not stored due to its dimension.
+        """
+        if vector.dimension != self.__dimension:
+            self.__unset(row_position)
+            self.__mismatching_dimension_by_row_position[row_position] = vector.dimension
+            return None
+        self.__mismatching_dimension_by_row_position.pop(row_position, None)
+        slot = self.__get_or_allocate_slot(row_position)
+        if self.__quantization == VectorQuantization.INT8:
+            abs_max = float(np.max(np.abs(vector.value), initial=0.0))
+            self.__scales[slot] = abs_max / INT8_MAX if abs_max > 0 else 1.0
+            self.__matrix[slot] = np.rint(vector.value / self.__scales[slot])
+        else:
+            self.__matrix[slot] = vector.value
+        if self.__has_exact_vectors:
+            self.__exact_matrix[slot] = vector.value
+        if self.is_quantized:
+            if vector.negative_filter_indices:
+                self.__negative_filter_indices_by_slot[slot] = vector.negative_filter_indices
+            else:
+                self.__negative_filter_indices_by_slot.pop(slot, None)
+        self.__is_set[slot] = True
+        return slot
+
+    def unset_vector(self, row_position: int) -> None:
+        self.__mismatching_dimension_by_row_position.pop(row_position, None)
+        self.__unset(row_position)
+
+    def get_vector(self, row_position: int) -> Vector | None:
+        """
+        The vector of the row read back from a quantized matrix, None if it is not stored.
+        """
+        slot = self.__slot_by_row_position.get(row_position)
+        if not self.is_quantized or slot is None or not self.__is_set[slot]:
+            return None
+        value = self.__exact_matrix[slot] if self.__has_exact_vectors else self.dequantize(slot)
+        return Vector(value.astype(np.float64), self.__negative_filter_indices_by_slot.get(slot))
+
+    def get_exact_vectors(self, slots: np.ndarray) -> np.ndarray:
+        """
+        The float32 copy of the vectors in `slots` of a quantized matrix kept with `keep_exact_vectors`.
+        """
+        return self.__exact_matrix[: len(self)][slots]
+
+    def dequantize(self, slots: int | slice | np.ndarray, scaled: bool = True) -> np.ndarray:
+        """
+        The vectors in `slots` in `dtype`. Without quantization these are the stored rows themselves.
+        """
+        match self.__quantization:
+            case VectorQuantization.NONE:
+                return self.matrix[slots]
+            case VectorQuantization.INT8 if scaled:
+                return self.matrix[slots].astype(np.float32) * self.__scales[: len(self)][slots, np.newaxis]
+            case _:
+                return self.matrix[slots].astype(np.float32)
+
+    def __unset(self, row_position: int) -> None:
+        if (slot := self.__slot_by_row_position.get(row_position)) is not None:
+            self.__is_set[slot] = False
+
+    def __get_or_allocate_slot(self, row_position: int) -> int:
+        if (slot := self.__slot_by_row_position.get(row_position)) is not None:
+            return slot
+        slot = len(self)
+        if slot == self.__matrix.shape[0]:
+            self.__grow()
+        self.__row_positions[slot] = row_position
+        self.__slot_by_row_position[row_position] = slot
+        return slot
+
+    def __grow(self) -> None:
+        capacity = max(2 * self.__matrix.shape[0], 1)
+        matrix = np.zeros((capacity, self.__dimension), dtype=self.__storage_dtype)
+        matrix[: self.__matrix.shape[0]] = self.__matrix
+        if self.__scales.size:
+            scales = np.ones(capacity, dtype=np.float32)
+            scales[: self.__scales.shape[0]] = self.__scales
+            self.__scales = scales
+        if self.__has_exact_vectors:
+            exact_matrix = np.zeros((capacity, self.__dimension), dtype=np.float32)
+            exact_matrix[: self.__exact_matrix.shape[0]] = self.__exact_matrix
+            self.__exact_matrix = exact_matrix
+        is_set = np.zeros(capacity, dtype=np.bool_)
+        is_set[: self.__is_set.shape[0]] = self.__is_set
+        row_positions = np.zeros(capacity, dtype=np.int64)
+        row_positions[: self.__row_positions.shape[0]] = self.__row_positions
+        self.__matrix = matrix
+        self.__is_set = is_set
+        self.__row_positions = row_positions
@@ -0,0 +1,27 @@
+# Copyright 2024 Superlinked, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from enum import Enum
+
+
+class VectorQuantization(Enum):
+    """
+    The format the in-memory search matrix holds the indexed vectors in.
+    NONE keeps the precision of the vector database, FLOAT16 halves the components,
+    INT8 scales the components of each vector into the int8 range.
+    """
+
+    NONE = "NONE"
+    FLOAT16 = "FLOAT16"
+    INT8 = "INT8"
@@ -12,7 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from beartype.typing import Any, Sequence
+from __future__ import annotations
+
+from beartype.typing import TYPE_CHECKING, Any, Iterable, Sequence
 from pymongo import MongoClient, UpdateOne
 from typing_extensions import override
 
@@ -43,6 +45,10 @@ from superlinked.framework.storage.mongo.search_index.mongo_search_index_manager
     MongoSearchIndexManager,
 )
 
+if TYPE_CHECKING:
+    from pymongo import AsyncMongoClient
+    from pymongo.asynchronous.collection import AsyncCollection
+
 GENERAL_COLLECTION_NAME = "general_collection"
 
 
@@ -53,12 +59,16 @@ class MongoVDBConnector(VDBConnector):
         super().__init__()
         self._client = MongoClient(connection_params.connection_string)
         self._db = self._client[connection_params.db_name]
+        self._async_client: AsyncMongoClient | None = None
+        self._connection_params = connection_params
         self._collection_name = GENERAL_COLLECTION_NAME
         self._encoder = MongoFieldEncoder()
         self._search_index_manager = MongoSearchIndexManager(
             self._db.name, self._collection_name, connection_params.admin_params
         )
-        self._search = MongoSearch(self._db[self._collection_name], self._encoder)
+        self._search = MongoSearch(
+            self._db[self._collection_name], self._get_async_collection, self._encoder
+        )
         self.__vdb_settings = vdb_settings
 
     @override
@@ -67,6 +77,27 @@ class MongoVDBConnector(VDBConnector):
         # type-checkers mistake 'close' for a database.
         self._client.close()  # type: ignore
 
+    @override
+    async def aclose_connection(self) -> None:
+        if self._async_client is not None:
+            await self._async_client.close()
+            self._async_client = None
+
+    def _get_async_collection(self) -> AsyncCollection:
+        if self._async_client is None:
+            # the async client needs a recent pymongo,
+            # so it is only imported once the async API is used
+            from pymongo import (  # pylint: disable=import-outside-toplevel
+                AsyncMongoClient,
+            )
+
+            self._async_client = AsyncMongoClient(
+                self._connection_params.connection_string
+            )
+        return self._async_client[self._connection_params.db_name][
+            self._collection_name
+        ]
+
     @override
     @property
     def search_index_manager(self) -> SearchIndexManager:
@@ -81,6 +112,15 @@ class MongoVDBConnector(VDBConnector):
     def write_entities(self, entity_data: Sequence[EntityData]) -> None:
         if not entity_data:
             return
+        self._db[self._collection_name].bulk_write(self._create_upserts(entity_data))
+
+    @override
+    async def awrite_entities(self, entity_data: Sequence[EntityData]) -> None:
+        if not entity_data:
+            return
+        await self._get_async_collection().bulk_write(self._create_upserts(entity_data))
+
+    def _create_upserts(self, entity_data: Sequence[EntityData]) -> list[UpdateOne]:
         docs = [
             {
                 "_id": MongoVDBConnector._get_mongo_id(ed.id_),
@@ -91,9 +131,9 @@ class MongoVDBConnector(VDBConnector):
             }
             for ed in entity_data
         ]
-        self._db[self._collection_name].bulk_write(
-            [UpdateOne({"_id": doc["_id"]}, {"$set": doc}, upsert=True) for doc in docs]
-        )
+        return [
+            UpdateOne({"_id": doc["_id"]}, {"$set": doc}, upsert=True) for doc in docs
+        ]
 
     def _read_field_data(self, entity: Entity) -> dict[str, FieldData]:
         doc = (
@@ -102,6 +142,9 @@ class MongoVDBConnector(VDBConnector):
             )
             or {}
         )
+        return self._decode_doc(entity, doc)
+
+    def _decode_doc(self, entity: Entity, doc: dict[str, Any]) -> dict[str, FieldData]:
         return {
             field.name: self._encoder.decode_field(field, doc[field.name])
             for field in entity.fields.values()
@@ -117,6 +160,20 @@ class MongoVDBConnector(VDBConnector):
             for entity in entities
         ]
 
+    @override
+    async def aread_entities(self, entities: Sequence[Entity]) -> Sequence[EntityData]:
+        if not entities:
+            return []
+        mongo_ids = [MongoVDBConnector._get_mongo_id(entity.id_) for entity in entities]
+        cursor = self._get_async_collection().find({"_id": {"$in": mongo_ids}})
+        doc_by_id = {doc["_id"]: doc async for doc in cursor}
+        return [
+            EntityData(
+                entity.id_, self._decode_doc(entity, doc_by_id.get(mongo_id, {}))
+            )
+            for entity, mongo_id in zip(entities, mongo_ids)
+        ]
+
     @override
     def _knn_search(
         self,
@@ -136,6 +193,32 @@ class MongoVDBConnector(VDBConnector):
                 params.get("numCandidates"),
             ),
         )
+        return self._get_result_entity_data_from_documents(results, returned_fields)
+
+    @override
+    async def _aknn_search(
+        self,
+        index_name: str,
+        schema_name: str,
+        returned_fields: Sequence[Field],
+        vdb_knn_search_params: VDBKNNSearchParams,
+        **params: Any,
+    ) -> Sequence[ResultEntityData]:
+        index_config = self._get_index_config(index_name)
+        results = await self._search.aknn_search_with_checks(
+            index_config,
+            returned_fields,
+            MongoVDBKNNSearchParams.from_base(
+                vdb_knn_search_params,
+                index_name,
+                params.get("numCandidates"),
+            ),
+        )
+        return self._get_result_entity_data_from_documents(results, returned_fields)
+
+    def _get_result_entity_data_from_documents(
+        self, documents: Iterable[dict[str, Any]], returned_fields: Sequence[Field]
+    ) -> list[ResultEntityData]:
         return [
             ResultEntityData(
                 MongoVDBConnector._get_entity_id_from_mongo_id(
@@ -144,7 +227,7 @@ class MongoVDBConnector(VDBConnector):
                 self._extract_fields_from_document(document, returned_fields),
                 self._encoder._decode_double(document[VECTOR_SCORE_ALIAS]),
             )
-            for document in results
+            for document in documents
         ]
 
     def _extract_fields_from_document(
@@ -12,9 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from beartype.typing import Sequence
+from __future__ import annotations
+
+from beartype.typing import TYPE_CHECKING, Any, Callable, Iterable, Sequence
 from pymongo.collection import Collection
-from pymongo.command_cursor import CommandCursor
 from typing_extensions import override
 
 from superlinked.framework.common.storage.field.field import Field
@@ -26,13 +27,24 @@ from superlinked.framework.storage.mongo.query.mongo_vdb_knn_search_params impor
     MongoVDBKNNSearchParams,
 )
 
+if TYPE_CHECKING:
+    from pymongo.asynchronous.collection import AsyncCollection
+
 MAX_NUMBER_OF_CANDIDATES = 10000
 
 
-class MongoSearch(Search[MongoVDBKNNSearchParams, MongoQuery, CommandCursor]):
-    def __init__(self, collection: Collection, encoder: MongoFieldEncoder) -> None:
+class MongoSearch(
+    Search[MongoVDBKNNSearchParams, MongoQuery, Iterable[dict[str, Any]]]
+):
+    def __init__(
+        self,
+        collection: Collection,
+        get_async_collection: Callable[[], AsyncCollection],
+        encoder: MongoFieldEncoder,
+    ) -> None:
         super().__init__()
         self._collection = collection
+        self._get_async_collection = get_async_collection
         self._encoder = encoder
 
     @override
@@ -56,5 +68,14 @@ class MongoSearch(Search[MongoVDBKNNSearchParams, MongoQuery, CommandCursor]):
         self,
         index_config: IndexConfig,
         query: MongoQuery,
-    ) -> CommandCursor:
+    ) -> Iterable[dict[str, Any]]:
         return self._collection.aggregate(query.query)
+
+    @override
+    async def aknn_search(
+        self,
+        index_config: IndexConfig,
+        query: MongoQuery,
+    ) -> Iterable[dict[str, Any]]:
+        cursor = await self._get_async_collection().aggregate(query.query)
+        return await cursor.to_list()
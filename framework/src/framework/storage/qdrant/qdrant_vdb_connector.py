@@ -12,11 +12,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from threading import Lock
+
 from beartype.typing import Any, Sequence, cast
-from qdrant_client import QdrantClient
+from cachetools import LRUCache
+from qdrant_client import AsyncQdrantClient, QdrantClient
 from qdrant_client.conversions.common_types import Payload, Record
 from qdrant_client.http.models.models import QueryResponse, ScoredPoint
 from qdrant_client.models import (
+    ExtendedPointId,
     PointsList,
     PointStruct,
     PointVectors,
@@ -29,6 +33,7 @@ from qdrant_client.models import (
 )
 from typing_extensions import override
 
+from superlinked.framework.common.settings import Settings
 from superlinked.framework.common.storage.entity.entity import Entity
 from superlinked.framework.common.storage.entity.entity_data import EntityData
 from superlinked.framework.common.storage.entity.entity_id import EntityId
@@ -64,25 +69,46 @@ from superlinked.framework.storage.qdrant.query.qdrant_vdb_knn_search_params imp
 
 ID_PAYLOAD_FIELD_NAME = "__original_entity_id__"
 ID_PAYLOAD_FIELD = Field(FieldDataType.STRING, ID_PAYLOAD_FIELD_NAME)
+MEMORY_LOCATION = ":memory:"
 
 
 class QdrantVDBConnector(VDBConnector):
     def __init__(self, connection_params: QdrantConnectionParams, vdb_settings: VDBSettings) -> None:
         super().__init__()
         self._client = QdrantClient(
-            url=connection_params.connection_string,
+            location=connection_params.connection_string,
             api_key=connection_params._api_key,
         )
+        # an async client for ':memory:' would be a second, separate in-process store,
+        # so the async methods run the sync client in a worker thread instead
+        self._async_client = (
+            None
+            if connection_params.connection_string == MEMORY_LOCATION
+            else AsyncQdrantClient(
+                location=connection_params.connection_string,
+                api_key=connection_params._api_key,
+            )
+        )
         self._encoder = QdrantFieldEncoder()
         self.__search_index_manager = QdrantSearchIndexManager(self._client)
-        self._search = QdrantSearch(self._client, self._encoder)
+        self._search = QdrantSearch(self._client, self._async_client, self._encoder)
         self._vector_field_names = list[str]()
         self.__vdb_settings = vdb_settings
+        self._existing_point_id_cache_max_entries = Settings().QDRANT_EXISTING_POINT_ID_CACHE_MAX_ENTRIES
+        self._existing_point_ids: LRUCache = LRUCache(max(self._existing_point_id_cache_max_entries, 1))
+        # ids that a read found missing, their first write is inserted without an existence check
+        self._absent_point_ids: LRUCache = LRUCache(max(self._existing_point_id_cache_max_entries, 1))
+        self._existing_point_ids_lock = Lock()
 
     @override
     def close_connection(self) -> None:
         self._client.close()
 
+    @override
+    async def aclose_connection(self) -> None:
+        if self._async_client is not None:
+            await self._async_client.close()
+
     @override
     @property
     def search_index_manager(self) -> SearchIndexManager:
@@ -101,25 +127,103 @@ class QdrantVDBConnector(VDBConnector):
         override_existing: bool = False,
     ) -> None:
         super().init_search_index_configs(index_configs, create_search_indices, override_existing)
+        if override_existing:
+            with self._existing_point_ids_lock:
+                self._existing_point_ids.clear()
+                self._absent_point_ids.clear()
         self._vector_field_names.extend(
             [index_config.vector_field_descriptor.field_name for index_config in index_configs]
         )
 
     @override
     def write_entities(self, entity_data: Sequence[EntityData]) -> None:
+        points = self._create_points(entity_data)
+        unknown_point_ids = self._get_unknown_point_ids(points)
+        existing_point_records = (
+            self._client.retrieve(self.collection_name, unknown_point_ids, with_payload=False)
+            if unknown_point_ids
+            else []
+        )
+        self._client.batch_update_points(
+            self.collection_name,
+            update_operations=self._create_update_operations(points, existing_point_records),
+        )
+        self._remember_existing_point_ids([point.id for point in points])
+
+    @override
+    async def awrite_entities(self, entity_data: Sequence[EntityData]) -> None:
+        if self._async_client is None:
+            await super().awrite_entities(entity_data)
+            return
+        points = self._create_points(entity_data)
+        unknown_point_ids = self._get_unknown_point_ids(points)
+        existing_point_records = (
+            await self._async_client.retrieve(self.collection_name, unknown_point_ids, with_payload=False)
+            if unknown_point_ids
+            else []
+        )
+        await self._async_client.batch_update_points(
+            self.collection_name,
+            update_operations=self._create_update_operations(points, existing_point_records),
+        )
+        self._remember_existing_point_ids([point.id for point in points])
+
+    def _create_points(self, entity_data: Sequence[EntityData]) -> list[PointStruct]:
         if not self.search_index_manager._index_configs:
             raise IndexConfigNotFoundException(
                 f"{type(self).__name__} can work properly only after initializing " + "the search indices."
             )
-        points = [
+        return [
             PointStruct(
                 id=QdrantVDBConnector._get_qdrant_id(ed.id_),
                 vector=self._get_point_vector_dict(ed),
                 payload=self._get_point_payload_dict(ed),
             )
-            for ed in entity_data
+            for ed in self._merge_entity_data(entity_data)
         ]
-        non_existing_points, existing_points = self._split_points_by_existing(points)
+
+    @staticmethod
+    def _merge_entity_data(entity_data: Sequence[EntityData]) -> list[EntityData]:
+        """
+        Merges the writes of the same entity into one, so each point is updated once. Later writes win.
+        """
+        field_data_by_id: dict[EntityId, dict[str, FieldData]] = {}
+        for ed in entity_data:
+            field_data_by_id.setdefault(ed.id_, {}).update(ed.field_data)
+        return [EntityData(id_, field_data) for id_, field_data in field_data_by_id.items()]
+
+    def _get_unknown_point_ids(self, points: Sequence[PointStruct]) -> list[ExtendedPointId]:
+        """
+        Ids of the points that are neither known to exist nor known to be missing, these need an existence check.
+        """
+        with self._existing_point_ids_lock:
+            return [
+                point.id
+                for point in points
+                if point.id not in self._existing_point_ids and point.id not in self._absent_point_ids
+            ]
+
+    def _remember_existing_point_ids(self, point_ids: Sequence[ExtendedPointId]) -> None:
+        if self._existing_point_id_cache_max_entries <= 0:
+            return
+        with self._existing_point_ids_lock:
+            for point_id in point_ids:
+                self._existing_point_ids[point_id] = True
+                self._absent_point_ids.pop(point_id, None)
+
+    def _remember_read_point_ids(self, read_point_ids: Sequence[ExtendedPointId], points: Sequence[Record]) -> None:
+        existing_point_ids = [point.id for point in points]
+        self._remember_existing_point_ids(existing_point_ids)
+        if self._existing_point_id_cache_max_entries <= 0:
+            return
+        with self._existing_point_ids_lock:
+            for point_id in set(read_point_ids).difference(existing_point_ids):
+                self._absent_point_ids[point_id] = True
+
+    def _create_update_operations(
+        self, points: Sequence[PointStruct], existing_point_records: Sequence[Record]
+    ) -> list[UpdateOperation]:
+        non_existing_points, existing_points = self._split_points_by_existing(points, existing_point_records)
         update_operations = list[UpdateOperation]()
         if non_existing_points:
             update_operations.append(UpsertOperation(upsert=PointsList(points=non_existing_points)))
@@ -135,7 +239,7 @@ class QdrantVDBConnector(VDBConnector):
         ]
         if set_payload_operations:
             update_operations.extend(set_payload_operations)
-        self._client.batch_update_points(self.collection_name, update_operations=update_operations)
+        return update_operations
 
     def _get_point_vector_dict(self, entity_data: EntityData) -> dict[str, QdrantEncodedTypes]:
         return {
@@ -158,18 +262,34 @@ class QdrantVDBConnector(VDBConnector):
         }
 
     def _split_points_by_existing(
-        self, points: Sequence[PointStruct]
+        self, points: Sequence[PointStruct], existing_point_records: Sequence[Record]
     ) -> tuple[Sequence[PointStruct], Sequence[PointStruct]]:
-        existing_point_records = self._client.retrieve(
-            self.collection_name, [point.id for point in points], with_payload=False
-        )
-        existing_point_ids = [point.id for point in existing_point_records]
+        existing_point_ids = {point.id for point in existing_point_records}
+        with self._existing_point_ids_lock:
+            existing_point_ids.update(point.id for point in points if point.id in self._existing_point_ids)
         non_existing_points = [point for point in points if point.id not in existing_point_ids]
         existing_points = [point for point in points if point.id in existing_point_ids]
         return non_existing_points, existing_points
 
     @override
     def read_entities(self, entities: Sequence[Entity]) -> Sequence[EntityData]:
+        retrieve_params = self._create_retrieve_params(entities)
+        points = self._client.retrieve(self.collection_name, **retrieve_params)
+        self._remember_read_point_ids(retrieve_params["ids"], points)
+        entity_by_id = {entity.id_: entity for entity in entities}
+        return [self._get_entity_data_from_point(point, entity_by_id) for point in points]
+
+    @override
+    async def aread_entities(self, entities: Sequence[Entity]) -> Sequence[EntityData]:
+        if self._async_client is None:
+            return await super().aread_entities(entities)
+        retrieve_params = self._create_retrieve_params(entities)
+        points = await self._async_client.retrieve(self.collection_name, **retrieve_params)
+        self._remember_read_point_ids(retrieve_params["ids"], points)
+        entity_by_id = {entity.id_: entity for entity in entities}
+        return [self._get_entity_data_from_point(point, entity_by_id) for point in points]
+
+    def _create_retrieve_params(self, entities: Sequence[Entity]) -> dict[str, Any]:
         returned_field_names = {field.name for entity in entities for field in entity.fields.values()} | {
             ID_PAYLOAD_FIELD_NAME
         }
@@ -177,14 +297,11 @@ class QdrantVDBConnector(VDBConnector):
             {field_name for field_name in returned_field_names if field_name in self._vector_field_names}
         )
         payload_fields = list({field_name for field_name in returned_field_names if field_name not in vector_fields})
-        points = self._client.retrieve(
-            self.collection_name,
-            ids=[QdrantVDBConnector._get_qdrant_id(entity.id_) for entity in entities],
-            with_vectors=vector_fields or False,
-            with_payload=payload_fields or False,
-        )
-        entity_by_id = {entity.id_: entity for entity in entities}
-        return [self._get_entity_data_from_point(point, entity_by_id) for point in points]
+        return {
+            "ids": [QdrantVDBConnector._get_qdrant_id(entity.id_) for entity in entities],
+            "with_vectors": vector_fields or False,
+            "with_payload": payload_fields or False,
+        }
 
     def _get_entity_data_from_point(self, point: Record, entity_by_id: dict[EntityId, Entity]) -> EntityData:
         payload_fields = self._check_and_get_payload(point)
@@ -218,6 +335,72 @@ class QdrantVDBConnector(VDBConnector):
         )
         return [self._get_result_entity_data_from_point(point, returned_fields) for point in result.points]
 
+    @override
+    def _knn_search_batch(
+        self,
+        index_name: str,
+        schema_name: str,
+        returned_fields: Sequence[Field],
+        vdb_knn_search_params_list: Sequence[VDBKNNSearchParams],
+        **params: Any,
+    ) -> list[Sequence[ResultEntityData]]:
+        index_config = self._get_index_config(index_name)
+        extended_returned_fields = list(returned_fields) + [ID_PAYLOAD_FIELD]
+        results: Sequence[QueryResponse] = self._search.knn_search_batch_with_checks(
+            index_config,
+            extended_returned_fields,
+            [
+                QdrantVDBKNNSearchParams.from_base(vdb_knn_search_params, self.collection_name)
+                for vdb_knn_search_params in vdb_knn_search_params_list
+            ],
+        )
+        return [
+            [self._get_result_entity_data_from_point(point, returned_fields) for point in result.points]
+            for result in results
+        ]
+
+    @override
+    async def _aknn_search(
+        self,
+        index_name: str,
+        schema_name: str,
+        returned_fields: Sequence[Field],
+        vdb_knn_search_params: VDBKNNSearchParams,
+        **params: Any,
+    ) -> Sequence[ResultEntityData]:
+        index_config = self._get_index_config(index_name)
+        extended_returned_fields = list(returned_fields) + [ID_PAYLOAD_FIELD]
+        result: QueryResponse = await self._search.aknn_search_with_checks(
+            index_config,
+            extended_returned_fields,
+            QdrantVDBKNNSearchParams.from_base(vdb_knn_search_params, self.collection_name),
+        )
+        return [self._get_result_entity_data_from_point(point, returned_fields) for point in result.points]
+
+    @override
+    async def _aknn_search_batch(
+        self,
+        index_name: str,
+        schema_name: str,
+        returned_fields: Sequence[Field],
+        vdb_knn_search_params_list: Sequence[VDBKNNSearchParams],
+        **params: Any,
+    ) -> list[Sequence[ResultEntityData]]:
+        index_config = self._get_index_config(index_name)
+        extended_returned_fields = list(returned_fields) + [ID_PAYLOAD_FIELD]
+        results: Sequence[QueryResponse] = await self._search.aknn_search_batch_with_checks(
+            index_config,
+            extended_returned_fields,
+            [
+                QdrantVDBKNNSearchParams.from_base(vdb_knn_search_params, self.collection_name)
+                for vdb_knn_search_params in vdb_knn_search_params_list
+            ],
+        )
+        return [
+            [self._get_result_entity_data_from_point(point, returned_fields) for point in result.points]
+            for result in results
+        ]
+
     def _get_result_entity_data_from_point(
         self, point: ScoredPoint, returned_fields: Sequence[Field]
     ) -> ResultEntityData:
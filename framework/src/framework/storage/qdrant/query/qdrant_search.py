@@ -12,11 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 
-from beartype.typing import Sequence
-from qdrant_client import QdrantClient
+from beartype.typing import Any, Sequence
+from qdrant_client import AsyncQdrantClient, QdrantClient
 from qdrant_client.conversions.common_types import QueryResponse
-from qdrant_client.models import SearchParams
+from qdrant_client.models import QueryRequest, SearchParams
 from typing_extensions import override
 
 from superlinked.framework.common.storage.field.field import Field
@@ -36,9 +37,10 @@ from superlinked.framework.storage.qdrant.query.qdrant_vdb_knn_search_params imp
 
 
 class QdrantSearch(Search[QdrantVDBKNNSearchParams, QdrantQuery, QueryResponse]):
-    def __init__(self, client: QdrantClient, encoder: QdrantFieldEncoder) -> None:
+    def __init__(self, client: QdrantClient, async_client: AsyncQdrantClient | None, encoder: QdrantFieldEncoder) -> None:
         super().__init__()
         self._client = client
+        self._async_client = async_client
         self._query_builder = QdrantQueryBuilder(encoder)
 
     @override
@@ -51,15 +53,75 @@ class QdrantSearch(Search[QdrantVDBKNNSearchParams, QdrantQuery, QueryResponse])
         index_config: IndexConfig,
         query: QdrantQuery,
     ) -> QueryResponse:
-        is_exact_search = index_config.vector_field_descriptor.search_algorithm == SearchAlgorithm.FLAT
-        return self._client.query_points(
-            collection_name=query.collection_name,
-            query=query.vector.value,
-            using=index_config.vector_field_descriptor.field_name,
-            query_filter=query.filter_,
-            limit=query.limit,
-            score_threshold=query.score_treshold,
-            search_params=SearchParams(exact=is_exact_search),
-            with_vectors=query.with_vector,
-            with_payload=query.returned_payload_fields,
+        return self._client.query_points(**self._create_query_points_params(index_config, query))
+
+    @override
+    def knn_search_batch(
+        self,
+        index_config: IndexConfig,
+        queries: Sequence[QdrantQuery],
+    ) -> Sequence[QueryResponse]:
+        if not queries:
+            return []
+        return self._client.query_batch_points(
+            collection_name=queries[0].collection_name,
+            requests=self._create_query_requests(index_config, queries),
+        )
+
+    @override
+    async def aknn_search(
+        self,
+        index_config: IndexConfig,
+        query: QdrantQuery,
+    ) -> QueryResponse:
+        if self._async_client is None:
+            return await super().aknn_search(index_config, query)
+        return await self._async_client.query_points(**self._create_query_points_params(index_config, query))
+
+    @override
+    async def aknn_search_batch(
+        self,
+        index_config: IndexConfig,
+        queries: Sequence[QdrantQuery],
+    ) -> Sequence[QueryResponse]:
+        if not queries:
+            return []
+        if self._async_client is None:
+            return await asyncio.to_thread(self.knn_search_batch, index_config, queries)
+        return await self._async_client.query_batch_points(
+            collection_name=queries[0].collection_name,
+            requests=self._create_query_requests(index_config, queries),
         )
+
+    def _create_query_points_params(self, index_config: IndexConfig, query: QdrantQuery) -> dict[str, Any]:
+        return {
+            "collection_name": query.collection_name,
+            "query": query.vector.value,
+            "using": index_config.vector_field_descriptor.field_name,
+            "query_filter": query.filter_,
+            "limit": query.limit,
+            "score_threshold": query.score_treshold,
+            "search_params": self._create_search_params(index_config),
+            "with_vectors": query.with_vector,
+            "with_payload": query.returned_payload_fields,
+        }
+
+    def _create_query_requests(self, index_config: IndexConfig, queries: Sequence[QdrantQuery]) -> list[QueryRequest]:
+        search_params = self._create_search_params(index_config)
+        return [
+            QueryRequest(
+                query=query.vector.value,
+                using=index_config.vector_field_descriptor.field_name,
+                filter=query.filter_,
+                limit=query.limit,
+                score_threshold=query.score_treshold,
+                params=search_params,
+                with_vector=query.with_vector,
+                with_payload=query.returned_payload_fields,
+            )
+            for query in queries
+        ]
+
+    def _create_search_params(self, index_config: IndexConfig) -> SearchParams:
+        is_exact_search = index_config.vector_field_descriptor.search_algorithm == SearchAlgorithm.FLAT
+        return SearchParams(exact=is_exact_search)
@@ -13,8 +13,11 @@
 # limitations under the License.
 
 
+import asyncio
+
 from beartype.typing import Any, Sequence
 from redis import Redis
+from redis.asyncio import Redis as AsyncRedis
 from typing_extensions import override
 
 from superlinked.framework.common.storage.field.field import Field
@@ -31,9 +34,10 @@ from superlinked.framework.storage.redis.redis_field_encoder import RedisFieldEn
 
 
 class RedisSearch(Search[VDBKNNSearchParams, RedisQuery, dict[bytes, Any]]):
-    def __init__(self, client: Redis, encoder: RedisFieldEncoder) -> None:
+    def __init__(self, client: Redis, async_client: AsyncRedis, encoder: RedisFieldEncoder) -> None:
         super().__init__()
         self._client = client
+        self._async_client = async_client
         self._query_builder = RedisQueryBuilder(encoder)
 
     @override
@@ -47,3 +51,30 @@ class RedisSearch(Search[VDBKNNSearchParams, RedisQuery, dict[bytes, Any]]):
         query: RedisQuery,
     ) -> dict[bytes, Any]:
         return self._client.ft(index_config.index_name).search(query.query, query_params=query.query_params)
+
+    @override
+    def knn_search_batch(
+        self,
+        index_config: IndexConfig,
+        queries: Sequence[RedisQuery],
+    ) -> Sequence[dict[bytes, Any]]:
+        pipeline = self._client.pipeline(transaction=False)
+        for query in queries:
+            pipeline.ft(index_config.index_name).search(query.query, query_params=query.query_params)
+        return pipeline.execute()
+
+    @override
+    async def aknn_search(
+        self,
+        index_config: IndexConfig,
+        query: RedisQuery,
+    ) -> dict[bytes, Any]:
+        return await self._async_client.ft(index_config.index_name).search(query.query, query_params=query.query_params)
+
+    @override
+    async def aknn_search_batch(
+        self,
+        index_config: IndexConfig,
+        queries: Sequence[RedisQuery],
+    ) -> Sequence[dict[bytes, Any]]:
+        return await asyncio.gather(*(self.aknn_search(index_config, query) for query in queries))
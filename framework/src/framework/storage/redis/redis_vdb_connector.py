@@ -13,8 +13,9 @@
 # limitations under the License.
 
 import redis
+import redis.asyncio
 from beartype.typing import Any, Sequence
-from typing_extensions import override
+from typing_extensions import TypeAlias, override
 
 from superlinked.framework.common.storage.entity.entity import Entity
 from superlinked.framework.common.storage.entity.entity_data import EntityData
@@ -42,20 +43,29 @@ from superlinked.framework.storage.redis.redis_search_index_manager import (
     RedisSearchIndexManager,
 )
 
+RedisPipeline: TypeAlias = redis.client.Pipeline | redis.asyncio.client.Pipeline
+
 
 class RedisVDBConnector(VDBConnector):
     def __init__(self, connection_params: RedisConnectionParams, vdb_settings: VDBSettings) -> None:
         super().__init__()
         self._client: redis.Redis = redis.from_url(connection_params.connection_string, protocol=3)
+        self._async_client: redis.asyncio.Redis = redis.asyncio.from_url(
+            connection_params.connection_string, protocol=3
+        )
         self._encoder = RedisFieldEncoder()
         self.__search_index_manager = RedisSearchIndexManager(self._client, self._encoder)
-        self._search = RedisSearch(self._client, self._encoder)
+        self._search = RedisSearch(self._client, self._async_client, self._encoder)
         self.__vdb_settings = vdb_settings
 
     @override
     def close_connection(self) -> None:
         self._client.close()
 
+    @override
+    async def aclose_connection(self) -> None:
+        await self._async_client.aclose()
+
     @override
     @property
     def search_index_manager(self) -> SearchIndexManager:
@@ -70,16 +80,26 @@ class RedisVDBConnector(VDBConnector):
     def write_entities(self, entity_data: Sequence[EntityData]) -> None:
         if entity_data:
             _pipeline = self._client.pipeline(transaction=False)
-            for ed in entity_data:
-                if ed.field_data:
-                    _pipeline.hset(
-                        RedisVDBConnector._get_redis_id(ed.id_),
-                        mapping={
-                            field_name: self._encoder.encode_field(field) for field_name, field in ed.field_data.items()
-                        },
-                    )
+            self._queue_writes(_pipeline, entity_data)
             _pipeline.execute()
 
+    @override
+    async def awrite_entities(self, entity_data: Sequence[EntityData]) -> None:
+        if entity_data:
+            async with self._async_client.pipeline(transaction=False) as pipeline:
+                self._queue_writes(pipeline, entity_data)
+                await pipeline.execute()
+
+    def _queue_writes(self, pipeline: RedisPipeline, entity_data: Sequence[EntityData]) -> None:
+        for ed in entity_data:
+            if ed.field_data:
+                pipeline.hset(
+                    RedisVDBConnector._get_redis_id(ed.id_),
+                    mapping={
+                        field_name: self._encoder.encode_field(field) for field_name, field in ed.field_data.items()
+                    },
+                )
+
     @override
     def read_entities(self, entities: Sequence[Entity]) -> Sequence[EntityData]:
         valid_entities = [entity for entity in entities if entity.fields]
@@ -87,15 +107,31 @@ class RedisVDBConnector(VDBConnector):
             return []
 
         pipeline = self._client.pipeline(transaction=False)
+        self._queue_reads(pipeline, valid_entities)
+        all_encoded_values = pipeline.execute()
+
+        return self._decode_entity_data(valid_entities, all_encoded_values)
 
-        for entity in valid_entities:
+    @override
+    async def aread_entities(self, entities: Sequence[Entity]) -> Sequence[EntityData]:
+        valid_entities = [entity for entity in entities if entity.fields]
+        if not valid_entities:
+            return []
+
+        async with self._async_client.pipeline(transaction=False) as pipeline:
+            self._queue_reads(pipeline, valid_entities)
+            all_encoded_values = await pipeline.execute()
+
+        return self._decode_entity_data(valid_entities, all_encoded_values)
+
+    def _queue_reads(self, pipeline: RedisPipeline, entities: Sequence[Entity]) -> None:
+        for entity in entities:
             pipeline.hmget(
                 RedisVDBConnector._get_redis_id(entity.id_),
                 [field.name for field in entity.fields.values()],
             )
 
-        all_encoded_values = pipeline.execute()
-
+    def _decode_entity_data(self, entities: Sequence[Entity], all_encoded_values: Sequence[Any]) -> list[EntityData]:
         return [
             EntityData(
                 entity.id_,
@@ -105,7 +141,7 @@ class RedisVDBConnector(VDBConnector):
                     if encoded_values[i] is not None
                 },
             )
-            for entity, encoded_values in zip(valid_entities, all_encoded_values)
+            for entity, encoded_values in zip(entities, all_encoded_values)
         ]
 
     @override
@@ -118,9 +154,54 @@ class RedisVDBConnector(VDBConnector):
         **params: Any,
     ) -> Sequence[ResultEntityData]:
         index_config = self._get_index_config(index_name)
-        result = self._encoder.convert_bytes_keys_dict(
-            self._search.knn_search_with_checks(index_config, returned_fields, vdb_knn_search_params)
+        result = self._search.knn_search_with_checks(index_config, returned_fields, vdb_knn_search_params)
+        return self._get_result_entity_data_from_search_result(result, returned_fields)
+
+    @override
+    def _knn_search_batch(
+        self,
+        index_name: str,
+        schema_name: str,
+        returned_fields: Sequence[Field],
+        vdb_knn_search_params_list: Sequence[VDBKNNSearchParams],
+        **params: Any,
+    ) -> list[Sequence[ResultEntityData]]:
+        index_config = self._get_index_config(index_name)
+        results = self._search.knn_search_batch_with_checks(index_config, returned_fields, vdb_knn_search_params_list)
+        return [self._get_result_entity_data_from_search_result(result, returned_fields) for result in results]
+
+    @override
+    async def _aknn_search(
+        self,
+        index_name: str,
+        schema_name: str,
+        returned_fields: Sequence[Field],
+        vdb_knn_search_params: VDBKNNSearchParams,
+        **params: Any,
+    ) -> Sequence[ResultEntityData]:
+        index_config = self._get_index_config(index_name)
+        result = await self._search.aknn_search_with_checks(index_config, returned_fields, vdb_knn_search_params)
+        return self._get_result_entity_data_from_search_result(result, returned_fields)
+
+    @override
+    async def _aknn_search_batch(
+        self,
+        index_name: str,
+        schema_name: str,
+        returned_fields: Sequence[Field],
+        vdb_knn_search_params_list: Sequence[VDBKNNSearchParams],
+        **params: Any,
+    ) -> list[Sequence[ResultEntityData]]:
+        index_config = self._get_index_config(index_name)
+        results = await self._search.aknn_search_batch_with_checks(
+            index_config, returned_fields, vdb_knn_search_params_list
         )
+        return [self._get_result_entity_data_from_search_result(result, returned_fields) for result in results]
+
+    def _get_result_entity_data_from_search_result(
+        self, search_result: dict[bytes, Any], returned_fields: Sequence[Field]
+    ) -> list[ResultEntityData]:
+        result = self._encoder.convert_bytes_keys_dict(search_result)
         return [
             ResultEntityData(
                 RedisVDBConnector._get_entity_id_from_redis_id(self._encoder._decode_string(document["id"])),
@@ -0,0 +1,151 @@
+# Copyright 2024 Superlinked, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from contextvars import copy_context
+from threading import Thread
+
+import pytest
+from beartype.typing import Sequence
+from typing_extensions import override
+
+from superlinked.framework.common.schema.id_schema_object import IdField
+from superlinked.framework.common.schema.schema import schema
+from superlinked.framework.common.schema.schema_object import Float, SchemaObject
+from superlinked.framework.common.storage.entity.entity_data import EntityData
+from superlinked.framework.common.storage_manager.storage_manager import StorageManager
+from superlinked.framework.storage.common.vdb_settings import VDBSettings
+from superlinked.framework.storage.in_memory.in_memory_vdb import InMemoryVDB
+
+
+@schema
+class Product:
+    id: IdField
+    price: Float
+
+
+class RecordingInMemoryVDB(InMemoryVDB):
+    def __init__(self) -> None:
+        super().__init__(VDBSettings(-1))
+        self.written_entity_data: list[list[EntityData]] = []
+
+    @override
+    def write_entities(self, entity_data: Sequence[EntityData]) -> None:
+        self.written_entity_data.append(list(entity_data))
+        super().write_entities(entity_data)
+
+
+@pytest.fixture(name="product")
+def product_fixture() -> SchemaObject:
+    return Product()
+
+
+@pytest.fixture(name="vdb")
+def vdb_fixture() -> RecordingInMemoryVDB:
+    return RecordingInMemoryVDB()
+
+
+@pytest.fixture(name="storage_manager")
+def storage_manager_fixture(vdb: RecordingInMemoryVDB) -> StorageManager:
+    return StorageManager(vdb)
+
+
+def test_writes_are_merged_per_entity_and_match_unbuffered_writes(product: SchemaObject) -> None:
+    buffered_vdb, unbuffered_vdb = RecordingInMemoryVDB(), RecordingInMemoryVDB()
+    buffered_storage_manager, unbuffered_storage_manager = StorageManager(buffered_vdb), StorageManager(unbuffered_vdb)
+
+    with buffered_storage_manager.buffer_writes():
+        for storage_manager in [buffered_storage_manager, unbuffered_storage_manager]:
+            storage_manager.write_node_result(product, "1", "a", 1.0)
+            storage_manager.write_node_result(product, "1", "b", 2.0)
+            storage_manager.write_node_result(product, "2", "a", 3.0)
+            storage_manager.write_node_result(product, "1", "a", 4.0)
+        assert not buffered_vdb.written_entity_data
+
+    assert len(buffered_vdb.written_entity_data) == 1
+    assert len(buffered_vdb.written_entity_data[0]) == 2
+    assert len(unbuffered_vdb.written_entity_data) == 4
+    for object_id in ["1", "2"]:
+        for node_id in ["a", "b"]:
+            assert buffered_storage_manager.read_node_result(product, object_id, node_id, float) == (
+                unbuffered_storage_manager.read_node_result(product, object_id, node_id, float)
+            )
+    metrics = buffered_storage_manager.write_buffer_metrics
+    assert (metrics.write_count, metrics.flushed_entity_count, metrics.flush_count) == (4, 2, 1)
+
+
+def test_reads_within_the_block_see_buffered_writes(
+    storage_manager: StorageManager, vdb: RecordingInMemoryVDB, product: SchemaObject
+) -> None:
+    storage_manager.write_node_result(product, "1", "a", 1.0)
+    storage_manager.write_node_result(product, "1", "b", 2.0)
+
+    with storage_manager.buffer_writes():
+        storage_manager.write_node_result(product, "1", "a", 3.0)
+        assert storage_manager.read_node_result(product, "1", "a", float) == 3.0
+        assert storage_manager.read_node_result(product, "1", "b", float) == 2.0
+        assert storage_manager.read_node_results_batch(product, ["1", "2"], "a", float) == {"1": 3.0, "2": None}
+
+    assert storage_manager.read_node_result(product, "1", "a", float) == 3.0
+    assert len(vdb.written_entity_data) == 3
+
+
+def test_nested_blocks_are_written_by_the_outermost_one(
+    storage_manager: StorageManager, vdb: RecordingInMemoryVDB, product: SchemaObject
+) -> None:
+    with storage_manager.buffer_writes():
+        with storage_manager.buffer_writes():
+            storage_manager.write_node_result(product, "1", "a", 1.0)
+        assert not vdb.written_entity_data
+        storage_manager.write_node_result(product, "1", "b", 2.0)
+
+    assert len(vdb.written_entity_data) == 1
+
+
+def test_buffers_are_separate_per_storage_manager(
+    storage_manager: StorageManager, vdb: RecordingInMemoryVDB, product: SchemaObject
+) -> None:
+    other_vdb = RecordingInMemoryVDB()
+    other_storage_manager = StorageManager(other_vdb)
+
+    with storage_manager.buffer_writes():
+        other_storage_manager.write_node_result(product, "1", "a", 1.0)
+        assert len(other_vdb.written_entity_data) == 1
+        storage_manager.write_node_result(product, "1", "a", 1.0)
+
+    assert len(vdb.written_entity_data) == 1
+
+
+def test_threads_started_with_the_context_share_the_buffer(
+    storage_manager: StorageManager, vdb: RecordingInMemoryVDB, product: SchemaObject
+) -> None:
+    with storage_manager.buffer_writes():
+        thread = Thread(target=copy_context().run, args=(storage_manager.write_node_result, product, "1", "a", 1.0))
+        thread.start()
+        thread.join()
+        storage_manager.write_node_result(product, "1", "b", 2.0)
+        assert not vdb.written_entity_data
+
+    assert len(vdb.written_entity_data) == 1
+    assert storage_manager.read_node_result(product, "1", "a", float) == 1.0
+
+
+def test_writes_are_flushed_when_the_block_raises(
+    storage_manager: StorageManager, vdb: RecordingInMemoryVDB, product: SchemaObject
+) -> None:
+    with pytest.raises(ValueError), storage_manager.buffer_writes():
+        storage_manager.write_node_result(product, "1", "a", 1.0)
+        raise ValueError()
+
+    assert len(vdb.written_entity_data) == 1
+    assert storage_manager.read_node_result(product, "1", "a", float) == 1.0
@@ -0,0 +1,76 @@
+# Copyright 2024 Superlinked, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import random
+
+import pytest
+
+from superlinked.framework.common.util.chunking_util import Chunker
+
+
+@pytest.mark.parametrize(
+    ("text", "chunk_size", "chunk_overlap", "split_chars_keep", "split_chars_remove", "expected_chunks"),
+    [
+        (
+            "The quick brown fox. Jumps over the lazy dog! Does it? Yes.",
+            20,
+            5,
+            None,
+            None,
+            ["The quick brown", "fox.Jumps over", "the lazy dog!", "dog! Does it? Yes."],
+        ),
+        (
+            "first paragraph\n\nsecond paragraph that is a bit longer\nthird line",
+            25,
+            0,
+            None,
+            None,
+            ["first paragraph", "second paragraph that", "is a bit longer", "third line"],
+        ),
+        ("a,b;c,d;e,f;g,h", 4, 1, [";"], [","], ["a,b", "c,d", "e,f", "g,h"]),
+        ("word " * 9, 30, 10, None, None, ["word word word word word", "word word word word word"]),
+        ("", 10, 2, None, None, []),
+    ],
+)
+def test_chunk_text(
+    text: str,
+    chunk_size: int,
+    chunk_overlap: int,
+    split_chars_keep: list[str] | None,
+    split_chars_remove: list[str] | None,
+    expected_chunks: list[str],
+) -> None:
+    chunks = Chunker().chunk_text(text, chunk_size, chunk_overlap, split_chars_keep, split_chars_remove)
+
+    assert chunks == expected_chunks
+
+
+def test_chunk_texts_matches_chunk_text() -> None:
+    rnd = random.Random(0)
+    alphabet = list("abcdefgh") * 6 + [" "] * 8 + [".", "!", "?", "\n", "\t", ","]
+    texts = ["".join(rnd.choice(alphabet) for _ in range(rnd.randint(0, 400))) for _ in range(50)]
+    texts += texts[:5] + [""]
+    chunker = Chunker()
+
+    for chunk_size, chunk_overlap in [(50, 0), (100, 20), (200, 40)]:
+        assert chunker.chunk_texts(texts, chunk_size, chunk_overlap) == [
+            chunker.chunk_text(text, chunk_size, chunk_overlap) for text in texts
+        ]
+
+
+def test_chunk_texts_returns_independent_lists_for_repeated_texts() -> None:
+    chunks = Chunker().chunk_texts(["a b. c d.", "a b. c d."], 5, 0)
+    chunks[0].append("x")
+
+    assert chunks[1] == ["a b.", "c d."]
@@ -0,0 +1,132 @@
+# Copyright 2024 Superlinked, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import pytest
+from beartype.typing import Any
+
+import superlinked.framework as sl
+from superlinked.framework.dsl.query.query_descriptor import QueryDescriptor
+from superlinked.framework.dsl.space.space import Space
+
+OBJECT_COUNT = 300
+CATEGORIES = ["a", "b", "c"]
+
+
+@sl.schema
+class Product:
+    id: sl.IdField
+    price: sl.Float
+    rating: sl.Integer
+    category: sl.String
+
+
+@pytest.fixture(name="rng")
+def rng_fixture() -> np.random.Generator:
+    return np.random.default_rng(0)
+
+
+@pytest.fixture(name="product")
+def product_fixture() -> Product:
+    return Product()
+
+
+@pytest.fixture(name="spaces")
+def spaces_fixture(product: Product) -> tuple[sl.NumberSpace, sl.NumberSpace, sl.CategoricalSimilaritySpace]:
+    return (
+        sl.NumberSpace(product.price, min_value=0, max_value=100, mode=sl.Mode.MAXIMUM),
+        sl.NumberSpace(product.rating, min_value=0, max_value=5, mode=sl.Mode.MAXIMUM),
+        sl.CategoricalSimilaritySpace(product.category, categories=CATEGORIES),
+    )
+
+
+@pytest.fixture(name="index")
+def index_fixture(product: Product, spaces: tuple[Space, ...]) -> sl.Index:
+    return sl.Index(list(spaces), fields=[product.price, product.rating, product.category])
+
+
+@pytest.fixture(name="app")
+def app_fixture(product: Product, index: sl.Index, rng: np.random.Generator) -> sl.InMemoryApp:
+    source: sl.InMemorySource = sl.InMemorySource(product)
+    app = sl.InMemoryExecutor(sources=[source], indices=[index]).run()
+    source.put(
+        [
+            {
+                "id": str(i),
+                "price": float(rng.uniform(0, 100)),
+                "rating": int(rng.integers(0, 6)),
+                "category": CATEGORIES[i % len(CATEGORIES)],
+            }
+            for i in range(OBJECT_COUNT)
+        ]
+    )
+    return app
+
+
+@pytest.fixture(name="query")
+def query_fixture(product: Product, index: sl.Index, spaces: tuple[Space, ...]) -> QueryDescriptor:
+    price_space, rating_space, category_space = spaces
+    return (
+        sl.Query(
+            index,
+            weights={
+                price_space: sl.Param("price_weight"),
+                rating_space: sl.Param("rating_weight"),
+                category_space: sl.Param("category_weight"),
+            },
+        )
+        .find(product)
+        .similar(category_space, sl.Param("category"))
+        .filter(product.price > sl.Param("min_price"))
+        .limit(sl.Param("limit"))
+    )
+
+
+def create_params(rng: np.random.Generator, count: int) -> list[dict[str, Any]]:
+    return [
+        {
+            "price_weight": float(rng.uniform()),
+            "rating_weight": float(rng.uniform()),
+            "category_weight": 1.0,
+            "category": CATEGORIES[i % len(CATEGORIES)],
+            "min_price": float(rng.uniform(0, 90)),
+            "limit": int(rng.integers(1, 20)),
+        }
+        for i in range(count)
+    ]
+
+
+def test_query_batch_matches_query(app: sl.InMemoryApp, query: QueryDescriptor, rng: np.random.Generator) -> None:
+    params_list = create_params(rng, 30)
+
+    batch_results = app.query_batch(query, params_list)
+
+    assert len(batch_results) == len(params_list)
+    assert all(batch_result.entries for batch_result in batch_results)
+    for params, batch_result in zip(params_list, batch_results):
+        single_result = app.query(query, **params)
+        assert [entry.entity.header.object_id for entry in batch_result.entries] == [
+            entry.entity.header.object_id for entry in single_result.entries
+        ]
+        assert np.allclose(
+            [entry.entity.score for entry in batch_result.entries],
+            [entry.entity.score for entry in single_result.entries],
+        )
+        assert [entry.stored_object for entry in batch_result.entries] == [
+            entry.stored_object for entry in single_result.entries
+        ]
+
+
+def test_query_batch_without_params(app: sl.InMemoryApp, query: QueryDescriptor) -> None:
+    assert not app.query_batch(query, [])
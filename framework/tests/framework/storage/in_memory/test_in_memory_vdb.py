@@ -0,0 +1,265 @@
+# Copyright 2024 Superlinked, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+from beartype.typing import Sequence
+
+from superlinked.framework.common.calculation.distance_metric import DistanceMetric
+from superlinked.framework.common.data_types import Vector
+from superlinked.framework.common.interface.comparison_operand import (
+    ComparisonOperation,
+)
+from superlinked.framework.common.storage.entity.entity import Entity
+from superlinked.framework.common.storage.entity.entity_data import EntityData
+from superlinked.framework.common.storage.entity.entity_id import EntityId
+from superlinked.framework.common.storage.field.field import Field
+from superlinked.framework.common.storage.field.field_data import (
+    FieldData,
+    VectorFieldData,
+)
+from superlinked.framework.common.storage.field.field_data_type import FieldDataType
+from superlinked.framework.common.storage.index_config import IndexConfig
+from superlinked.framework.common.storage.query.vdb_knn_search_params import (
+    VDBKNNSearchParams,
+)
+from superlinked.framework.common.storage.search_index.index_field_descriptor import (
+    IndexFieldDescriptor,
+    VectorIndexFieldDescriptor,
+)
+from superlinked.framework.common.storage.search_index.search_algorithm import (
+    SearchAlgorithm,
+)
+from superlinked.framework.storage.common.vdb_settings import VDBSettings
+from superlinked.framework.storage.in_memory.exception import VectorFieldTypeException
+from superlinked.framework.storage.in_memory.in_memory_vdb import InMemoryVDB
+from superlinked.framework.storage.in_memory.ivf_params import IVFParams
+from superlinked.framework.storage.in_memory.local_file_object_serializer import (
+    LocalFileObjectSerializer,
+)
+from superlinked.framework.storage.in_memory.quantization_params import (
+    QuantizationParams,
+)
+from superlinked.framework.storage.in_memory.vector_quantization import (
+    VectorQuantization,
+)
+
+INDEX_NAME = "index"
+SCHEMA_NAME = "schema"
+VECTOR_FIELD = Field(FieldDataType.VECTOR, "vector")
+CATEGORY_FIELD = Field(FieldDataType.INT, "category")
+DIMENSION = 16
+ROW_COUNT = 2000
+LIMIT = 10
+
+
+class JsonLocalFileObjectSerializer(LocalFileObjectSerializer):
+    @property
+    def supports_binary(self) -> bool:
+        return False
+
+
+def generate_vectors(count: int, rng: np.random.Generator) -> np.ndarray:
+    centers = rng.normal(size=(20, DIMENSION))
+    vectors = centers[rng.integers(0, centers.shape[0], count)] + 0.5 * rng.normal(size=(count, DIMENSION))
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def create_vdb(
+    vectors: np.ndarray,
+    search_algorithm: SearchAlgorithm = SearchAlgorithm.FLAT,
+    ivf_params: IVFParams | None = None,
+    quantization_params: QuantizationParams | None = None,
+) -> InMemoryVDB:
+    vdb = InMemoryVDB(VDBSettings(-1), search_algorithm, ivf_params, quantization_params)
+    init_index(vdb, search_algorithm)
+    vdb.write_entities(
+        [
+            EntityData(
+                EntityId(SCHEMA_NAME, str(i)),
+                {
+                    VECTOR_FIELD.name: VectorFieldData(VECTOR_FIELD.name, Vector(vector)),
+                    CATEGORY_FIELD.name: FieldData.from_field(CATEGORY_FIELD, i % 5),
+                },
+            )
+            for i, vector in enumerate(vectors)
+        ]
+    )
+    return vdb
+
+
+def init_index(vdb: InMemoryVDB, search_algorithm: SearchAlgorithm = SearchAlgorithm.FLAT) -> None:
+    vector_descriptor = VectorIndexFieldDescriptor(
+        VECTOR_FIELD.name, DIMENSION, DistanceMetric.INNER_PRODUCT, search_algorithm, vdb.vector_coordinate_type
+    )
+    category_descriptor = IndexFieldDescriptor(CATEGORY_FIELD.data_type, CATEGORY_FIELD.name)
+    vdb.init_search_index_configs(
+        [IndexConfig(INDEX_NAME, vector_descriptor, [category_descriptor])], create_search_indices=True
+    )
+
+
+def create_search_params(
+    query: np.ndarray, filters: Sequence[ComparisonOperation[Field]] | None = None, limit: int = LIMIT
+) -> VDBKNNSearchParams:
+    return VDBKNNSearchParams(VectorFieldData(VECTOR_FIELD.name, Vector(query)), limit, filters, None)
+
+
+def search(vdb: InMemoryVDB, search_params: VDBKNNSearchParams) -> list[tuple[str, float]]:
+    return [
+        (result.id_.object_id, result.score)
+        for result in vdb.knn_search(INDEX_NAME, SCHEMA_NAME, [CATEGORY_FIELD], search_params)
+    ]
+
+
+def calculate_recall(vdb: InMemoryVDB, exact_vdb: InMemoryVDB, queries: np.ndarray) -> float:
+    found_count = 0
+    for query in queries:
+        exact_ids = {object_id for object_id, _ in search(exact_vdb, create_search_params(query))}
+        found_count += len(exact_ids & {object_id for object_id, _ in search(vdb, create_search_params(query))})
+    return found_count / (len(queries) * LIMIT)
+
+
+@pytest.fixture(name="rng")
+def rng_fixture() -> np.random.Generator:
+    return np.random.default_rng(0)
+
+
+@pytest.fixture(name="vectors")
+def vectors_fixture(rng: np.random.Generator) -> np.ndarray:
+    return generate_vectors(ROW_COUNT, rng)
+
+
+@pytest.fixture(name="queries")
+def queries_fixture(rng: np.random.Generator) -> np.ndarray:
+    return generate_vectors(50, rng)
+
+
+def test_knn_search_batch_matches_knn_search(vectors: np.ndarray, queries: np.ndarray) -> None:
+    vdb = create_vdb(vectors)
+    search_params_list = [
+        create_search_params(query, [CATEGORY_FIELD == i % 5] if i % 2 else None, limit=i % 7 + 1)
+        for i, query in enumerate(queries)
+    ]
+
+    batch_results = vdb.knn_search_batch(INDEX_NAME, SCHEMA_NAME, [CATEGORY_FIELD], search_params_list)
+
+    assert len(batch_results) == len(search_params_list)
+    for search_params, batch_result in zip(search_params_list, batch_results):
+        single_result = search(vdb, search_params)
+        assert [result.id_.object_id for result in batch_result] == [object_id for object_id, _ in single_result]
+        assert np.allclose([result.score for result in batch_result], [score for _, score in single_result])
+        assert [result.field_data[CATEGORY_FIELD.name].value for result in batch_result] == [
+            int(object_id) % 5 for object_id, _ in single_result
+        ]
+
+
+def test_knn_search_batch_with_no_searches(vectors: np.ndarray) -> None:
+    assert not create_vdb(vectors).knn_search_batch(INDEX_NAME, SCHEMA_NAME, [], [])
+
+
+def test_ivf_recall(vectors: np.ndarray, queries: np.ndarray) -> None:
+    exact_vdb = create_vdb(vectors)
+    ivf_vdb = create_vdb(
+        vectors, SearchAlgorithm.IVF_FLAT, IVFParams(probe_count=8, training_threshold=500, exact_search_threshold=0)
+    )
+
+    assert calculate_recall(ivf_vdb, exact_vdb, queries) >= 0.9
+
+
+def test_ivf_keeps_filtered_results_complete(vectors: np.ndarray, queries: np.ndarray) -> None:
+    exact_vdb = create_vdb(vectors)
+    ivf_vdb = create_vdb(
+        vectors, SearchAlgorithm.IVF_FLAT, IVFParams(probe_count=1, training_threshold=500, exact_search_threshold=0)
+    )
+    search_params = create_search_params(queries[0], [CATEGORY_FIELD == 3])
+
+    assert len(search(ivf_vdb, search_params)) == len(search(exact_vdb, search_params)) == LIMIT
+
+
+@pytest.mark.parametrize(
+    ("quantization", "rescoring_factor", "min_recall"),
+    [
+        (VectorQuantization.FLOAT16, 0, 0.99),
+        (VectorQuantization.INT8, 0, 0.95),
+        (VectorQuantization.INT8, 4, 1.0),
+    ],
+)
+def test_quantized_recall(
+    vectors: np.ndarray,
+    queries: np.ndarray,
+    quantization: VectorQuantization,
+    rescoring_factor: float,
+    min_recall: float,
+) -> None:
+    exact_vdb = create_vdb(vectors)
+    quantized_vdb = create_vdb(vectors, quantization_params=QuantizationParams(quantization, rescoring_factor))
+
+    assert calculate_recall(quantized_vdb, exact_vdb, queries) >= min_recall
+
+
+def test_quantized_read_returns_written_vectors(vectors: np.ndarray) -> None:
+    vdb = create_vdb(vectors, quantization_params=QuantizationParams(VectorQuantization.INT8, 4))
+    entities = [Entity(EntityId(SCHEMA_NAME, str(i)), {VECTOR_FIELD.name: VECTOR_FIELD}) for i in range(10)]
+
+    read_vectors = [entity_data.field_data[VECTOR_FIELD.name].value for entity_data in vdb.read_entities(entities)]
+
+    assert np.allclose([vector.value for vector in read_vectors], vectors[:10])
+
+
+def test_write_of_non_vector_to_vector_field_raises(vectors: np.ndarray) -> None:
+    vdb = create_vdb(vectors[:10])
+    field_data = FieldData(FieldDataType.STRING, VECTOR_FIELD.name, "a")
+
+    with pytest.raises(VectorFieldTypeException):
+        vdb.write_entities([EntityData(EntityId(SCHEMA_NAME, "0"), {VECTOR_FIELD.name: field_data})])
+
+
+@pytest.mark.parametrize("serializer_type", [LocalFileObjectSerializer, JsonLocalFileObjectSerializer])
+@pytest.mark.parametrize(
+    "quantization_params", [None, QuantizationParams(VectorQuantization.INT8, 4)], ids=["exact", "int8"]
+)
+def test_persist_restore_round_trip(
+    tmp_path: Path,
+    vectors: np.ndarray,
+    queries: np.ndarray,
+    serializer_type: type[LocalFileObjectSerializer],
+    quantization_params: QuantizationParams | None,
+) -> None:
+    vdb = create_vdb(vectors, quantization_params=quantization_params)
+    serializer = serializer_type(tmp_path)
+    vdb.persist(serializer)
+    restored_vdb = InMemoryVDB(VDBSettings(-1), quantization_params=quantization_params)
+    init_index(restored_vdb)
+
+    restored_vdb.restore(serializer)
+
+    entities = [
+        Entity(EntityId(SCHEMA_NAME, str(i)), {field.name: field for field in [VECTOR_FIELD, CATEGORY_FIELD]})
+        for i in range(0, ROW_COUNT, 97)
+    ]
+    for entity_data, restored_entity_data in zip(vdb.read_entities(entities), restored_vdb.read_entities(entities)):
+        assert restored_entity_data.field_data[CATEGORY_FIELD.name].value == (
+            entity_data.field_data[CATEGORY_FIELD.name].value
+        )
+        assert np.allclose(
+            restored_entity_data.field_data[VECTOR_FIELD.name].value.value,
+            entity_data.field_data[VECTOR_FIELD.name].value.value,
+        )
+    for query in queries[:10]:
+        search_params = create_search_params(query, [CATEGORY_FIELD == 1])
+        restored_result, result = search(restored_vdb, search_params), search(vdb, search_params)
+        assert [object_id for object_id, _ in restored_result] == [object_id for object_id, _ in result]
+        assert np.allclose([score for _, score in restored_result], [score for _, score in result])